@@ -13,20 +13,15 @@ import time
 import requests
 import uvicorn
 import webview
-import yaml
 
 from api.app import app
+from services.settings_service import apply_env_vars
 from utils.logging import debug, error
 
 
 def load_environment():
     """Load environment variables from settings.yaml"""
-    if os.path.exists("settings.yaml"):
-        with open("settings.yaml", "r") as f:
-            settings = yaml.safe_load(f)
-            env_vars = settings.get("env_vars", {})
-            for key, value in env_vars.items():
-                os.environ[key] = value
+    apply_env_vars()
 
 
 # Load environment variables before starting the app
@@ -2,19 +2,22 @@
 FastAPI application for the Curator API.
 """
 
-import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import yaml
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from curator.topic_updater import start_update_processor
-from utils.logging import debug, error
+from curator.async_dispatcher import stop_dispatcher
+from curator.topic_updater import start_update_processor, stop_update_processor
+from services.settings_service import apply_env_vars, subscribe, unsubscribe
+from services.vault_watcher import start_vault_watcher, stop_vault_watcher
+from utils.logging import debug, error, info
 
+from .db.vault_loader import warm_up_vault
 from .routes.article_routes import router as article_router
+from .routes.cache_routes import router as cache_router
 from .routes.health import router as health_router
 from .routes.log_routes import router as log_router
 from .routes.project_routes import router as project_router
@@ -25,17 +28,28 @@ from .routes.topic_routes import router as topic_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle startup and shutdown events."""
-    # Load environment variables from settings.yaml
-    if os.path.exists("settings.yaml"):
-        with open("settings.yaml", "r") as f:
-            settings = yaml.safe_load(f)
-            env_vars = settings.get("env_vars", {})
-            debug("CONFIG", "Environment variables", f"Found {len(env_vars)} variables")
-            for key, value in env_vars.items():
-                os.environ[key] = value
+    # Load environment variables from settings.yaml and keep them in sync
+    env_count = apply_env_vars()
+    debug("CONFIG", "Environment variables", f"Found {env_count} variables")
+    subscribe(apply_env_vars)
 
     debug("SYSTEM", "Server starting", "SynthPub API")
 
+    # Load the vault caches in parallel before serving requests
+    try:
+        stats = warm_up_vault()
+        info(
+            "SYSTEM",
+            "Vault loaded",
+            f"{stats['files']} files, {stats['projects']} projects, "
+            f"{stats['topics']} topics in {stats['seconds']:.2f}s",
+        )
+    except Exception as e:
+        error("SYSTEM", "Failed to load vault", str(e))
+
+    # Keep the caches in sync with external edits to the vault if enabled
+    start_vault_watcher()
+
     # Start background processes
     start_update_processor()
 
@@ -48,21 +62,27 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         error("SYSTEM", "Failed to start news scheduler", str(e))
 
-    # Run log router's lifespan if it exists
-    if hasattr(log_router, "lifespan"):
-        async with log_router.lifespan(app):
-            yield
-    else:
-        yield
-
-    # Cleanup on shutdown
     try:
-        from news.news_scheduler import stop_scheduler_thread
-
-        stop_scheduler_thread()
-        debug("SYSTEM", "News scheduler stopped")
-    except Exception as e:
-        error("SYSTEM", "Error stopping news scheduler", str(e))
+        # Run log router's lifespan if it exists
+        if hasattr(log_router, "lifespan"):
+            async with log_router.lifespan(app):
+                yield
+        else:
+            yield
+    finally:
+        # Cleanup on shutdown, also if serving failed
+        unsubscribe(apply_env_vars)
+        stop_vault_watcher()
+        try:
+            from news.news_scheduler import stop_scheduler_thread
+
+            stop_scheduler_thread()
+            debug("SYSTEM", "News scheduler stopped")
+        except Exception as e:
+            error("SYSTEM", "Error stopping news scheduler", str(e))
+        # Stop the worker pools and the curation event loop thread
+        stop_update_processor()
+        stop_dispatcher()
 
 
 app = FastAPI(
@@ -79,6 +99,7 @@ app = FastAPI(
         {"name": "projects", "description": "Project management endpoints"},
         {"name": "settings", "description": "Application settings endpoints"},
         {"name": "logs", "description": "Log management and streaming endpoints"},
+        {"name": "cache", "description": "Feed cache statistics and maintenance"},
     ],
     lifespan=lifespan,
 )
@@ -102,6 +123,7 @@ api_router.include_router(health_router, tags=["health"])
 api_router.include_router(project_router, tags=["projects"])
 api_router.include_router(settings_router, tags=["settings"])
 api_router.include_router(log_router, tags=["logs"], prefix="/logs")
+api_router.include_router(cache_router, tags=["cache"])
 
 # Include the API router in the main app
 app.include_router(api_router)
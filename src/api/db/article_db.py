@@ -2,18 +2,21 @@
 Database operations for articles using hierarchical folder structure with markdown files.
 """
 
+import os
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
-from shutil import rmtree
-from typing import List, Optional, Tuple
+from shutil import copyfile, rmtree
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
 from ..models.article import Article
 from ..models.feed_item import FeedItem
 from ..models.topic import Representation
-from . import topic_db
+from . import topic_db, unit_of_work, version_manifest
 from .common import (
     add_to_entity_cache,
     ensure_path_exists,
@@ -21,8 +24,96 @@ from .common import (
     get_article_path,
     get_hierarchical_path,
     remove_from_entity_cache,
+    write_file_atomic,
 )
 
+# Maximum number of parsed articles kept in memory
+ARTICLE_CACHE_SIZE = 128
+
+# LRU cache of parsed articles: article_id -> (file signature, article)
+_article_cache: "OrderedDict[str, Tuple[Tuple[int, ...], Article]]" = OrderedDict()
+_article_cache_stats = {"hits": 0, "misses": 0}
+_article_cache_lock = threading.Lock()
+
+
+def _get_article_signature(article_path: Path) -> Optional[Tuple[int, ...]]:
+    """Get the mtimes and sizes of an article's files, or None if unavailable."""
+    try:
+        metadata_stat = os.stat(article_path / "metadata.yaml")
+        content_stat = os.stat(article_path / "article.md")
+    except OSError:
+        return None
+    return (
+        metadata_stat.st_mtime_ns,
+        metadata_stat.st_size,
+        content_stat.st_mtime_ns,
+        content_stat.st_size,
+    )
+
+
+def _copy_article(article: Article) -> Article:
+    """
+    Copy an article so callers can modify it without touching the cache.
+
+    Representations are copied too, so loading their content on a copy does
+    not load it into the cached article.
+    """
+    article_copy = article.model_copy()
+    article_copy.representations = [rep.model_copy() for rep in article.representations]
+    return article_copy
+
+
+def _cache_article(article_path: Path, article: Article) -> None:
+    """
+    Store an article in the LRU cache keyed by its current file signature.
+
+    Articles holding representation content in memory are not cached, so
+    cached articles never keep e.g. audio data resident; the next load reads
+    their representations lazily instead.
+    """
+    signature = _get_article_signature(article_path)
+    if signature is None or any(
+        rep.content_path is None for rep in article.representations
+    ):
+        evict_cached_article(article.id)
+        return
+    article_copy = _copy_article(article)
+    with _article_cache_lock:
+        _article_cache[article.id] = (signature, article_copy)
+        _article_cache.move_to_end(article.id)
+        while len(_article_cache) > ARTICLE_CACHE_SIZE:
+            _article_cache.popitem(last=False)
+
+
+def _get_cached_article(article_id: str, article_path: Path) -> Optional[Article]:
+    """Return a cached article if its files did not change since it was cached."""
+    with _article_cache_lock:
+        cached = _article_cache.get(article_id)
+    if cached is None or cached[0] != _get_article_signature(article_path):
+        return None
+    with _article_cache_lock:
+        if article_id in _article_cache:
+            _article_cache.move_to_end(article_id)
+    return _copy_article(cached[1])
+
+
+def get_article_cache_stats() -> Dict[str, int]:
+    """Get hit/miss counters and the current size of the article cache."""
+    with _article_cache_lock:
+        return {**_article_cache_stats, "size": len(_article_cache)}
+
+
+def clear_article_cache() -> None:
+    """Drop all cached articles."""
+    with _article_cache_lock:
+        _article_cache.clear()
+
+
+def evict_cached_article(article_id: str) -> None:
+    """Drop a single article from the cache."""
+    with _article_cache_lock:
+        _article_cache.pop(article_id, None)
+
 
 def get_article_location(
     article_id: str,
@@ -92,19 +183,16 @@ def article_to_files(article: Article, article_path: Path) -> None:
         # Write representation content to separate file
         rep_file = representations_dir / rep_metadata["filename"]
 
-        # Check if content is binary (bytes or hex string with binary flag)
-        is_binary = isinstance(rep.content, bytes) or (
-            rep.metadata and rep.metadata.get("binary") is True
-        )
+        # Content that was never loaded is copied file to file
+        if rep.content_path is not None:
+            if rep.content_path != rep_file:
+                copyfile(rep.content_path, rep_file)
+            continue
 
-        if is_binary:
-            # Handle binary content
+        if rep.is_binary:
+            # Handle binary content, legacy hex strings are decoded
             with open(rep_file, "wb") as f:
-                if isinstance(rep.content, bytes):
-                    f.write(rep.content)
-                else:
-                    # Convert hex string to bytes
-                    f.write(bytes.fromhex(rep.content))
+                f.write(rep.get_bytes())
                 f.flush()
         else:
             # Handle text content
@@ -112,17 +200,13 @@ def article_to_files(article: Article, article_path: Path) -> None:
                 f.write(rep.content)
                 f.flush()
 
-    # Write metadata to file
-    metadata_file = article_path / "metadata.yaml"
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        yaml.dump(metadata, f, sort_keys=False)
-        f.flush()
+    # Write content file before the metadata that makes the article visible
+    write_file_atomic(article_path / "article.md", article.content)
 
-    # Write content file
-    content_file = article_path / "article.md"
-    with open(content_file, "w", encoding="utf-8") as f:
-        f.write(article.content)
-        f.flush()
+    # Write metadata to file
+    write_file_atomic(
+        article_path / "metadata.yaml", yaml.dump(metadata, sort_keys=False)
+    )
 
 
 def files_to_article(metadata_path: Path) -> Article:
@@ -149,7 +233,7 @@ def files_to_article(metadata_path: Path) -> Article:
             feed_data["accessed_at"] = datetime.fromisoformat(feed_data["accessed_at"])
         metadata["source_feed"] = FeedItem(**feed_data)
 
-    # Load representations
+    # Load representations lazily, their content is read on first access
     representations = []
     if "representations" in metadata:
         representations_dir = metadata_path.parent / "representations"
@@ -160,18 +244,10 @@ def files_to_article(metadata_path: Path) -> Article:
                 # Check if this is a binary representation type
                 is_binary = rep_meta.get("metadata", {}).get("binary", False)
 
-                if is_binary:
-                    # Read as binary
-                    with open(rep_path, "rb") as f:
-                        rep_content = f.read().hex()
-                else:
-                    # Read as text
-                    with open(rep_path, "r", encoding="utf-8") as f:
-                        rep_content = f.read()
-
-                rep = Representation(
+                rep = Representation.from_file(
+                    rep_path,
+                    binary=is_binary,
                     type=rep_meta["type"],
-                    content=rep_content,
                     created_at=datetime.fromisoformat(rep_meta["created_at"]),
                     metadata=rep_meta["metadata"],
                 )
@@ -188,7 +264,18 @@ def files_to_article(metadata_path: Path) -> Article:
 
 
 def save_article(article: Article) -> None:
-    """Save article to files in hierarchical structure."""
+    """
+    Save article to files in hierarchical structure.
+
+    Inside a write session the write is deferred until the session flushes.
+    """
+    if unit_of_work.defer_save("article", article, _write_article):
+        return
+    _write_article(article)
+
+
+def _write_article(article: Article) -> None:
+    """Write an article to disk and update the caches."""
     # Get the topic
     topic = topic_db.get_topic(article.topic_id)
     if not topic:
@@ -214,8 +301,10 @@ def save_article(article: Article) -> None:
     if not metadata_file.exists() or not content_file.exists():
         raise ValueError(f"Failed to save article to {article_path}")
 
-    # Update entity cache
+    # Update entity and article caches and the topic's version manifest
     add_to_entity_cache(article.id, article_path, "article")
+    _cache_article(article_path, article)
+    version_manifest.record_versions(article_path.parent, [article])
 
     # Update topic to reference this article if not already set
     if not topic.article:
@@ -225,6 +314,11 @@ def save_article(article: Article) -> None:
 
 def get_article(article_id: str) -> Optional[Article]:
     """Retrieve article by id."""
+    # Articles saved in the current write session are not on disk yet
+    pending_article = unit_of_work.get_pending("article", article_id)
+    if pending_article is not None:
+        return _copy_article(pending_article)
+
     # Use find_entity_by_id to locate the article
     article_path, entity_type = find_entity_by_id(article_id)
 
@@ -235,7 +329,15 @@ def get_article(article_id: str) -> Optional[Article]:
     if not metadata_file.exists():
         return None
 
-    return files_to_article(metadata_file)
+    cached_article = _get_cached_article(article_id, article_path)
+    with _article_cache_lock:
+        _article_cache_stats["hits" if cached_article else "misses"] += 1
+    if cached_article is not None:
+        return cached_article
+
+    article = files_to_article(metadata_file)
+    _cache_article(article_path, article)
+    return article
 
 
 def get_article_by_slug(
@@ -343,11 +445,8 @@ def update_article(
     return new_article
 
 
-def get_article_history(article_id: str) -> List[Article]:
-    """
-    Get the complete version history of an article.
-    Returns list ordered from oldest to newest.
-    """
+def _walk_article_history(article_id: str) -> List[Article]:
+    """Collect the versions of an article by following the version links."""
     articles = []
     current = get_article(article_id)
 
@@ -374,8 +473,68 @@ def get_article_history(article_id: str) -> List[Article]:
     return articles
 
 
+def _get_version_chain(article_id: str) -> Optional[List[Dict]]:
+    """
+    Get the manifest entries of an article's versions, oldest first.
+
+    Returns None if the article is unknown or the manifest does not cover its
+    full history, e.g. for versions saved before manifests were introduced.
+    If the history can be walked instead, the manifest is backfilled.
+    """
+    article_path, entity_type = find_entity_by_id(article_id)
+    if not article_path or entity_type != "article":
+        return None
+
+    topic_path = article_path.parent
+    entries = version_manifest.load_manifest(topic_path)
+    chain = version_manifest.get_version_chain(entries or [], article_id)
+    if chain is not None:
+        previous_id = chain[0].get("previous_version")
+        if not previous_id or find_entity_by_id(previous_id)[0] is None:
+            return chain
+
+    # Older versions are missing from the manifest, walk the links once
+    history = _walk_article_history(article_id)
+    if not history:
+        return None
+    version_manifest.record_versions(topic_path, history)
+    return [version_manifest.manifest_entry(article) for article in history]
+
+
+def get_version_history(article_id: str) -> List[Dict]:
+    """
+    Get the ids, version numbers, timestamps and source feed URLs of all
+    versions of an article without loading them, ordered oldest to newest.
+    """
+    return _get_version_chain(article_id) or []
+
+
+def get_version_count(article_id: str) -> int:
+    """Get the number of versions of an article."""
+    return len(get_version_history(article_id))
+
+
+def get_article_history(article_id: str) -> List[Article]:
+    """
+    Get the complete version history of an article.
+    Returns list ordered from oldest to newest.
+    """
+    chain = _get_version_chain(article_id)
+    if chain is None:
+        return _walk_article_history(article_id)
+
+    articles = [get_article(entry["id"]) for entry in chain]
+    return [article for article in articles if article]
+
+
 def get_latest_version(article_id: str) -> Optional[Article]:
     """Get the most recent version of an article."""
+    chain = _get_version_chain(article_id)
+    if chain:
+        latest = get_article(chain[-1]["id"])
+        if latest:
+            return latest
+
     current = get_article(article_id)
     if not current:
         return None
@@ -400,12 +559,14 @@ def mark_article_deleted(article_id: str) -> bool:
     if not article_path or entity_type != "article":
         return False
 
-    # Remove the directory
+    # Remove the directory and its version manifest entry
     if article_path.exists():
         rmtree(article_path)
+    version_manifest.remove_version(article_path.parent, article_id)
 
-    # Remove from entity cache
+    # Remove from entity and article caches
     remove_from_entity_cache(article_id)
+    evict_cached_article(article_id)
 
     # Also delete any old versions
     article = get_article(article_id)
@@ -0,0 +1,128 @@
+"""
+Content-addressed store for texts shared between feed cache entries.
+
+Item texts are stored once under blobs/ in the cache directory, named by the
+SHA-256 of the text (the same hash as FeedItem.content_hash) and the codec
+they are compressed with. Cache payloads reference blobs by id instead of
+embedding the text, so a page fetched for several topics or syndicated under
+several URLs is stored once. Reference counts are kept by the cache manager.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from . import cache_codec
+
+BLOB_DIR = "blobs"
+
+# Texts shorter than this stay embedded in the payload
+MIN_BLOB_SIZE = 1024
+
+# Number of recently read texts kept so repeated reads share one string
+RECENT_BLOBS = 256
+
+_recent_blobs: "OrderedDict[str, str]" = OrderedDict()
+_recent_lock = threading.Lock()
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest identifying a text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def get_blob_dir(cache_path: Path) -> Path:
+    """Return the blob directory of a cache directory."""
+    return cache_path / BLOB_DIR
+
+
+def get_blob_path(cache_path: Path, blob_id: str) -> Path:
+    """Return the path of a blob, sharded by the first hash characters."""
+    return get_blob_dir(cache_path) / blob_id[:2] / blob_id
+
+
+def store_text(
+    cache_path: Path, text: str, codec: cache_codec.Codec, level: int
+) -> Tuple[str, int]:
+    """
+    Store a text unless an identical one is already stored.
+
+    Returns:
+        Tuple of (blob id, size of the blob file)
+    """
+    blob_id = f"{content_hash(text)}.{codec.name}"
+    path = get_blob_path(cache_path, blob_id)
+    try:
+        return blob_id, path.stat().st_size
+    except FileNotFoundError:
+        pass
+
+    data = cache_codec.encode(text.encode("utf-8"), codec, level)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    _remember(blob_id, text)
+    return blob_id, len(data)
+
+
+def read_text(cache_path: Path, blob_id: str) -> str:
+    """
+    Read a stored text.
+
+    Raises:
+        OSError: If the blob does not exist
+    """
+    with _recent_lock:
+        text = _recent_blobs.get(blob_id)
+        if text is not None:
+            _recent_blobs.move_to_end(blob_id)
+            return text
+
+    codec = cache_codec.CODECS[blob_id.rsplit(".", 1)[1]]
+    data = get_blob_path(cache_path, blob_id).read_bytes()
+    text = codec.decompress(data).decode("utf-8")
+    _remember(blob_id, text)
+    return text
+
+
+def _remember(blob_id: str, text: str) -> None:
+    """Keep a text among the recently used ones."""
+    with _recent_lock:
+        _recent_blobs[blob_id] = text
+        _recent_blobs.move_to_end(blob_id)
+        while len(_recent_blobs) > RECENT_BLOBS:
+            _recent_blobs.popitem(last=False)
+
+
+def delete_blob(cache_path: Path, blob_id: str) -> None:
+    """Delete a blob that is no longer referenced."""
+    with _recent_lock:
+        _recent_blobs.pop(blob_id, None)
+    get_blob_path(cache_path, blob_id).unlink(missing_ok=True)
+
+
+def collect_garbage(cache_path: Path, live_ids: Iterable[str]) -> int:
+    """
+    Delete blob files that are not referenced, e.g. after an interrupted write.
+
+    Returns:
+        Number of deleted files
+    """
+    live = set(live_ids)
+    removed = 0
+    for path in get_blob_dir(cache_path).glob("*/*"):
+        if path.name not in live:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def clear_blobs() -> None:
+    """Forget the recently read texts."""
+    with _recent_lock:
+        _recent_blobs.clear()
@@ -0,0 +1,86 @@
+"""
+Compression codecs for feed cache payloads.
+
+The codec of a payload is encoded in its file name suffix, so entries written
+with a different codec, or uncompressed entries from older versions, are
+decoded transparently. The codec used for new entries is configured in
+settings.yaml:
+
+    cache:
+      compression: gzip      # none, gzip, zlib, bz2 or lzma
+      compression_level: 6   # 1 (fastest) to 9 (smallest)
+"""
+
+import bz2
+import gzip
+import lzma
+import zlib
+from pathlib import Path
+from typing import Callable, NamedTuple, Tuple
+
+from services.settings_service import get_setting
+
+DEFAULT_CODEC = "gzip"
+DEFAULT_LEVEL = 6
+
+# Errors raised by the decompressors on corrupt data, besides OSError
+DECODE_ERRORS = (OSError, EOFError, ValueError, zlib.error, lzma.LZMAError)
+
+
+class Codec(NamedTuple):
+    """A payload compression format and the file suffix that identifies it."""
+
+    name: str
+    suffix: str
+    compress: Callable[[bytes, int], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+CODECS = {
+    "none": Codec("none", ".json", lambda data, level: data, lambda data: data),
+    "gzip": Codec(
+        "gzip",
+        ".json.gz",
+        lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+        gzip.decompress,
+    ),
+    "zlib": Codec("zlib", ".json.zz", zlib.compress, zlib.decompress),
+    "bz2": Codec("bz2", ".json.bz2", bz2.compress, bz2.decompress),
+    "lzma": Codec(
+        "lzma",
+        ".json.xz",
+        lambda data, level: lzma.compress(data, preset=level),
+        lzma.decompress,
+    ),
+}
+
+
+def load_settings() -> Tuple[Codec, int]:
+    """Load the codec and level for new cache entries from settings."""
+    settings = get_setting("cache") or {}
+    codec = CODECS.get(settings.get("compression", DEFAULT_CODEC))
+    if codec is None:
+        codec = CODECS[DEFAULT_CODEC]
+    try:
+        level = int(settings.get("compression_level", DEFAULT_LEVEL))
+    except (TypeError, ValueError):
+        level = DEFAULT_LEVEL
+    return codec, min(max(level, 1), 9)
+
+
+def codec_for_path(path: Path) -> Codec:
+    """Return the codec a payload file was written with, based on its suffix."""
+    for codec in sorted(CODECS.values(), key=lambda c: -len(c.suffix)):
+        if path.name.endswith(codec.suffix):
+            return codec
+    return CODECS["none"]
+
+
+def encode(data: bytes, codec: Codec, level: int) -> bytes:
+    """Compress a serialized payload."""
+    return codec.compress(data, level)
+
+
+def decode(path: Path, data: bytes) -> bytes:
+    """Decompress the contents of a payload file."""
+    return codec_for_path(path).decompress(data)
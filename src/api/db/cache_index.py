@@ -0,0 +1,115 @@
+"""
+Append-only index of the entries in the feed cache.
+
+The index lives in index.jsonl inside the cache directory and holds one JSON
+line per change: an entry record with the url, payload file name, size on
+disk, added_at, expires_at, uncompressed size, the connector that fetched it
+and the blobs it references, or a removal record for a url. The last record
+for a url wins on load, so the cache metadata can be rebuilt at startup
+without opening any payload file. The index is rewritten with one line per
+entry once it holds mostly superseded records.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+INDEX_FILE = "index.jsonl"
+
+# Compact once the index has this many lines and at least twice as many lines
+# as it holds entries
+COMPACT_MIN_LINES = 1024
+
+ENTRY_FIELDS = {"url", "path", "size", "added_at", "expires_at"}
+
+
+def get_index_path(cache_path: Path) -> Path:
+    """Return the path of the index file of a cache directory."""
+    return cache_path / INDEX_FILE
+
+
+def entry_record(
+    url: str,
+    filename: str,
+    size: int,
+    added_at: float,
+    expires_at: float,
+    raw_size: Optional[int] = None,
+    connector: Optional[str] = None,
+    blobs: Optional[Dict[str, int]] = None,
+) -> Dict:
+    """Build the index record describing a cached url."""
+    return {
+        "url": url,
+        "path": filename,
+        "size": size,
+        "added_at": added_at,
+        "expires_at": expires_at,
+        "raw_size": size if raw_size is None else raw_size,
+        "connector": connector,
+        "blobs": blobs or {},
+    }
+
+
+def removal_record(url: str) -> Dict:
+    """Build the index record marking a url as removed."""
+    return {"url": url, "removed": True}
+
+
+def read_index(cache_path: Path) -> Tuple[Dict[str, Dict], int]:
+    """
+    Read the latest record of every cached url.
+
+    Returns:
+        Tuple of (entry records by url, number of lines read)
+
+    Raises:
+        OSError: If the index file does not exist or cannot be read
+    """
+    entries: Dict[str, Dict] = {}
+    line_count = 0
+    with open(get_index_path(cache_path), "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                url = record["url"]
+                removed = record.get("removed", False)
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # Skip a line left incomplete by an interrupted write
+                continue
+            if not removed and not ENTRY_FIELDS <= record.keys():
+                continue
+            line_count += 1
+            if removed:
+                entries.pop(url, None)
+            else:
+                entries[url] = record
+    return entries, line_count
+
+
+def append_index(cache_path: Path, records: List[Dict]) -> None:
+    """Append records to the index of a cache directory."""
+    lines = "".join(
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for record in records
+    )
+    with open(get_index_path(cache_path), "a", encoding="utf-8") as f:
+        f.write(lines)
+        f.flush()
+
+
+def write_index(cache_path: Path, records: List[Dict]) -> None:
+    """Atomically replace the index of a cache directory with the given entries."""
+    index_file = get_index_path(cache_path)
+    tmp_file = index_file.with_name(index_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    os.replace(tmp_file, index_file)
+
+
+def needs_compaction(line_count: int, entry_count: int) -> bool:
+    """Check whether an index holds enough superseded records to be rewritten."""
+    return line_count >= COMPACT_MIN_LINES and line_count >= 2 * entry_count
@@ -2,25 +2,89 @@
 Cache manager for news feed items.
 
 Provides functions to store and retrieve feed items from a file-based cache.
+Each URL is stored in its own JSON file; the metadata of all entries is kept in
+an append-only index (see cache_index) so it can be loaded without reading the
+payload files, and entries are evicted oldest first through a heap. Payloads
+are compressed with the codec configured in settings (see cache_codec).
+
+Recently used payloads are also kept parsed in a byte-bounded in-memory LRU
+tier in front of the disk cache, so hot URLs are served without reading and
+parsing their file again. Returned payloads are shared and must be treated as
+read-only.
+
+Long item texts are moved to a content-addressed blob store (see blob_store)
+and referenced from the payloads, so identical content fetched under several
+URLs is stored once. Blobs are reference counted through the index and
+deleted when no entry uses them anymore.
+
+Expired entries are kept for MAX_STALE_SECONDS so connectors can revalidate
+them with a conditional request and fall back to them when a refresh fails.
+
+All public functions are thread safe. Payload files are read outside the lock,
+so lookups from API requests and pipeline workers do not wait on each other's
+disk reads.
 """
 
 import hashlib
+import heapq
 import json
+import shutil
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .common import get_db_path
+from . import blob_store, cache_codec, cache_index
+from .common import get_db_path, write_file_atomic
 
 # Cache configuration
 MAX_CACHE_SIZE_MB = 500  # 500MB cache limit
 CACHE_CLEANUP_THRESHOLD = 0.9  # Run cleanup when cache is 90% full
+MEMORY_CACHE_SIZE_MB = 64  # Limit for parsed payloads kept in memory
+MAX_STALE_SECONDS = 7 * 24 * 3600  # Keep expired entries for revalidation
 
-# In-memory tracking of cached items and their metadata
+# In-memory tracking of cached items and their metadata, keyed by URL
 _cache_metadata: Dict[str, Dict[str, Any]] = {}
 _cache_size_bytes = 0
+_cache_raw_bytes = 0  # Uncompressed size of the cached payloads
 _cache_initialized = False
 
+# Eviction queues of (added_at, url) and (expires_at, url). Entries are not
+# removed when a URL is re-added or deleted; stale ones are skipped on pop.
+_age_heap: List[Tuple[float, str]] = []
+_expiry_heap: List[Tuple[float, str]] = []
+
+# Blob id -> number of entries referencing it, and blob id -> size on disk
+_blob_refs: Dict[str, int] = {}
+_blob_sizes: Dict[str, int] = {}
+_blob_bytes = 0
+
+# Number of lines in the on-disk index, used to decide when to compact it
+_index_lines = 0
+
+# Memory tier: url -> (parsed payload, uncompressed size), least recent first
+_memory_cache: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+_memory_bytes = 0
+
+# Running counters since startup, in total and per connector class
+STAT_COUNTERS = (
+    "memory_hits",
+    "disk_hits",
+    "misses",
+    "expirations",
+    "evictions",
+    "revalidations",
+    "stale_reads",
+    "bytes_read",
+    "bytes_written",
+)
+_cache_stats = dict.fromkeys(STAT_COUNTERS, 0)
+_connector_stats: Dict[str, Dict[str, int]] = {}
+
+# Guards all of the state above; reentrant as public functions call each other
+_cache_lock = threading.RLock()
+
 
 def _sanitize_filename(url: str, max_length: int = 120) -> str:
     """
@@ -73,52 +137,158 @@ def _sanitize_filename(url: str, max_length: int = 120) -> str:
     return url
 
 
-def _get_cache_path(url: str) -> Path:
-    """Generate a human-readable cache path from a URL."""
+def _get_cache_path(url: str, codec: Optional[cache_codec.Codec] = None) -> Path:
+    """Generate a human-readable cache path from a URL and payload codec."""
     # Create a readable filename based on the URL
     base_filename = _sanitize_filename(url)
 
     # Add a short hash suffix to avoid potential collisions
     url_short_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
-    filename = f"{base_filename}_{url_short_hash}.json"
+    suffix = codec.suffix if codec else ".json"
+    filename = f"{base_filename}_{url_short_hash}{suffix}"
 
     return CACHE_PATH() / filename
 
 
+def _track(url: str, metadata: Dict[str, Any]) -> None:
+    """Store the metadata of a cached URL and queue it for eviction."""
+    _cache_metadata[url] = metadata
+    heapq.heappush(_age_heap, (metadata["added_at"], url))
+    if metadata["expires_at"] > 0:
+        heapq.heappush(_expiry_heap, (metadata["expires_at"], url))
+
+    # Drop stale queue entries once they outnumber the live ones
+    if len(_age_heap) > 2 * len(_cache_metadata) + 64:
+        _rebuild_heaps()
+
+
+def _rebuild_heaps() -> None:
+    """Rebuild the eviction queues from the current metadata."""
+    global _age_heap, _expiry_heap
+
+    _age_heap = [(m["added_at"], url) for url, m in _cache_metadata.items()]
+    _expiry_heap = [
+        (m["expires_at"], url)
+        for url, m in _cache_metadata.items()
+        if m["expires_at"] > 0
+    ]
+    heapq.heapify(_age_heap)
+    heapq.heapify(_expiry_heap)
+
+
+def _is_current(url: str, field: str, value: float) -> bool:
+    """Check whether a queue entry still matches the cached metadata."""
+    metadata = _cache_metadata.get(url)
+    return metadata is not None and metadata[field] == value
+
+
+def _count(counter: str, connector: Optional[str], amount: int = 1) -> None:
+    """Increase a statistics counter, in total and for a connector."""
+    _cache_stats[counter] += amount
+    if connector:
+        stats = _connector_stats.get(connector)
+        if stats is None:
+            stats = _connector_stats[connector] = dict.fromkeys(STAT_COUNTERS, 0)
+        stats[counter] += amount
+
+
+def _index_record(url: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the index record for a cached URL."""
+    return cache_index.entry_record(
+        url,
+        metadata["path"].name,
+        metadata["size"],
+        metadata["added_at"],
+        metadata["expires_at"],
+        metadata["raw_size"],
+        metadata.get("connector"),
+        metadata.get("blobs"),
+    )
+
+
+def _log_change(record: Dict[str, Any]) -> None:
+    """Append a change to the index, compacting it when mostly superseded."""
+    global _index_lines
+
+    cache_path = CACHE_PATH()
+    _index_lines += 1
+    if cache_index.needs_compaction(_index_lines, len(_cache_metadata)):
+        records = [_index_record(url, m) for url, m in _cache_metadata.items()]
+        cache_index.write_index(cache_path, records)
+        _index_lines = len(records)
+    else:
+        cache_index.append_index(cache_path, [record])
+
+
+def _migrate_cache_files(cache_path: Path) -> List[Dict[str, Any]]:
+    """
+    Build index records for cache files written before the index existed.
+
+    This is the only place payload files are read to recover their metadata,
+    whatever codec they were written with. Invalid files are removed, as are
+    older payloads of a URL also stored with another codec.
+    """
+    index_file = cache_index.get_index_path(cache_path)
+    migrated: Dict[str, Dict[str, Any]] = {}
+    for file_path in cache_path.glob("*.json*"):
+        if file_path == index_file:
+            continue
+        metadata = _process_cache_file(file_path)
+        if not metadata:
+            if file_path.is_file():
+                file_path.unlink(missing_ok=True)
+            continue
+        previous = migrated.get(metadata["url"])
+        if previous and previous["added_at"] > metadata["added_at"]:
+            file_path.unlink(missing_ok=True)
+            continue
+        if previous:
+            previous["path"].unlink(missing_ok=True)
+        migrated[metadata["url"]] = metadata
+    return [_index_record(url, metadata) for url, metadata in migrated.items()]
+
+
 def _initialize_cache():
-    """Initialize the cache metadata by scanning cache directory."""
-    global _cache_metadata, _cache_size_bytes, _cache_initialized
+    """Initialize the cache metadata from the cache index."""
+    global _cache_metadata, _cache_size_bytes, _cache_raw_bytes
+    global _cache_initialized, _index_lines
 
     if _cache_initialized:
         return
 
     _cache_metadata = {}
     _cache_size_bytes = 0
+    _cache_raw_bytes = 0
+    _clear_memory_tier()
+    _clear_blob_refs()
 
     # Ensure cache directory exists
     ensure_cache_exists()
+    cache_path = CACHE_PATH()
 
-    # Scan cache directory and build metadata
-    for file_path in CACHE_PATH().glob("*.json"):
-        if file_path.is_file():
-            file_size = file_path.stat().st_size
-            _cache_size_bytes += file_size
-
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    url = data.get("url")
-                    if url:
-                        _cache_metadata[url] = {
-                            "path": file_path,
-                            "size": file_size,
-                            "added_at": file_path.stat().st_mtime,
-                            "expires_at": data.get("expires_at", -1),
-                        }
-            except (json.JSONDecodeError, KeyError, TypeError):
-                # Invalid file, remove from cache
-                file_path.unlink(missing_ok=True)
-                _cache_size_bytes -= file_size
+    try:
+        records, _index_lines = cache_index.read_index(cache_path)
+    except OSError:
+        migrated = _migrate_cache_files(cache_path)
+        cache_index.write_index(cache_path, migrated)
+        records = {record["url"]: record for record in migrated}
+        _index_lines = len(migrated)
+
+    for url, record in records.items():
+        _cache_metadata[url] = {
+            "url": url,
+            "path": cache_path / record["path"],
+            "size": record["size"],
+            "added_at": record["added_at"],
+            "expires_at": record["expires_at"],
+            "raw_size": record.get("raw_size", record["size"]),
+            "connector": record.get("connector"),
+            "blobs": record.get("blobs") or {},
+        }
+        _cache_size_bytes += record["size"]
+        _cache_raw_bytes += _cache_metadata[url]["raw_size"]
+        _reference_blobs(_cache_metadata[url]["blobs"])
+    _rebuild_heaps()
 
     _cache_initialized = True
 
@@ -128,66 +298,158 @@ def _process_cache_file(file_path: Path) -> Optional[Dict[str, Any]]:
     if not file_path.is_file():
         return None
 
-    file_size = file_path.stat().st_size
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            url = data.get("url")
-            if url:
-                return {
-                    "path": file_path,
-                    "size": file_size,
-                    "added_at": file_path.stat().st_mtime,
-                    "expires_at": data.get("expires_at", -1),
-                }
-    except (json.JSONDecodeError, KeyError, TypeError):
-        pass
+    metadata = _get_file_metadata(file_path)
+    if metadata and metadata["url"]:
+        return {**metadata, "path": file_path}
     return None
 
 
-def _remove_expired_files():
-    """Remove expired cache files."""
-    global _cache_size_bytes
+def _evict(url: str) -> None:
+    """Remove an item from the cache to free space, counting the eviction."""
+    _count("evictions", _cache_metadata[url].get("connector"))
+    remove_from_cache(url)
+
+
+def _remove_expired_files() -> int:
+    """Remove expired cache files, soonest expiring first."""
+    removed = 0
     current_time = time.time()
-    for url, metadata in list(_cache_metadata.items()):
-        if metadata["expires_at"] > 0 and current_time > metadata["expires_at"]:
+    while _expiry_heap and _expiry_heap[0][0] < current_time:
+        expires_at, url = heapq.heappop(_expiry_heap)
+        if _is_current(url, "expires_at", expires_at):
+            _evict(url)
+            removed += 1
+    return removed
+
+
+def _cleanup_cache() -> int:
+    """
+    Clean up the cache by removing expired files and maintaining size limits.
+
+    Returns:
+        Number of items removed
+    """
+    removed = _remove_expired_files()
+
+    # If still over limit, remove oldest files
+    max_size = MAX_CACHE_SIZE_MB * 1024 * 1024 * CACHE_CLEANUP_THRESHOLD
+    while _total_size() > max_size and _age_heap:
+        added_at, url = heapq.heappop(_age_heap)
+        if _is_current(url, "added_at", added_at):
+            _evict(url)
+            removed += 1
+    return removed
+
+
+def _total_size() -> int:
+    """Get the size on disk of all payloads and blobs."""
+    return _cache_size_bytes + _blob_bytes
+
+
+def _reference_blobs(blobs: Dict[str, int]) -> None:
+    """Count a reference from a cache entry to each of its blobs."""
+    global _blob_bytes
+
+    for blob_id, size in blobs.items():
+        if blob_id not in _blob_refs:
+            _blob_refs[blob_id] = 0
+            _blob_sizes[blob_id] = size
+            _blob_bytes += size
+        _blob_refs[blob_id] += 1
+
+
+def _release_blobs(blobs: Dict[str, int]) -> None:
+    """Drop a reference to each blob, deleting blobs no entry uses anymore."""
+    global _blob_bytes
+
+    for blob_id in blobs:
+        count = _blob_refs.get(blob_id, 0) - 1
+        if count > 0:
+            _blob_refs[blob_id] = count
+            continue
+        _blob_refs.pop(blob_id, None)
+        _blob_bytes -= _blob_sizes.pop(blob_id, 0)
+        blob_store.delete_blob(CACHE_PATH(), blob_id)
+
+
+def _clear_blob_refs() -> None:
+    """Forget all blob reference counts."""
+    global _blob_bytes
+
+    _blob_refs.clear()
+    _blob_sizes.clear()
+    _blob_bytes = 0
+    blob_store.clear_blobs()
+
+
+def _externalize_texts(
+    content: Dict[str, Any], codec: cache_codec.Codec, level: int
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Move long item texts of a payload to the blob store.
+
+    Returns:
+        Tuple of (payload referencing the blobs, blob id -> blob size)
+    """
+    items = content.get("items")
+    if not isinstance(items, list):
+        return content, {}
+
+    blobs: Dict[str, int] = {}
+    stored_items = []
+    for item in items:
+        text = item.get("content") if isinstance(item, dict) else None
+        if isinstance(text, str) and len(text) >= blob_store.MIN_BLOB_SIZE:
+            blob_id, size = blob_store.store_text(CACHE_PATH(), text, codec, level)
+            blobs[blob_id] = size
+            item = {key: value for key, value in item.items() if key != "content"}
+            item["content_blob"] = blob_id
+        stored_items.append(item)
+    return {**content, "items": stored_items}, blobs
+
+
+def _resolve_texts(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace blob references in a payload read from disk by their texts."""
+    for item in payload.get("items") or []:
+        if isinstance(item, dict) and "content_blob" in item:
             try:
-                metadata["path"].unlink()
-                _cache_size_bytes -= metadata["size"]
-                del _cache_metadata[url]
-            except OSError:
-                pass
+                item["content"] = blob_store.read_text(
+                    CACHE_PATH(), item.pop("content_blob")
+                )
+            except KeyError as e:
+                raise ValueError(f"Unknown blob codec: {e}") from e
+    return payload
 
 
-def _cleanup_cache():
-    """Clean up the cache by removing expired files and maintaining size limits."""
-    global _cache_size_bytes, _cache_metadata
+def _remember_payload(url: str, content: Dict[str, Any], size: int) -> None:
+    """Keep a parsed payload in the memory tier, evicting least recent ones."""
+    global _memory_bytes
 
-    _cache_size_bytes = 0
-    _cache_metadata.clear()
+    _forget_payload(url)
+    if size > MEMORY_CACHE_SIZE_MB * 1024 * 1024:
+        return
+    _memory_cache[url] = (content, size)
+    _memory_bytes += size
+    while _memory_bytes > MEMORY_CACHE_SIZE_MB * 1024 * 1024:
+        _, (_, evicted_size) = _memory_cache.popitem(last=False)
+        _memory_bytes -= evicted_size
 
-    # Ensure cache directory exists
-    ensure_cache_exists()
 
-    # Scan cache directory and build metadata
-    for file_path in CACHE_PATH().glob("*.json"):
-        metadata = _process_cache_file(file_path)
-        if metadata:
-            _cache_metadata[metadata["path"].name] = metadata
-            _cache_size_bytes += metadata["size"]
+def _forget_payload(url: str) -> None:
+    """Drop a payload from the memory tier."""
+    global _memory_bytes
 
-    # Remove expired files
-    _remove_expired_files()
+    entry = _memory_cache.pop(url, None)
+    if entry:
+        _memory_bytes -= entry[1]
 
-    # If still over limit, remove oldest files
-    while _cache_size_bytes > MAX_CACHE_SIZE_MB * 1024 * 1024 * CACHE_CLEANUP_THRESHOLD:
-        oldest_file = min(_cache_metadata.items(), key=lambda x: x[1]["added_at"])
-        try:
-            oldest_file[1]["path"].unlink()
-            _cache_size_bytes -= oldest_file[1]["size"]
-            del _cache_metadata[oldest_file[0]]
-        except OSError:
-            break
+
+def _clear_memory_tier() -> None:
+    """Drop all payloads from the memory tier."""
+    global _memory_bytes
+
+    _memory_cache.clear()
+    _memory_bytes = 0
 
 
 def CACHE_PATH() -> Path:
@@ -200,41 +462,139 @@ def ensure_cache_exists():
     CACHE_PATH().mkdir(parents=True, exist_ok=True)
 
 
-def get_from_cache(url: str) -> Optional[Dict[str, Any]]:
+def _load_payload(
+    url: str, allow_stale: bool, connector: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached payload from memory or disk, honouring its expiry.
+
+    Stale reads follow a lookup that was already counted, so they count as
+    stale_reads instead of hits and misses.
+    """
+    with _cache_lock:
+        _initialize_cache()
+
+        # Check if item exists in cache metadata
+        metadata = _get_cache_metadata(url)
+        if metadata is None:
+            if not allow_stale:
+                _count("misses", connector)
+            return None
+        connector = connector or metadata.get("connector")
+
+        # Check if item has expired
+        expires_at = metadata["expires_at"]
+        current_time = time.time()
+        if expires_at > 0 and expires_at < current_time:
+            if current_time - expires_at > MAX_STALE_SECONDS:
+                # Too old to revalidate, remove it
+                remove_from_cache(url)
+                if not allow_stale:
+                    _count("misses", connector)
+                return None
+            if not allow_stale:
+                _count("expirations", connector)
+                _count("misses", connector)
+                return None
+
+        # Serve from memory if the payload was used recently
+        entry = _memory_cache.get(url)
+        if entry is not None:
+            _memory_cache.move_to_end(url)
+            _count("stale_reads" if allow_stale else "memory_hits", connector)
+            return entry[0]
+
+    # Load item from disk without holding the lock
+    try:
+        content = _resolve_texts(_read_payload(metadata["path"]))
+    except cache_codec.DECODE_ERRORS:
+        with _cache_lock:
+            # File doesn't exist or is invalid, remove from metadata unless
+            # the entry was replaced or removed meanwhile
+            if _cache_metadata.get(url) is metadata:
+                remove_from_cache(url)
+            if not allow_stale:
+                _count("misses", connector)
+        return None
+
+    with _cache_lock:
+        _count("stale_reads" if allow_stale else "disk_hits", connector)
+        _count("bytes_read", connector, metadata["size"])
+        if _cache_metadata.get(url) is metadata:
+            _remember_payload(url, content, metadata["raw_size"])
+    return content
+
+
+def get_from_cache(
+    url: str, connector: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get an item from the cache.
 
     Args:
         url: The URL to retrieve from cache
+        connector: Optional name of the connector asking, for statistics
 
     Returns:
         The cached content or None if not found or expired
     """
-    _initialize_cache()
+    return _load_payload(url, allow_stale=False, connector=connector)
 
-    # Check if item exists in cache metadata
-    if url not in _cache_metadata:
-        return None
 
-    metadata = _cache_metadata[url]
+def get_stale_from_cache(
+    url: str, connector: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Get an item from the cache even if it has expired.
 
-    # Check if item has expired
-    if metadata["expires_at"] > 0 and metadata["expires_at"] < time.time():
-        # Item has expired, remove it
-        remove_from_cache(url)
-        return None
+    Used to revalidate an expired entry with the validators stored in it, or
+    to serve it while the source cannot be reached.
 
-    # Load item from disk
-    try:
-        with open(metadata["path"], "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        # File doesn't exist or is invalid, remove from metadata
-        remove_from_cache(url)
-        return None
+    Args:
+        url: The URL to retrieve from cache
+        connector: Optional name of the connector asking, for statistics
 
+    Returns:
+        The cached content or None if not found or expired for too long
+    """
+    return _load_payload(url, allow_stale=True, connector=connector)
 
-def add_to_cache(url: str, content: Dict[str, Any], expiration_time: int = -1):
+
+def touch_cache_entry(url: str, expiration_time: int) -> bool:
+    """
+    Extend the expiry of a cached item without rewriting it.
+
+    Used when the source confirms the cached content is still current.
+
+    Args:
+        url: The URL of the cached item
+        expiration_time: Seconds to cache from now (-1 forever)
+
+    Returns:
+        True if the item was cached and its expiry updated
+    """
+    with _cache_lock:
+        _initialize_cache()
+        metadata = _get_cache_metadata(url)
+        if metadata is None or expiration_time == 0:
+            return False
+
+        if expiration_time > 0:
+            metadata["expires_at"] = time.time() + expiration_time
+            heapq.heappush(_expiry_heap, (metadata["expires_at"], url))
+        else:
+            metadata["expires_at"] = expiration_time
+        _log_change(_index_record(url, metadata))
+        _count("revalidations", metadata.get("connector"))
+        return True
+
+
+def add_to_cache(
+    url: str,
+    content: Dict[str, Any],
+    expiration_time: int = -1,
+    connector: Optional[str] = None,
+):
     """
     Add an item to the cache.
 
@@ -245,47 +605,71 @@ def add_to_cache(url: str, content: Dict[str, Any], expiration_time: int = -1):
             -1: cache forever (default)
             0: never cache
             >0: seconds to cache
+        connector: Optional name of the connector that fetched the content
     """
-    # Never cache if expiration_time is 0
-    if expiration_time == 0:
-        return
-
-    _initialize_cache()
-
-    # Add expiration timestamp if needed
-    if expiration_time > 0:
-        content["expires_at"] = time.time() + expiration_time
-    else:
-        content["expires_at"] = expiration_time  # -1 for forever
-
-    # Add URL to content
-    content["url"] = url
-
-    # Generate cache path
-    cache_path = _get_cache_path(url)
-
-    # Write to cache
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(content, f, ensure_ascii=False)
-
-    # Update metadata
-    file_size = cache_path.stat().st_size
-    _cache_metadata[url] = {
-        "path": cache_path,
-        "size": file_size,
-        "added_at": time.time(),
-        "expires_at": content["expires_at"],
-    }
-
-    # Update total cache size
-    global _cache_size_bytes
-    if url in _cache_metadata:
-        _cache_size_bytes -= _cache_metadata[url]["size"]
-    _cache_size_bytes += file_size
-
-    # Check if cleanup needed
-    if _cache_size_bytes > MAX_CACHE_SIZE_MB * 1024 * 1024 * CACHE_CLEANUP_THRESHOLD:
-        _cleanup_cache()
+    global _cache_size_bytes, _cache_raw_bytes
+
+    with _cache_lock:
+        # Never cache if expiration_time is 0
+        if expiration_time == 0:
+            return
+
+        _initialize_cache()
+
+        # Add expiration timestamp if needed
+        if expiration_time > 0:
+            content["expires_at"] = time.time() + expiration_time
+        else:
+            content["expires_at"] = expiration_time  # -1 for forever
+
+        # Add URL to content
+        content["url"] = url
+
+        # Generate cache path
+        codec, level = cache_codec.load_settings()
+        cache_path = _get_cache_path(url, codec)
+
+        # Write long texts to the blob store and the rest to the cache file
+        data = json.dumps(content, ensure_ascii=False).encode("utf-8")
+        payload, blobs = _externalize_texts(content, codec, level)
+        if blobs:
+            stored_data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        else:
+            stored_data = data
+        write_file_atomic(cache_path, cache_codec.encode(stored_data, codec, level))
+        _reference_blobs(blobs)
+
+        # Replace any previous entry for the URL
+        previous = _cache_metadata.get(url)
+        if previous:
+            _cache_size_bytes -= previous["size"]
+            _cache_raw_bytes -= previous["raw_size"]
+            _release_blobs(previous["blobs"])
+            if previous["path"] != cache_path:
+                # Written with another codec
+                previous["path"].unlink(missing_ok=True)
+
+        # Update metadata
+        metadata = {
+            "url": url,
+            "path": cache_path,
+            "size": cache_path.stat().st_size,
+            "added_at": time.time(),
+            "expires_at": content["expires_at"],
+            "raw_size": len(data),
+            "connector": connector,
+            "blobs": blobs,
+        }
+        _track(url, metadata)
+        _cache_size_bytes += metadata["size"]
+        _cache_raw_bytes += metadata["raw_size"]
+        _log_change(_index_record(url, metadata))
+        _remember_payload(url, content, metadata["raw_size"])
+        _count("bytes_written", connector, metadata["size"])
+
+        # Check if cleanup needed
+        if _total_size() > MAX_CACHE_SIZE_MB * 1024 * 1024 * CACHE_CLEANUP_THRESHOLD:
+            _cleanup_cache()
 
 
 def remove_from_cache(url: str):
@@ -295,40 +679,56 @@ def remove_from_cache(url: str):
     Args:
         url: The URL to remove from cache
     """
-    global _cache_metadata, _cache_size_bytes
+    global _cache_size_bytes, _cache_raw_bytes
 
-    if url in _cache_metadata:
-        # Get metadata before removing
-        metadata = _cache_metadata[url]
+    with _cache_lock:
+        _initialize_cache()
 
-        # Remove file
-        try:
-            metadata["path"].unlink(missing_ok=True)
-        except (PermissionError, OSError):
-            pass  # Ignore errors on deletion
+        if url in _cache_metadata:
+            # Remove from metadata
+            metadata = _cache_metadata.pop(url)
+            _forget_payload(url)
 
-        # Update cache size
-        _cache_size_bytes -= metadata["size"]
+            # Remove file
+            try:
+                metadata["path"].unlink(missing_ok=True)
+            except (PermissionError, OSError):
+                pass  # Ignore errors on deletion
 
-        # Remove from metadata
-        del _cache_metadata[url]
+            # Update cache size
+            _cache_size_bytes -= metadata["size"]
+            _cache_raw_bytes -= metadata["raw_size"]
+            _release_blobs(metadata["blobs"])
+            _log_change(cache_index.removal_record(url))
 
 
 def clear_cache():
     """Clear the entire cache."""
-    global _cache_metadata, _cache_size_bytes, _cache_initialized
-
-    # Remove all files
-    for file_path in CACHE_PATH().glob("*.json"):
-        try:
-            file_path.unlink(missing_ok=True)
-        except (PermissionError, OSError):
-            pass  # Ignore errors on deletion
-
-    # Reset metadata
-    _cache_metadata = {}
-    _cache_size_bytes = 0
-    _cache_initialized = False
+    global _cache_metadata, _cache_size_bytes, _cache_raw_bytes
+    global _cache_initialized, _index_lines
+
+    with _cache_lock:
+        # Remove all files, the index last so a failure leaves it listing them
+        cache_path = CACHE_PATH()
+        index_file = cache_index.get_index_path(cache_path)
+        payload_files = [p for p in cache_path.glob("*.json*") if p != index_file]
+        for file_path in [*payload_files, index_file]:
+            try:
+                file_path.unlink(missing_ok=True)
+            except (PermissionError, OSError):
+                pass  # Ignore errors on deletion
+        shutil.rmtree(blob_store.get_blob_dir(cache_path), ignore_errors=True)
+
+        # Reset metadata
+        _cache_metadata = {}
+        _cache_size_bytes = 0
+        _cache_raw_bytes = 0
+        _clear_memory_tier()
+        _clear_blob_refs()
+        _age_heap.clear()
+        _expiry_heap.clear()
+        _index_lines = 0
+        _cache_initialized = False
 
 
 def find_cache_files(url_pattern: str = None) -> List[Dict[str, Any]]:
@@ -341,85 +741,201 @@ def find_cache_files(url_pattern: str = None) -> List[Dict[str, Any]]:
 
     Returns:
         List of dicts with information about matching cache files:
+        - url: The cached URL
         - path: Full path to the cache file
         - filename: Name of the cache file
         - url_part: The human-readable part of the filename (without hash)
         - size: Size of the file in bytes
         - age: Age of the file in seconds
     """
-    ensure_cache_exists()
-    cache_dir = CACHE_PATH()
-    results = []
-
-    for file_path in cache_dir.glob("*.json"):
-        if url_pattern is None or url_pattern.lower() in file_path.name.lower():
-            # Get file info
-            stat = file_path.stat()
-            url_part = file_path.stem.rsplit("_", 1)[0]  # Remove hash suffix
-
-            results.append(
-                {
-                    "path": str(file_path),
-                    "filename": file_path.name,
-                    "url_part": url_part,
-                    "size": stat.st_size,
-                    "age": time.time() - stat.st_mtime,
-                }
-            )
-
-    # Sort by age (newest first)
-    results.sort(key=lambda x: x["age"])
-    return results
+    with _cache_lock:
+        _initialize_cache()
+        current_time = time.time()
+        results = []
+
+        for url, metadata in _cache_metadata.items():
+            file_path = metadata["path"]
+            if url_pattern is None or url_pattern.lower() in file_path.name.lower():
+                url_part = file_path.name.rsplit("_", 1)[0]  # Remove hash suffix
+
+                results.append(
+                    {
+                        "url": url,
+                        "path": str(file_path),
+                        "filename": file_path.name,
+                        "url_part": url_part,
+                        "size": metadata["size"],
+                        "age": current_time - metadata["added_at"],
+                    }
+                )
+
+        # Sort by age (newest first)
+        results.sort(key=lambda x: x["age"])
+        return results
+
+
+def _read_payload(file_path: Path) -> Dict[str, Any]:
+    """Read and decompress a cached payload."""
+    data = cache_codec.decode(file_path, file_path.read_bytes())
+    return json.loads(data.decode("utf-8"))
 
 
 def _get_file_metadata(file_path: Path) -> Optional[Dict[str, Any]]:
-    """Get metadata for a single cache file."""
+    """
+    Get metadata for a single cache file by reading its payload.
+
+    Returns None if the payload cannot be decoded or references a missing blob.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return {
-                "url": data.get("url"),
-                "size": file_path.stat().st_size,
-                "added_at": file_path.stat().st_mtime,
-                "expires_at": data.get("expires_at", -1),
-            }
-    except (json.JSONDecodeError, OSError):
+        raw = cache_codec.decode(file_path, file_path.read_bytes())
+        data = json.loads(raw.decode("utf-8"))
+        blobs = {}
+        for item in data.get("items") or []:
+            if isinstance(item, dict) and "content_blob" in item:
+                blob_id = item["content_blob"]
+                blob_path = blob_store.get_blob_path(CACHE_PATH(), blob_id)
+                blobs[blob_id] = blob_path.stat().st_size
+        stat = file_path.stat()
+        return {
+            "url": data.get("url"),
+            "size": stat.st_size,
+            "added_at": stat.st_mtime,
+            "expires_at": data.get("expires_at", -1),
+            "raw_size": len(raw),
+            "blobs": blobs,
+        }
+    except (*cache_codec.DECODE_ERRORS, AttributeError, TypeError):
         return None
 
 
 def _get_cache_metadata(url: str) -> Optional[Dict[str, Any]]:
     """Get cache metadata for a specific URL."""
-    if url in _cache_metadata:
-        return _cache_metadata[url]
-
-    file_path = _get_cache_path(url)
-    if not file_path.exists():
-        return None
-
-    metadata = _get_file_metadata(file_path)
-    if metadata and metadata["url"] == url:
-        _cache_metadata[url] = metadata
-        return metadata
-    return None
+    return _cache_metadata.get(url)
 
 
 def get_cache_info(url: str) -> Optional[Dict[str, Any]]:
     """Get information about a cached item."""
-    metadata = _get_cache_metadata(url)
-    if not metadata:
-        return None
+    with _cache_lock:
+        _initialize_cache()
+        metadata = _get_cache_metadata(url)
+        if not metadata:
+            return None
 
-    current_time = time.time()
-    if metadata["expires_at"] > 0 and current_time > metadata["expires_at"]:
-        remove_from_cache(url)
-        return None
+        if metadata["expires_at"] > 0 and time.time() > metadata["expires_at"]:
+            return None
+
+        return {
+            "url": url,
+            "size": metadata["size"],
+            "added_at": metadata["added_at"],
+            "expires_at": metadata["expires_at"],
+        }
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get statistics about the cache contents and its use since startup.
 
-    return {
-        "url": url,
-        "size": metadata["size"],
-        "added_at": metadata["added_at"],
-        "expires_at": metadata["expires_at"],
-    }
+    Returns:
+        Dict with the number of entries, their size on disk and uncompressed,
+        the effective compression ratio, the number and size of shared blobs,
+        the codec used for new entries, the
+        size of the memory tier, the running counters and hit ratio, and the
+        same counters with entries and size per connector class
+    """
+    with _cache_lock:
+        _initialize_cache()
+        codec, level = cache_codec.load_settings()
+
+        connectors: Dict[str, Dict[str, Any]] = {}
+        for name, counters in _connector_stats.items():
+            connectors[name] = {"entries": 0, "size_bytes": 0, **counters}
+        for metadata in _cache_metadata.values():
+            name = metadata.get("connector") or "unknown"
+            if name not in connectors:
+                connectors[name] = {
+                    "entries": 0,
+                    "size_bytes": 0,
+                    **dict.fromkeys(STAT_COUNTERS, 0),
+                }
+            connectors[name]["entries"] += 1
+            connectors[name]["size_bytes"] += metadata["size"]
+        for stats in connectors.values():
+            stats["hit_ratio"] = _hit_ratio(stats)
+
+        return {
+            "entries": len(_cache_metadata),
+            "size_bytes": _total_size(),
+            "raw_size_bytes": _cache_raw_bytes,
+            "max_size_bytes": MAX_CACHE_SIZE_MB * 1024 * 1024,
+            "compression_ratio": (
+                _cache_raw_bytes / _total_size() if _total_size() else 1.0
+            ),
+            "blobs": len(_blob_refs),
+            "blob_bytes": _blob_bytes,
+            "blob_references": sum(_blob_refs.values()),
+            "codec": codec.name,
+            "compression_level": level,
+            "memory_entries": len(_memory_cache),
+            "memory_bytes": _memory_bytes,
+            **_cache_stats,
+            "hit_ratio": _hit_ratio(_cache_stats),
+            "connectors": connectors,
+        }
+
+
+def _hit_ratio(counters: Dict[str, int]) -> float:
+    """Get the fraction of lookups answered by either cache tier."""
+    hits = counters["memory_hits"] + counters["disk_hits"]
+    lookups = hits + counters["misses"]
+    return hits / lookups if lookups else 0.0
+
+
+def reset_cache_stats() -> None:
+    """Reset the running cache counters."""
+    with _cache_lock:
+        _cache_stats.update(dict.fromkeys(STAT_COUNTERS, 0))
+        _connector_stats.clear()
+
+
+def cleanup_cache() -> int:
+    """
+    Remove expired items and the oldest items beyond the size limit.
+
+    Blob files no item references, e.g. left by an interrupted write, are
+    deleted as well.
+
+    Returns:
+        Number of items removed
+    """
+    with _cache_lock:
+        _initialize_cache()
+        removed = _cleanup_cache()
+        blob_store.collect_garbage(CACHE_PATH(), _blob_refs)
+        return removed
+
+
+def purge_connector(connector: str) -> int:
+    """
+    Remove all items cached by a connector class.
+
+    Args:
+        connector: Name of the connector class, or "unknown" for items cached
+            without one
+
+    Returns:
+        Number of items removed
+    """
+    with _cache_lock:
+        _initialize_cache()
+        urls = [
+            url
+            for url, metadata in _cache_metadata.items()
+            if (metadata.get("connector") or "unknown") == connector
+        ]
+        for url in urls:
+            remove_from_cache(url)
+        return len(urls)
 
 
 def get_all_connectors():
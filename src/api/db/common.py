@@ -2,13 +2,17 @@
 
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
-import yaml
+from services.settings_service import load_settings
 
-from ..routes.settings import load_settings
+from . import entity_index
 
 
 def get_base_db_path() -> Path:
@@ -103,6 +107,64 @@ def ensure_path_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+# Number of files written by this process remembered for the vault watcher
+OWN_WRITES_SIZE = 1024
+
+# Files written by this process mapped to their (mtime_ns, size) once written,
+# oldest first, so the vault watcher can ignore its own process's changes
+_own_writes: "OrderedDict[Path, Tuple[int, int]]" = OrderedDict()
+_own_writes_lock = threading.Lock()
+
+
+def record_own_write(path: Path, written: Optional[Path] = None) -> None:
+    """
+    Remember that this process wrote a file.
+
+    Args:
+        path: The file that was written
+        written: The file holding the written content if not yet at path,
+            e.g. a temporary file about to replace it
+    """
+    try:
+        stat = (written or path).stat()
+    except OSError:
+        return
+    with _own_writes_lock:
+        _own_writes[path] = (stat.st_mtime_ns, stat.st_size)
+        _own_writes.move_to_end(path)
+        while len(_own_writes) > OWN_WRITES_SIZE:
+            _own_writes.popitem(last=False)
+
+
+def is_own_write(path: Path) -> bool:
+    """Check whether a file is still as this process last wrote it."""
+    with _own_writes_lock:
+        signature = _own_writes.get(path)
+    if signature is None:
+        return False
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == signature
+
+
+def write_file_atomic(path: Path, content: Union[str, bytes]) -> None:
+    """Write a file via a temporary file so it is never seen half written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(content, bytes):
+        f = open(tmp_path, "wb")
+    else:
+        f = open(tmp_path, "w", encoding="utf-8")
+    with f:
+        f.write(content)
+        f.flush()
+    # Recorded before the rename, which keeps the signature, so the watcher
+    # never sees the new file before it is known as this process's write
+    record_own_write(path, tmp_path)
+    os.replace(tmp_path, path)
+
+
 def get_article_path(project_slug: str, topic_slug: str, timestamp: datetime) -> Path:
     """
     Generate a canonical article path with consistent timestamp format.
@@ -129,54 +191,192 @@ def get_article_path(project_slug: str, topic_slug: str, timestamp: datetime) ->
     return article_path
 
 
+# Negative lookup cache configuration
+NEGATIVE_CACHE_SIZE = 1024  # Maximum number of remembered misses
+NEGATIVE_CACHE_TTL = 60  # Seconds before a miss triggers a rescan again
+
+# Guards the entity caches below, which are shared by API, scheduler and
+# worker threads
+_entity_lock = threading.RLock()
+
 # Cache for entity lookups
 _entity_id_cache = {}  # Maps entity_id to (path, entity_type)
+_entity_dirs: entity_index.DirIndex = {}  # Persistent index of vault directories
+_journal_entries = 0
 _cache_initialized = False
 
+# Recently missed entity ids mapped to the time of the miss, oldest first
+_negative_cache: "OrderedDict[str, float]" = OrderedDict()
+_entity_cache_stats = {"rescans": 0, "negative_hits": 0}
+
+
+def get_entity_index_paths() -> Tuple[Path, Path]:
+    """Get the paths of the entity index snapshot and its journal."""
+    base_path = get_base_db_path()
+    return base_path / "vault_index.json", base_path / "vault_index.journal"
 
-def _initialize_entity_cache():
+
+def initialize_entity_cache(
+    executor: Optional[Executor] = None, metadata: Optional[Dict[Path, Dict]] = None
+) -> int:
     """
-    Initialize the entity cache by scanning all metadata.yaml files once.
-    This improves subsequent lookups significantly.
+    Initialize the entity cache from the persistent entity index.
+
+    The index is validated against directory mtimes so only the parts of the
+    vault that changed since the last run have their metadata.yaml parsed.
+
+    Args:
+        executor: Optional worker pool used to refresh the index in parallel
+        metadata: Optional dict receiving the project and topic metadata
+            parsed while refreshing, by directory path
+
+    Returns:
+        Number of metadata files parsed
     """
-    global _cache_initialized
+    global _cache_initialized, _entity_dirs, _journal_entries
 
-    if _cache_initialized:
-        return
+    with _entity_lock:
+        if _cache_initialized:
+            return 0
+
+        vault_path = get_hierarchical_path()
+        index_file, journal_file = get_entity_index_paths()
 
-    vault_path = get_hierarchical_path()
-
-    # Use recursive glob to find all metadata.yaml files
-    for metadata_file in vault_path.glob("**/metadata.yaml"):
-        try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if data and "id" in data:
-                    entity_id = data["id"]
-                    parent_dir = metadata_file.parent
-
-                    # Determine entity type based on directory structure
-                    if parent_dir.parent.parent == vault_path:
-                        # Structure is: vault/project/topic/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "topic")
-                    elif parent_dir.parent == vault_path:
-                        # Structure is: vault/project/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "project")
-                    else:
-                        # Structure is: vault/project/topic/timestamp/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "article")
-        except (yaml.YAMLError, IOError):
-            # Skip files with errors
-            continue
-
-    _cache_initialized = True
+        dirs = entity_index.load_index(index_file, journal_file)
+        _entity_dirs, parsed_count = entity_index.refresh_index(
+            vault_path, dirs, executor, metadata
+        )
+        _rebuild_entity_cache(vault_path)
+
+        if vault_path.exists():
+            entity_index.save_index(index_file, journal_file, _entity_dirs)
+        _journal_entries = 0
+        _cache_initialized = True
+        return parsed_count
+
+
+def _rebuild_entity_cache(vault_path: Path) -> None:
+    """Rebuild the id lookup table from the entity index."""
+    _entity_id_cache.clear()
+    for rel_dir, (entity_id, _) in _entity_dirs.items():
+        entity_type = entity_index.entity_type_for(rel_dir)
+        if entity_id and entity_type:
+            _entity_id_cache[entity_id] = (vault_path / rel_dir, entity_type)
+
+
+def _rescan_vault() -> None:
+    """
+    Bring the entity cache up to date with changes made outside this process.
+
+    Only directories whose mtime changed since the last scan are parsed.
+    """
+    global _entity_dirs, _journal_entries
+
+    with _entity_lock:
+        vault_path = get_hierarchical_path()
+        _entity_dirs, parsed_count = entity_index.refresh_index(
+            vault_path, _entity_dirs
+        )
+        _rebuild_entity_cache(vault_path)
+        _entity_cache_stats["rescans"] += 1
+
+        if vault_path.exists() and (parsed_count or _journal_entries):
+            entity_index.save_index(*get_entity_index_paths(), _entity_dirs)
+            _journal_entries = 0
+
+
+def _is_known_miss(entity_id: str) -> bool:
+    """Check whether an id recently missed and should not trigger a rescan."""
+    missed_at = _negative_cache.get(entity_id)
+    if missed_at is None:
+        return False
+    if time.monotonic() - missed_at > NEGATIVE_CACHE_TTL:
+        del _negative_cache[entity_id]
+        return False
+    return True
+
+
+def _remember_miss(entity_id: str) -> None:
+    """Record a missed lookup, evicting the oldest misses beyond the size limit."""
+    _negative_cache[entity_id] = time.monotonic()
+    _negative_cache.move_to_end(entity_id)
+    while len(_negative_cache) > NEGATIVE_CACHE_SIZE:
+        _negative_cache.popitem(last=False)
+
+
+def get_indexed_dirs(entity_type: str) -> List[Path]:
+    """Get the directories of all indexed entities of a type."""
+    with _entity_lock:
+        vault_path = get_hierarchical_path()
+        return [
+            vault_path / rel_dir
+            for rel_dir, (entity_id, _) in _entity_dirs.items()
+            if entity_id and entity_index.entity_type_for(rel_dir) == entity_type
+        ]
+
+
+def get_entities_below(path: Path) -> List[Tuple[str, str, Path]]:
+    """
+    Get the indexed entities stored in a directory or any of its subdirectories.
+
+    Returns:
+        List of (entity_id, entity_type, path) tuples
+    """
+    with _entity_lock:
+        initialize_entity_cache()
+        rel_dir = _get_relative_dir(path)
+        if rel_dir is None:
+            return []
+        vault_path = get_hierarchical_path()
+        prefix = rel_dir + "/"
+        return [
+            (entity_id, entity_index.entity_type_for(child_dir), vault_path / child_dir)
+            for child_dir, (entity_id, _) in _entity_dirs.items()
+            if entity_id and (child_dir == rel_dir or child_dir.startswith(prefix))
+        ]
+
+
+def get_entity_cache_stats() -> dict:
+    """Get counters describing the entity cache and its negative lookups."""
+    with _entity_lock:
+        return {
+            "entities": len(_entity_id_cache),
+            "negative_entries": len(_negative_cache),
+            **_entity_cache_stats,
+        }
+
+
+def _get_relative_dir(path: Path) -> Optional[str]:
+    """Get an entity directory relative to the vault, or None if outside it."""
+    try:
+        return Path(path).relative_to(get_hierarchical_path()).as_posix()
+    except ValueError:
+        return None
+
+
+def _record_index_change(entry: dict) -> None:
+    """Apply a change to the entity index and append it to the journal."""
+    global _journal_entries
+
+    entity_index.apply_journal_entry(_entity_dirs, entry)
+    index_file, journal_file = get_entity_index_paths()
+    _journal_entries += 1
+    if _journal_entries >= entity_index.JOURNAL_COMPACT_THRESHOLD:
+        entity_index.save_index(index_file, journal_file, _entity_dirs)
+        _journal_entries = 0
+    else:
+        entity_index.append_journal(journal_file, entry)
 
 
 def invalidate_entity_cache():
     """Clear the entity cache to force reloading on next request."""
     global _cache_initialized
-    _entity_id_cache.clear()
-    _cache_initialized = False
+
+    with _entity_lock:
+        _entity_id_cache.clear()
+        _entity_dirs.clear()
+        _negative_cache.clear()
+        _cache_initialized = False
 
 
 def add_to_entity_cache(entity_id: str, path: Path, entity_type: str):
@@ -188,8 +388,14 @@ def add_to_entity_cache(entity_id: str, path: Path, entity_type: str):
         path: Path to the entity's directory
         entity_type: Type of entity ('project', 'topic', or 'article')
     """
-    _initialize_entity_cache()
-    _entity_id_cache[entity_id] = (path, entity_type)
+    with _entity_lock:
+        initialize_entity_cache()
+        _entity_id_cache[entity_id] = (path, entity_type)
+        _negative_cache.pop(entity_id, None)
+
+        rel_dir = _get_relative_dir(path)
+        if rel_dir and _entity_dirs.get(rel_dir, [None])[0] != entity_id:
+            _record_index_change({"op": "add", "dir": rel_dir, "id": entity_id})
 
 
 def remove_from_entity_cache(entity_id: str):
@@ -199,15 +405,28 @@ def remove_from_entity_cache(entity_id: str):
     Args:
         entity_id: The unique ID of the entity to remove
     """
-    _initialize_entity_cache()
-    if entity_id in _entity_id_cache:
-        del _entity_id_cache[entity_id]
+    with _entity_lock:
+        initialize_entity_cache()
+        if entity_id in _entity_id_cache:
+            path, _ = _entity_id_cache.pop(entity_id)
+            rel_dir = _get_relative_dir(path)
+            if rel_dir:
+                # Entities nested below the removed directory are gone as well
+                prefix = rel_dir + "/"
+                for child_dir, (child_id, _) in list(_entity_dirs.items()):
+                    if child_id and child_dir.startswith(prefix):
+                        _entity_id_cache.pop(child_id, None)
+                _record_index_change({"op": "remove", "dir": rel_dir})
 
 
 def find_entity_by_id(entity_id: str) -> Tuple[Optional[Path], Optional[str]]:
     """
     Find any entity (project, topic, article) by its ID using cache.
 
+    Misses trigger an incremental rescan of the vault once; repeated misses
+    for the same id are answered from a bounded negative cache until its TTL
+    expires or the entity is added through add_to_entity_cache.
+
     Args:
         entity_id: The unique ID to search for
 
@@ -215,38 +434,29 @@ def find_entity_by_id(entity_id: str) -> Tuple[Optional[Path], Optional[str]]:
         Tuple of (path to entity directory, entity type)
         where entity type is one of 'project', 'topic', 'article'
     """
-    # Initialize cache if not already done
-    _initialize_entity_cache()
-
-    # Check if entity is in cache
-    if entity_id in _entity_id_cache:
-        return _entity_id_cache[entity_id]
-
-    # If not in cache, scan files again (could be a new entity)
-    vault_path = get_hierarchical_path()
-
-    for metadata_file in vault_path.glob("**/metadata.yaml"):
-        try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                if data and "id" in data and data["id"] == entity_id:
-                    # Determine entity type based on directory structure
-                    parent_dir = metadata_file.parent
-
-                    if parent_dir.parent.parent == vault_path:
-                        # Structure is: vault/project/topic/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "topic")
-                        return parent_dir, "topic"
-                    elif parent_dir.parent == vault_path:
-                        # Structure is: vault/project/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "project")
-                        return parent_dir, "project"
-                    else:
-                        # Structure is: vault/project/topic/timestamp/metadata.yaml
-                        _entity_id_cache[entity_id] = (parent_dir, "article")
-                        return parent_dir, "article"
-        except (yaml.YAMLError, IOError):
-            # Skip files with errors
-            continue
-
-    return None, None
+    # Cached ids are answered without taking the lock
+    if _cache_initialized:
+        cached = _entity_id_cache.get(entity_id)
+        if cached is not None:
+            return cached
+
+    with _entity_lock:
+        # Initialize cache if not already done
+        initialize_entity_cache()
+
+        # Check if entity is in cache
+        if entity_id in _entity_id_cache:
+            return _entity_id_cache[entity_id]
+
+        # Skip the rescan for ids that recently missed
+        if _is_known_miss(entity_id):
+            _entity_cache_stats["negative_hits"] += 1
+            return None, None
+
+        # Rescan changed parts of the vault (could be a new entity)
+        _rescan_vault()
+        if entity_id in _entity_id_cache:
+            return _entity_id_cache[entity_id]
+
+        _remember_miss(entity_id)
+        return None, None
@@ -0,0 +1,206 @@
+"""
+Persistent on-disk index of the entities stored in the vault.
+
+The index maps every project, topic and article directory (relative to the
+vault) to its entity id and the directory mtime it was read at. On startup the
+vault tree is walked with cheap stat calls and only directories whose mtime
+changed are listed again and have their metadata.yaml parsed. Changes made
+while running are appended to a journal that is folded back into the snapshot
+on the next load or when it grows too large.
+"""
+
+import json
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+INDEX_VERSION = 1
+JOURNAL_COMPACT_THRESHOLD = 1000
+
+# Entity type by directory depth below the vault: vault/project/topic/timestamp
+ENTITY_TYPES = {1: "project", 2: "topic", 3: "article"}
+MAX_DEPTH = 3
+
+# Relative directory -> [entity_id or None, dir mtime_ns or None]
+DirIndex = Dict[str, List]
+
+_yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def get_depth(rel_dir: str) -> int:
+    """Return the depth of a relative vault directory (0 for the vault itself)."""
+    return rel_dir.count("/") + 1 if rel_dir else 0
+
+
+def entity_type_for(rel_dir: str) -> Optional[str]:
+    """Return the entity type stored in a relative vault directory."""
+    return ENTITY_TYPES.get(get_depth(rel_dir))
+
+
+def read_metadata(metadata_file: Path) -> Optional[Dict]:
+    """Parse a metadata.yaml file, or return None if unavailable."""
+    try:
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=_yaml_loader)  # nosec: safe loader
+    except (yaml.YAMLError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def read_entity_id(metadata_file: Path) -> Optional[str]:
+    """Read the entity id from a metadata.yaml file, or None if unavailable."""
+    data = read_metadata(metadata_file)
+    if data and data.get("id"):
+        return data["id"]
+    return None
+
+
+def _list_subdirs(path: Path, rel_dir: str) -> List[str]:
+    """List the relative paths of the direct subdirectories of path."""
+    try:
+        with os.scandir(path) as entries:
+            names = [entry.name for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+    return [f"{rel_dir}/{name}" if rel_dir else name for name in names]
+
+
+def _group_children(dirs: DirIndex) -> Dict[str, List[str]]:
+    """Map each recorded directory to its recorded child directories."""
+    children: Dict[str, List[str]] = {}
+    for rel_dir in dirs:
+        if rel_dir:
+            parent = rel_dir.rsplit("/", 1)[0] if "/" in rel_dir else ""
+            children.setdefault(parent, []).append(rel_dir)
+    return children
+
+
+def load_index(index_file: Path, journal_file: Path) -> DirIndex:
+    """
+    Load the index snapshot and replay the journal on top of it.
+
+    Returns an empty index if the snapshot is missing, corrupt or outdated.
+    """
+    dirs: DirIndex = {}
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == INDEX_VERSION:
+            dirs = data.get("dirs", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+    try:
+        with open(journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    apply_journal_entry(dirs, json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+
+    return dirs
+
+
+def apply_journal_entry(dirs: DirIndex, entry: Dict) -> None:
+    """Apply a single add/remove journal entry to the index."""
+    rel_dir = entry["dir"]
+    if entry["op"] == "add":
+        if rel_dir in dirs:
+            # Keep the recorded mtime, the directory listing has not changed
+            dirs[rel_dir][0] = entry["id"]
+        else:
+            # Unknown mtime forces a rescan of this directory on next load
+            dirs[rel_dir] = [entry["id"], None]
+    elif entry["op"] == "remove":
+        prefix = rel_dir + "/"
+        for key in [k for k in dirs if k == rel_dir or k.startswith(prefix)]:
+            del dirs[key]
+
+
+def refresh_index(
+    vault_path: Path,
+    dirs: DirIndex,
+    executor: Optional[Executor] = None,
+    metadata: Optional[Dict[Path, Dict]] = None,
+) -> Tuple[DirIndex, int]:
+    """
+    Bring the index up to date with the vault on disk.
+
+    Directories whose mtime matches the recorded one reuse their recorded id
+    and children; all other directories are listed and parsed again. The vault
+    is walked level by level so each level can be refreshed in parallel.
+
+    Args:
+        vault_path: Path of the vault
+        dirs: The index to refresh
+        executor: Optional worker pool used to stat, list and parse directories
+        metadata: Optional dict receiving the parsed metadata of the project
+            and topic directories that were read again, by directory path
+
+    Returns:
+        Tuple of (refreshed index, number of metadata files parsed)
+    """
+    children = _group_children(dirs)
+
+    def _refresh_dir(
+        rel_dir: str,
+    ) -> Optional[Tuple[List, List[str], Optional[Dict], bool]]:
+        """Refresh one directory, returning (record, subdirs, data, parsed) or None."""
+        path = vault_path / rel_dir if rel_dir else vault_path
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        depth = get_depth(rel_dir)
+        record = dirs.get(rel_dir)
+        if record is not None and record[1] == mtime:
+            return [record[0], mtime], children.get(rel_dir, []), None, False
+
+        data = read_metadata(path / "metadata.yaml") if depth else None
+        entity_id = (data.get("id") or None) if data else None
+        subdirs = _list_subdirs(path, rel_dir) if depth < MAX_DEPTH else []
+        return [entity_id, mtime], subdirs, data, bool(depth)
+
+    map_fn = executor.map if executor is not None else map
+    refreshed: DirIndex = {}
+    parsed_count = 0
+
+    level = [""]
+    while level:
+        next_level = []
+        for rel_dir, result in zip(level, map_fn(_refresh_dir, level)):
+            if result is None:
+                continue
+            record, subdirs, data, parsed = result
+            refreshed[rel_dir] = record
+            parsed_count += parsed
+            # Article metadata is not kept, warm-up only loads projects and topics
+            if metadata is not None and data and get_depth(rel_dir) < MAX_DEPTH:
+                metadata[vault_path / rel_dir] = data
+            next_level.extend(subdirs)
+        level = next_level
+
+    return refreshed, parsed_count
+
+
+def save_index(index_file: Path, journal_file: Path, dirs: DirIndex) -> None:
+    """Atomically write the index snapshot and discard the journal."""
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = index_file.with_name(index_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, "dirs": dirs}, f, separators=(",", ":"))
+    os.replace(tmp_file, index_file)
+    journal_file.unlink(missing_ok=True)
+
+
+def append_journal(journal_file: Path, entry: Dict) -> None:
+    """Append a single add/remove entry to the journal."""
+    journal_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(journal_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
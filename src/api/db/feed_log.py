@@ -0,0 +1,95 @@
+"""
+Append-only log of the feed items processed for a topic.
+
+Processed feed items are stored as JSON lines in processed_feeds.jsonl next to
+the topic's metadata.yaml. Saving a topic appends only the items that are new
+or changed since the last save; when an item changes, its new state is
+appended and the last record for a (url, content_hash) key wins on load. The
+log is rewritten with one line per item once it holds mostly superseded
+records.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ..models.feed_item import FeedItem
+from .common import record_own_write
+
+FEED_LOG_FILE = "processed_feeds.jsonl"
+
+# Compact once the log has this many lines and at least twice as many lines
+# as it holds distinct feed items
+COMPACT_MIN_LINES = 256
+
+FeedKey = Tuple[str, str]
+
+
+def get_feed_log_path(topic_path: Path) -> Path:
+    """Return the path of the processed feed log of a topic directory."""
+    return topic_path / FEED_LOG_FILE
+
+
+def feed_item_key(item: FeedItem) -> FeedKey:
+    """Return the key identifying a processed feed item."""
+    return item.url, item.content_hash
+
+
+def feed_item_record(item: FeedItem) -> Dict:
+    """Convert a feed item to the JSON record stored in the log."""
+    return item.model_dump(mode="json", exclude={"needs_further_processing"})
+
+
+def read_feed_log(topic_path: Path) -> Tuple[Dict[FeedKey, Dict], int]:
+    """
+    Read the latest record of every feed item in a topic's log.
+
+    Returns:
+        Tuple of (records by key in first-logged order, number of lines read)
+    """
+    records: Dict[FeedKey, Dict] = {}
+    line_count = 0
+    try:
+        with open(get_feed_log_path(topic_path), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key = (record["url"], record["content_hash"])
+                except (ValueError, KeyError, TypeError):
+                    # Skip a line left incomplete by an interrupted write
+                    continue
+                records[key] = record
+                line_count += 1
+    except OSError:
+        pass
+    return records, line_count
+
+
+def append_feed_log(topic_path: Path, records: List[Dict]) -> None:
+    """Append feed item records to a topic's log."""
+    lines = "".join(
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        for record in records
+    )
+    with open(get_feed_log_path(topic_path), "a", encoding="utf-8") as f:
+        f.write(lines)
+        f.flush()
+    record_own_write(get_feed_log_path(topic_path))
+
+
+def write_feed_log(topic_path: Path, records: List[Dict]) -> None:
+    """Atomically replace a topic's log with one record per feed item."""
+    log_file = get_feed_log_path(topic_path)
+    tmp_file = log_file.with_name(log_file.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+    record_own_write(log_file, tmp_file)
+    os.replace(tmp_file, log_file)
+
+
+def needs_compaction(line_count: int, entry_count: int) -> bool:
+    """Check whether a log holds enough superseded records to be rewritten."""
+    return line_count >= COMPACT_MIN_LINES and line_count >= 2 * entry_count
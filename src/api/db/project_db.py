@@ -3,6 +3,7 @@ Database operations for projects using hierarchical folder structure.
 """
 
 import shutil
+import threading
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -18,80 +19,150 @@ from .common import (
     ensure_unique_slug,
     find_entity_by_id,
     get_hierarchical_path,
+    record_own_write,
     remove_from_entity_cache,
 )
 
+# In-memory cache for projects
+_project_cache: Dict[str, Project] = {}
+_cache_initialized = False
+
+# Reverse index from topic id to the id of the project that owns it
+_topic_project_index: Dict[str, str] = {}
+
+# Guards both caches above and project writes, so the reverse index never
+# disagrees with the cached projects while API and pipeline threads update them
+_cache_lock = threading.RLock()
+
+
+def _ensure_cache():
+    """Initialize cache if not already done."""
+    global _cache_initialized
+    if _cache_initialized:
+        return
+    with _cache_lock:
+        if not _cache_initialized:
+            projects = _load_all_projects_from_disk()
+            _project_cache.update({project.id: project for project in projects})
+            for project in projects:
+                _index_project_topics(project)
+            _cache_initialized = True
+
+
+def _index_project_topics(project: Project) -> None:
+    """Point the reverse index entries for a project's topics at the project."""
+    stale_topic_ids = [
+        topic_id
+        for topic_id, project_id in _topic_project_index.items()
+        if project_id == project.id and topic_id not in project.topic_ids
+    ]
+    for topic_id in stale_topic_ids:
+        del _topic_project_index[topic_id]
+    for topic_id in project.topic_ids:
+        _topic_project_index[topic_id] = project.id
+
+
+def _project_from_data(data: dict, project_dir: Path) -> Project:
+    """Build a project from its parsed metadata."""
+    # Convert ISO format strings back to datetime
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    if data["updated_at"]:
+        data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+
+    # Set slug from directory name if not already set
+    if not data.get("slug"):
+        data["slug"] = project_dir.name
+
+    return Project(**data)
+
 
 def save_project(project: Project) -> None:
     """Save project to YAML file in its slug-named folder."""
-    # Use existing slug if available, otherwise create a new one
+    with _cache_lock:
+        # Use existing slug if available, otherwise create a new one
 
-    if project.slug:
-        project_slug = project.slug
-    else:
-        project_slug = ensure_unique_slug(project.title, "project")
-        project.slug = project_slug
+        if project.slug:
+            project_slug = project.slug
+        else:
+            project_slug = ensure_unique_slug(project.title, "project")
+            project.slug = project_slug
 
-    # Build path
-    project_path = get_hierarchical_path(project_slug)
-    ensure_path_exists(project_path)
+        # Build path
+        project_path = get_hierarchical_path(project_slug)
+        ensure_path_exists(project_path)
 
-    # Create metadata file
-    filename = project_path / "metadata.yaml"
+        # Create metadata file
+        filename = project_path / "metadata.yaml"
 
-    # Convert to dict and save
-    project_dict = project.model_dump()
+        # Convert to dict and save
+        project_dict = project.model_dump()
 
-    # Convert datetime objects to ISO format
-    project_dict["created_at"] = project_dict["created_at"].isoformat()
-    if project_dict["updated_at"]:
-        project_dict["updated_at"] = project_dict["updated_at"].isoformat()
+        # Convert datetime objects to ISO format
+        project_dict["created_at"] = project_dict["created_at"].isoformat()
+        if project_dict["updated_at"]:
+            project_dict["updated_at"] = project_dict["updated_at"].isoformat()
 
-    with open(filename, "w", encoding="utf-8") as f:
-        yaml.safe_dump(project_dict, f, sort_keys=False, allow_unicode=True)
-        f.flush()  # Ensure data is written to disk
+        with open(filename, "w", encoding="utf-8") as f:
+            yaml.safe_dump(project_dict, f, sort_keys=False, allow_unicode=True)
+            f.flush()  # Ensure data is written to disk
+        record_own_write(filename)
 
-    # Update the cache
-    add_to_entity_cache(project.id, project_path, "project")
+        # Update the caches
+        _project_cache[project.id] = project
+        _index_project_topics(project)
+        add_to_entity_cache(project.id, project_path, "project")
 
 
 def get_project(project_id: str) -> Optional[Project]:
-    """Retrieve project by id using the entity cache."""
-    project_path, entity_type = find_entity_by_id(project_id)
+    """Retrieve project by id from cache or disk."""
+    with _cache_lock:
+        _ensure_cache()
 
-    if not project_path or entity_type != "project":
-        return None
+        # First check in-memory cache
+        if project_id in _project_cache:
+            return _project_cache[project_id]
 
-    metadata_file = project_path / "metadata.yaml"
-    if not metadata_file.exists():
-        return None
+        # If not in memory cache, try to find using entity cache
+        project_path, entity_type = find_entity_by_id(project_id)
 
-    with open(metadata_file, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        # Convert ISO format strings back to datetime
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if data["updated_at"]:
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        if not project_path or entity_type != "project":
+            return None
+
+        metadata_file = project_path / "metadata.yaml"
+        if not metadata_file.exists():
+            return None
 
-        return Project(**data)
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            project = _project_from_data(yaml.safe_load(f), project_path)
+            _project_cache[project.id] = project
+            _index_project_topics(project)
+            return project
 
 
 def get_project_by_slug(slug: str) -> Optional[Project]:
     """Retrieve project by slug."""
-    path = get_hierarchical_path(slug)
-    filename = path / "metadata.yaml"
+    with _cache_lock:
+        path = get_hierarchical_path(slug)
+        filename = path / "metadata.yaml"
 
-    if not filename.exists():
-        return None
+        if not filename.exists():
+            return None
+
+        with open(filename, "r", encoding="utf-8") as f:
+            project = _project_from_data(yaml.safe_load(f), path)
+            _project_cache[project.id] = project
+            _index_project_topics(project)
+            return project
 
-    with open(filename, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-        # Convert ISO format strings back to datetime
-        data["created_at"] = datetime.fromisoformat(data["created_at"])
-        if data["updated_at"]:
-            data["updated_at"] = datetime.fromisoformat(data["updated_at"])
 
-        return Project(**data)
+def get_project_for_topic(topic_id: str) -> Optional[Project]:
+    """Retrieve the project that owns a topic using the reverse index."""
+    with _cache_lock:
+        _ensure_cache()
+        project_id = _topic_project_index.get(topic_id)
+        if not project_id:
+            return None
+        return get_project(project_id)
 
 
 def _get_project_directories() -> List[Path]:
@@ -103,27 +174,75 @@ def _get_project_directories() -> List[Path]:
     return [d for d in vault_path.iterdir() if d.is_dir()]
 
 
-def list_projects() -> List[Project]:
-    """List all projects by reading from hierarchical structure."""
+def load_project_dir(
+    project_dir: Path, data: Optional[dict] = None
+) -> Optional[Project]:
+    """
+    Load the project stored in a directory, or None if it has no metadata.
+
+    Args:
+        project_dir: The project directory
+        data: Its metadata if already parsed, e.g. while indexing the vault
+    """
+    if data is not None:
+        return _project_from_data(data, project_dir)
+    metadata_file = project_dir / "metadata.yaml"
+    if not metadata_file.exists():
+        return None
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        return _project_from_data(yaml.safe_load(f), project_dir)
+
+
+def _load_all_projects_from_disk() -> List[Project]:
+    """Internal function to load projects directly from disk."""
     projects = []
 
     for project_dir in _get_project_directories():
-        metadata_file = project_dir / "metadata.yaml"
-        if metadata_file.exists():
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                # Convert ISO format strings back to datetime
-                data["created_at"] = datetime.fromisoformat(data["created_at"])
-                if data["updated_at"]:
-                    data["updated_at"] = datetime.fromisoformat(data["updated_at"])
+        project = load_project_dir(project_dir)
+        if project:
+            projects.append(project)
 
-                # Set slug from directory name if not already set
-                if not data.get("slug"):
-                    data["slug"] = project_dir.name
+    return projects
 
-                projects.append(Project(**data))
 
-    return projects
+def reload_project(project_dir: Path) -> Optional[Project]:
+    """Re-read a project changed outside this process into the cache."""
+    with _cache_lock:
+        project = load_project_dir(project_dir)
+        if project and _project_cache.get(project.id) != project:
+            _project_cache[project.id] = project
+            _index_project_topics(project)
+        return project
+
+
+def evict_project(project_id: str) -> None:
+    """Drop a project removed outside this process from the caches."""
+    with _cache_lock:
+        _project_cache.pop(project_id, None)
+        for topic_id in [
+            topic_id
+            for topic_id, owner_id in _topic_project_index.items()
+            if owner_id == project_id
+        ]:
+            del _topic_project_index[topic_id]
+
+
+def populate_cache(projects: List[Project]) -> None:
+    """Fill the project cache with projects loaded elsewhere, e.g. at warm-up."""
+    global _cache_initialized
+
+    with _cache_lock:
+        _project_cache.update({project.id: project for project in projects})
+        for project in projects:
+            _index_project_topics(project)
+        _cache_initialized = True
+
+
+def list_projects() -> List[Project]:
+    """List all projects from cache."""
+    with _cache_lock:
+        _ensure_cache()
+        return list(_project_cache.values())
 
 
 def create_project(
@@ -151,21 +270,22 @@ def create_project(
 
 def update_project(project_id: str, updated_data: dict) -> Optional[Project]:
     """Update a project with new data."""
-    project = get_project(project_id)
-    if not project:
-        return None
+    with _cache_lock:
+        project = get_project(project_id)
+        if not project:
+            return None
 
-    # Update project fields
-    for key, value in updated_data.items():
-        if hasattr(project, key):
-            setattr(project, key, value)
+        # Update project fields
+        for key, value in updated_data.items():
+            if hasattr(project, key):
+                setattr(project, key, value)
 
-    # Update the timestamp
-    project.updated_at = datetime.now(timezone.utc)
+        # Update the timestamp
+        project.updated_at = datetime.now(timezone.utc)
 
-    # Save the project
-    save_project(project)
-    return project
+        # Save the project
+        save_project(project)
+        return project
 
 
 def mark_project_deleted(project_id: str) -> bool:
@@ -181,7 +301,12 @@ def mark_project_deleted(project_id: str) -> bool:
     # Remove the directory and all contents
     shutil.rmtree(project_path)
 
-    # Remove from cache
+    # Remove from caches and drop the reverse index entries of its topics
+    with _cache_lock:
+        project = _project_cache.pop(project_id, None)
+        for topic_id in project.topic_ids if project else []:
+            if _topic_project_index.get(topic_id) == project_id:
+                del _topic_project_index[topic_id]
     remove_from_entity_cache(project_id)
 
     return True
@@ -192,30 +317,35 @@ def add_topic_to_project(project_id: str, topic_id: str):
     Associate a topic with a project.
     Adjust this logic based on your actual project model and DB functions.
     """
-    project = get_project(project_id)
-    if not project:
-        return None
+    with _cache_lock:
+        project = get_project(project_id)
+        if not project:
+            return None
 
-    if topic_id not in project.topic_ids:
-        project.topic_ids.append(topic_id)
-        project.updated_at = datetime.now(timezone.utc)
-        save_project(project)
+        if topic_id not in project.topic_ids:
+            project.topic_ids.append(topic_id)
+            project.updated_at = datetime.now(timezone.utc)
+            save_project(project)
 
-    return project
+        _topic_project_index[topic_id] = project.id
+        return project
 
 
 def remove_topic_from_project(project_id: str, topic_id: str) -> Optional[Project]:
     """Remove a topic from a project's topic list."""
-    project = get_project(project_id)
-    if not project:
-        return None
-
-    if topic_id in project.topic_ids:
-        project.topic_ids.remove(topic_id)
-        project.updated_at = datetime.now(timezone.utc)
-        save_project(project)
-
-    return project
+    with _cache_lock:
+        project = get_project(project_id)
+        if not project:
+            return None
+
+        if topic_id in project.topic_ids:
+            project.topic_ids.remove(topic_id)
+            project.updated_at = datetime.now(timezone.utc)
+            save_project(project)
+
+        if _topic_project_index.get(topic_id) == project.id:
+            del _topic_project_index[topic_id]
+        return project
 
 
 def get_project_slug_map() -> Dict[str, str]:
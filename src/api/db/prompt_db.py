@@ -4,6 +4,7 @@ Simple database operations for prompts using plain Markdown files.
 
 import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -15,17 +16,21 @@ from .common import get_db_path
 # In-memory cache for prompts
 _prompt_cache: Dict[str, Prompt] = {}
 _cache_initialized = False
+_cache_lock = threading.Lock()
 
 
 def _ensure_cache():
     """Initialize cache if not already done."""
     global _cache_initialized
-    if not _cache_initialized:
-        ensure_db_exists()
-        _copy_default_prompts()
-        prompts = _load_all_prompts_from_disk()
-        _prompt_cache.update({prompt.id: prompt for prompt in prompts})
-        _cache_initialized = True
+    if _cache_initialized:
+        return
+    with _cache_lock:
+        if not _cache_initialized:
+            ensure_db_exists()
+            _copy_default_prompts()
+            prompts = _load_all_prompts_from_disk()
+            _prompt_cache.update({prompt.id: prompt for prompt in prompts})
+            _cache_initialized = True
 
 
 def _copy_default_prompts():
@@ -3,6 +3,7 @@ Database operations for topics using hierarchical folder structure.
 """
 
 import shutil
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -11,7 +12,7 @@ from typing import Dict, List, Optional, Tuple
 import yaml
 
 from ..models.topic import FeedItem, Topic
-from . import article_db, project_db
+from . import article_db, feed_log, project_db, unit_of_work
 from .common import (
     add_to_entity_cache,
     create_slug,
@@ -20,20 +21,31 @@ from .common import (
     find_entity_by_id,
     get_hierarchical_path,
     remove_from_entity_cache,
+    write_file_atomic,
 )
 
 # In-memory cache for topics
 _topic_cache: Dict[str, Topic] = {}
 _cache_initialized = False
 
+# Per topic directory: (lines in its feed log, fields of each logged feed item)
+_feed_log_state: Dict[Path, Tuple[int, Dict[feed_log.FeedKey, Dict]]] = {}
+
+# Guards the caches above and topic writes, which may come from API requests
+# and pipeline workers at the same time
+_cache_lock = threading.RLock()
+
 
 def _ensure_cache():
     """Initialize cache if not already done."""
     global _cache_initialized
-    if not _cache_initialized:
-        topics = _load_all_topics_from_disk()
-        _topic_cache.update({topic.id: topic for topic in topics})
-        _cache_initialized = True
+    if _cache_initialized:
+        return
+    with _cache_lock:
+        if not _cache_initialized:
+            topics = _load_all_topics_from_disk()
+            _topic_cache.update({topic.id: topic for topic in topics})
+            _cache_initialized = True
 
 
 def _load_all_topics_from_disk() -> List[Topic]:
@@ -46,31 +58,158 @@ def _load_all_topics_from_disk() -> List[Topic]:
         for topic_dir in [d for d in project_dir.iterdir() if d.is_dir()]:
             metadata_file = topic_dir / "metadata.yaml"
             if metadata_file.exists():
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    topic_data = yaml.safe_load(f)
-
-                    # Process feed items if present
-                    if "processed_feeds" in topic_data:
-                        processed_feeds = []
-                        for feed_item in topic_data["processed_feeds"]:
-                            if "accessed_at" in feed_item and isinstance(
-                                feed_item["accessed_at"], str
-                            ):
-                                feed_item["accessed_at"] = datetime.fromisoformat(
-                                    feed_item["accessed_at"]
-                                )
-                            processed_feeds.append(FeedItem(**feed_item))
-                        topic_data["processed_feeds"] = processed_feeds
-
-                    # Set slug from directory name if not already set
-                    if not topic_data.get("slug"):
-                        topic_data["slug"] = topic_dir.name
-
-                    topics.append(Topic(**topic_data))
+                topics.append(_topic_from_files(topic_dir, topic_dir.name))
 
     return topics
 
 
+def load_topic_dir(topic_dir: Path, data: Optional[dict] = None) -> Optional[Topic]:
+    """
+    Load the topic stored in a directory, or None if it has no metadata.
+
+    Args:
+        topic_dir: The topic directory
+        data: Its metadata if already parsed, e.g. while indexing the vault
+    """
+    if data is None and not (topic_dir / "metadata.yaml").exists():
+        return None
+    return _topic_from_files(topic_dir, topic_dir.name, data)
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Get the (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def reload_topic(topic_dir: Path) -> Optional[Topic]:
+    """
+    Re-read a topic changed outside this process into the cache.
+
+    The topic is read without holding the lock. A topic with a save pending
+    in a write session, or written again while it was read, keeps its cached
+    object.
+    """
+    metadata_file = topic_dir / "metadata.yaml"
+    signature = _file_signature(metadata_file)
+    topic = load_topic_dir(topic_dir)
+    if topic is None:
+        return None
+    with _cache_lock:
+        cached = _topic_cache.get(topic.id)
+        if cached is not None and (
+            unit_of_work.has_pending("topic", topic.id)
+            or _file_signature(metadata_file) != signature
+        ):
+            return cached
+        if cached != topic:
+            _topic_cache[topic.id] = topic
+        return topic
+
+
+def evict_topic(topic_id: str, topic_dir: Path) -> None:
+    """Drop a topic removed outside this process from the caches."""
+    with _cache_lock:
+        _topic_cache.pop(topic_id, None)
+        _feed_log_state.pop(topic_dir, None)
+
+
+def populate_cache(topics: List[Topic]) -> None:
+    """Fill the topic cache with topics loaded elsewhere, e.g. at warm-up."""
+    global _cache_initialized
+
+    with _cache_lock:
+        _topic_cache.update({topic.id: topic for topic in topics})
+        _cache_initialized = True
+
+
+def _topic_from_files(
+    topic_path: Path, default_slug: str, data: Optional[dict] = None
+) -> Topic:
+    """Load a topic from its metadata.yaml, unless already parsed, and feed log."""
+    if data is None:
+        with open(topic_path / "metadata.yaml", "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+
+    # Feed items stored inline by older versions are merged with the log
+    data["processed_feeds"] = _load_processed_feeds(
+        topic_path, data.get("processed_feeds") or []
+    )
+
+    # Set slug from directory name if not already set
+    if not data.get("slug"):
+        data["slug"] = default_slug
+
+    return Topic(**data)
+
+
+def _load_processed_feeds(topic_path: Path, inline_items: List[dict]) -> List[FeedItem]:
+    """
+    Load the processed feed items of a topic, the log winning over inline items.
+
+    The log is read without holding the lock. Its state is only kept for the
+    next save if the log was not appended to meanwhile; otherwise the save
+    reads it again.
+    """
+    log_file = feed_log.get_feed_log_path(topic_path)
+    signature = _file_signature(log_file)
+    records, line_count = feed_log.read_feed_log(topic_path)
+
+    items = {
+        feed_log.feed_item_key(item): item for item in load_feed_items(inline_items)
+    }
+    logged = {}
+    for key, record in records.items():
+        item = FeedItem(**record)
+        items[key] = item
+        logged[key] = dict(item.__dict__)
+
+    with _cache_lock:
+        if _file_signature(log_file) == signature:
+            _feed_log_state[topic_path] = (line_count, logged)
+        else:
+            _feed_log_state.pop(topic_path, None)
+    return list(items.values())
+
+
+def _save_processed_feeds(topic: Topic, topic_path: Path) -> None:
+    """Append the new and changed processed feed items of a topic to its log."""
+    with _cache_lock:
+        if topic_path not in _feed_log_state:
+            # Holding the lock, no save can append to the log while it is read
+            _load_processed_feeds(topic_path, [])
+        line_count, logged = _feed_log_state[topic_path]
+
+        current = {}
+        changed = []
+        for item in topic.processed_feeds:
+            key = feed_log.feed_item_key(item)
+            current[key] = item
+            if logged.get(key) != item.__dict__:
+                changed.append(item)
+        stale = any(key not in current for key in logged)
+
+        if stale or feed_log.needs_compaction(line_count + len(changed), len(current)):
+            feed_log.write_feed_log(
+                topic_path,
+                [feed_log.feed_item_record(item) for item in current.values()],
+            )
+            line_count = len(current)
+            logged = {key: dict(item.__dict__) for key, item in current.items()}
+        elif changed:
+            feed_log.append_feed_log(
+                topic_path, [feed_log.feed_item_record(item) for item in changed]
+            )
+            line_count += len(changed)
+            for item in changed:
+                logged[feed_log.feed_item_key(item)] = dict(item.__dict__)
+
+        _feed_log_state[topic_path] = (line_count, logged)
+
+
 def get_topic_path(project_slug: str, topic_slug: str) -> Path:
     """Get path to a topic's directory within a project."""
     return get_hierarchical_path(project_slug, topic_slug)
@@ -94,89 +233,76 @@ def get_topic_location(topic_id: str) -> Tuple[Optional[str], Optional[str]]:
         # Ensure we're returning strings, not Path objects
         return str(project_slug), str(topic_slug)
 
-    # Fallback to checking projects
-    project_slug_map = project_db.get_project_slug_map()
-
-    # For each project
-    for project in project_db.list_projects():
-        if topic_id in project.topic_ids:
-            # Topic belongs to this project
-            project_slug = project_slug_map.get(project.id, "")
-            if project_slug:  # Check if we got a valid slug
-                # Find the topic within this project
-                topic = get_topic(topic_id)
-                if topic:
-                    # Create a topic slug (either use existing or generate new one)
-                    if topic.slug:
-                        return project_slug, topic.slug
-                    else:
-                        return project_slug, create_slug(topic.name)
+    # Fallback to the project that owns the topic
+    project = project_db.get_project_for_topic(topic_id)
+    if project:
+        project_slug = project.slug or create_slug(project.title)
+        topic = get_topic(topic_id)
+        if topic:
+            # Create a topic slug (either use existing or generate new one)
+            return project_slug, topic.slug or create_slug(topic.name)
 
     return None, None
 
 
 def save_topic(topic: Topic) -> None:
-    """Save topic to YAML file in its project and slug-named folder."""
-    # Find the project this topic belongs to
-    project_id = None
-    for project in project_db.list_projects():
-        if topic.id in project.topic_ids:
-            project_id = project.id
-            break
-
-    if not project_id:
-        raise ValueError(
-            f"Cannot save topic {topic.id}: not associated with any project"
-        )
-
-    # Get project slug
-    project_result = project_db.get_project(project_id)
-    if project_result is None:
-        raise ValueError(f"Cannot find project {project_id}")
-
-    # At this point we know project is not None
-    project = project_result  # Now project has the type Project, not Optional[Project]
+    """
+    Save topic to YAML file in its project and slug-named folder.
 
-    # Create safe project slug - always use a string
-    safe_project_slug: str = (
-        project.slug if project.slug else create_slug(project.title)
-    )
+    Inside a write session the write is deferred until the session flushes.
+    """
+    with _cache_lock:
+        if unit_of_work.defer_save("topic", topic, _write_topic):
+            _topic_cache[topic.id] = topic
+            return
+        _write_topic(topic)
+
+
+def _write_topic(topic: Topic) -> None:
+    """Write a topic to disk and update the caches."""
+    with _cache_lock:
+        # Find the project this topic belongs to using the reverse index
+        project = project_db.get_project_for_topic(topic.id)
+        if project is None:
+            raise ValueError(
+                f"Cannot save topic {topic.id}: not associated with any project"
+            )
+
+        # Create safe project slug - always use a string
+        safe_project_slug: str = (
+            project.slug if project.slug else create_slug(project.title)
+        )
 
-    # Use existing topic slug if available, otherwise create a new one
-    if topic.slug:
-        topic_slug = topic.slug
-    else:
-        # Get the project path for passing to ensure_unique_slug
-        project_path = get_hierarchical_path(safe_project_slug)
-        # Create unique topic slug
-        topic_slug = ensure_unique_slug(topic.name, "topic", project_path)
-        topic.slug = topic_slug
+        # Use existing topic slug if available, otherwise create a new one
+        if topic.slug:
+            topic_slug = topic.slug
+        else:
+            # Get the project path for passing to ensure_unique_slug
+            project_path = get_hierarchical_path(safe_project_slug)
+            # Create unique topic slug
+            topic_slug = ensure_unique_slug(topic.name, "topic", project_path)
+            topic.slug = topic_slug
 
-    # Build path
-    topic_path = get_hierarchical_path(safe_project_slug, topic_slug)
-    ensure_path_exists(topic_path)
+        # Build path
+        topic_path = get_hierarchical_path(safe_project_slug, topic_slug)
+        ensure_path_exists(topic_path)
 
-    # Create metadata file
-    filename = topic_path / "metadata.yaml"
+        # Processed feed items go to the append-only feed log
+        _save_processed_feeds(topic, topic_path)
 
-    # Convert to dict and save
-    topic_dict = topic.model_dump()
+        # Create metadata file
+        filename = topic_path / "metadata.yaml"
 
-    # Process feed items if present
-    if "processed_feeds" in topic_dict:
-        for item in topic_dict["processed_feeds"]:
-            if "needs_further_processing" in item:
-                del item["needs_further_processing"]
-            if "accessed_at" in item and not isinstance(item["accessed_at"], str):
-                item["accessed_at"] = item["accessed_at"].isoformat()
+        # Convert to dict and save
+        topic_dict = topic.model_dump(exclude={"processed_feeds"})
 
-    with open(filename, "w", encoding="utf-8") as f:
-        yaml.safe_dump(topic_dict, f, sort_keys=False, allow_unicode=True)
-        f.flush()  # Ensure data is written to disk
+        write_file_atomic(
+            filename, yaml.safe_dump(topic_dict, sort_keys=False, allow_unicode=True)
+        )
 
-    # Update cache
-    _topic_cache[topic.id] = topic
-    add_to_entity_cache(topic.id, topic_path, "topic")
+        # Update cache
+        _topic_cache[topic.id] = topic
+        add_to_entity_cache(topic.id, topic_path, "topic")
 
 
 def get_topic(topic_id: str) -> Optional[Topic]:
@@ -184,41 +310,28 @@ def get_topic(topic_id: str) -> Optional[Topic]:
     _ensure_cache()
 
     # First check in-memory cache
-    if topic_id in _topic_cache:
-        return _topic_cache[topic_id]
+    with _cache_lock:
+        if topic_id in _topic_cache:
+            return _topic_cache[topic_id]
 
-    # If not in memory cache, try to find using entity cache
+    # If not in memory cache, try to find using entity cache and read the
+    # topic without holding the lock
     topic_path, entity_type = find_entity_by_id(topic_id)
+    if not topic_path or entity_type != "topic":
+        return None
+    metadata_file = topic_path / "metadata.yaml"
+    signature = _file_signature(metadata_file)
+    topic = load_topic_dir(topic_path)
+    if topic is None:
+        return None
 
-    if topic_path and entity_type == "topic":
-        metadata_file = topic_path / "metadata.yaml"
-
-        if metadata_file.exists():
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-                # Process feed items if present
-                if "processed_feeds" in data:
-                    processed_feeds = []
-                    for feed_item in data["processed_feeds"]:
-                        if "accessed_at" in feed_item and isinstance(
-                            feed_item["accessed_at"], str
-                        ):
-                            feed_item["accessed_at"] = datetime.fromisoformat(
-                                feed_item["accessed_at"]
-                            )
-                        processed_feeds.append(FeedItem(**feed_item))
-                    data["processed_feeds"] = processed_feeds
-
-                # Set slug from directory name if not already set
-                if not data.get("slug"):
-                    data["slug"] = topic_path.name
-
-                topic = Topic(**data)
-                _topic_cache[topic_id] = topic
-                return topic
-
-    return None
+    # A topic saved while it was read is newer than the copy from disk
+    with _cache_lock:
+        if topic_id in _topic_cache:
+            return _topic_cache[topic_id]
+        if _file_signature(metadata_file) == signature:
+            _topic_cache[topic_id] = topic
+        return topic
 
 
 def get_topic_by_slug(project_slug: str, topic_slug: str) -> Optional[Topic]:
@@ -229,41 +342,23 @@ def get_topic_by_slug(project_slug: str, topic_slug: str) -> Optional[Topic]:
     if not filename.exists():
         return None
 
-    with open(filename, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-        # Process feed items if present
-        if "processed_feeds" in data:
-            processed_feeds = []
-            for feed_item in data["processed_feeds"]:
-                if "accessed_at" in feed_item and isinstance(
-                    feed_item["accessed_at"], str
-                ):
-                    feed_item["accessed_at"] = datetime.fromisoformat(
-                        feed_item["accessed_at"]
-                    )
-                processed_feeds.append(FeedItem(**feed_item))
-            data["processed_feeds"] = processed_feeds
-
-        # Set slug from path if not already set
-        if not data.get("slug"):
-            data["slug"] = topic_slug
-
-        topic = Topic(**data)
-        _topic_cache[topic.id] = topic
-        return topic
+    topic = _topic_from_files(path, topic_slug)
+    with _cache_lock:
+        return _topic_cache.setdefault(topic.id, topic)
 
 
 def list_topics() -> List[Topic]:
     """List all active topics from cache."""
-    _ensure_cache()
-    return list(_topic_cache.values())
+    with _cache_lock:
+        _ensure_cache()
+        return list(_topic_cache.values())
 
 
 def load_topics() -> Dict[str, Topic]:
     """Load all topics into a dictionary from cache."""
-    _ensure_cache()
-    return dict(_topic_cache)
+    with _cache_lock:
+        _ensure_cache()
+        return dict(_topic_cache)
 
 
 def create_topic(name: str, description: str, project_id: str) -> Topic:
@@ -318,39 +413,38 @@ def mark_topic_deleted(topic_id: str) -> bool:
     shutil.rmtree(topic_path)
 
     # Remove from caches
-    _topic_cache.pop(topic_id, None)
+    evict_topic(topic_id, topic_path)
     remove_from_entity_cache(topic_id)
 
-    # Remove this topic from all projects that reference it
-    projects = project_db.list_projects()
-    for project in projects:
-        if topic_id in project.topic_ids:
-            project.topic_ids.remove(topic_id)
-            project_db.save_project(project)
+    # Remove this topic from the project that references it
+    project = project_db.get_project_for_topic(topic_id)
+    if project:
+        project_db.remove_topic_from_project(project.id, topic_id)
 
     return True
 
 
 def update_topic(topic_id: str, updated_data: dict) -> Optional[Topic]:
     """Update a topic with new data."""
-    topic = get_topic(topic_id)
-    if not topic:
-        return None
+    with _cache_lock:
+        topic = get_topic(topic_id)
+        if not topic:
+            return None
 
-    # Get project and topic info before update
-    project_slug, old_topic_slug = get_topic_location(topic_id)
-    if not project_slug or not old_topic_slug:
-        return None
+        # Get project and topic info before update
+        project_slug, old_topic_slug = get_topic_location(topic_id)
+        if not project_slug or not old_topic_slug:
+            return None
 
-    # Update topic fields
-    for key, value in updated_data.items():
-        if hasattr(topic, key):
-            setattr(topic, key, value)
+        # Update topic fields
+        for key, value in updated_data.items():
+            if hasattr(topic, key):
+                setattr(topic, key, value)
 
-    # Just save in place
-    save_topic(topic)
+        # Just save in place
+        save_topic(topic)
 
-    return topic
+        return topic
 
 
 def load_feed_items(items_data: List[dict]) -> List[FeedItem]:
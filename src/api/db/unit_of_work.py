@@ -0,0 +1,172 @@
+"""
+Unit of work that coalesces topic and article saves.
+
+Inside a write_session, save_topic and save_article only mark the entity as
+dirty. Each dirty entity is written once when the session ends or when flush
+is called, articles before topics so a topic never references an article
+that is not on disk yet. Pending articles are served by get_article so the
+rest of the session sees its own changes.
+
+Sessions are tracked in a context variable, so each thread or task has its
+own and concurrent workers never flush each other's saves.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Entity kinds in the order they are written
+ENTITY_KINDS = ("article", "topic")
+
+# Pending entities per kind: entity_id -> (entity, writer)
+Session = Dict[str, Dict[str, Tuple[Any, Callable[[Any], None]]]]
+
+_session: ContextVar[Optional[Session]] = ContextVar("write_session", default=None)
+_session_stats = {"deferred": 0, "written": 0}
+_stats_lock = threading.Lock()
+
+# Number of sessions holding an unwritten save per (kind, entity_id), so code
+# outside the sessions, e.g. the vault watcher, can leave those entities alone
+_pending_counts: Dict[Tuple[str, str], int] = {}
+
+
+def in_session() -> bool:
+    """Check whether saves are currently being deferred."""
+    return _session.get() is not None
+
+
+def defer_save(kind: str, entity: Any, writer: Callable[[Any], None]) -> bool:
+    """
+    Record an entity as dirty if a write session is active.
+
+    Args:
+        kind: Entity kind, one of ENTITY_KINDS
+        entity: The entity to save, identified by its id
+        writer: Function that writes the entity to disk
+
+    Returns:
+        True if the save was deferred, False if the caller should write now
+    """
+    session = _session.get()
+    if session is None:
+        return False
+    with _stats_lock:
+        if entity.id not in session[kind]:
+            key = (kind, entity.id)
+            _pending_counts[key] = _pending_counts.get(key, 0) + 1
+        _session_stats["deferred"] += 1
+    session[kind][entity.id] = (entity, writer)
+    return True
+
+
+def _release(kind: str, entity_id: str) -> None:
+    """Record that a session no longer holds an unwritten save of an entity."""
+    with _stats_lock:
+        key = (kind, entity_id)
+        _pending_counts[key] -= 1
+        if not _pending_counts[key]:
+            del _pending_counts[key]
+
+
+def has_pending(kind: str, entity_id: str) -> bool:
+    """Check whether any session holds an unwritten save of an entity."""
+    with _stats_lock:
+        return (kind, entity_id) in _pending_counts
+
+
+def get_pending(kind: str, entity_id: str) -> Optional[Any]:
+    """Return an entity saved in the current session but not yet written."""
+    session = _session.get()
+    if session is None:
+        return None
+    pending = session[kind].get(entity_id)
+    return pending[0] if pending else None
+
+
+def flush() -> int:
+    """
+    Write all dirty entities of the current session to disk.
+
+    Returns:
+        Number of entities written
+    """
+    session = _session.get()
+    if session is None:
+        return 0
+
+    # Writers save directly while flushing, including nested saves
+    token = _session.set(None)
+    written = 0
+    try:
+        for kind in ENTITY_KINDS:
+            pending = session[kind]
+            while pending:
+                entity_id = next(iter(pending))
+                entity, writer = pending[entity_id]
+                writer(entity)
+                del pending[entity_id]
+                _release(kind, entity_id)
+                written += 1
+    finally:
+        _session.reset(token)
+        with _stats_lock:
+            _session_stats["written"] += written
+    return written
+
+
+async def aflush() -> int:
+    """
+    Write all dirty entities of the current session in a worker thread.
+
+    Used by coroutines so the writes do not block the event loop. If the
+    calling task is cancelled, the writes are still awaited before the
+    cancellation propagates, so the session is never flushed twice at once.
+
+    Returns:
+        Number of entities written
+    """
+    if _session.get() is None:
+        return 0
+    # The worker thread runs in a copy of this context, sharing the session
+    writes = asyncio.ensure_future(asyncio.to_thread(flush))
+    try:
+        return await asyncio.shield(writes)
+    except asyncio.CancelledError:
+        await writes
+        raise
+
+
+@contextmanager
+def write_session() -> Iterator[None]:
+    """
+    Defer topic and article saves until the end of the block.
+
+    Nested sessions join the outer one, which writes on exit. Dirty entities
+    are also written if the block raises, matching what direct saves would
+    have persisted.
+    """
+    if _session.get() is not None:
+        yield
+        return
+
+    session: Session = {kind: {} for kind in ENTITY_KINDS}
+    token = _session.set(session)
+    try:
+        yield
+    finally:
+        try:
+            flush()
+        finally:
+            _session.reset(token)
+            # Saves left behind by a failed write are dropped with the session
+            for kind in ENTITY_KINDS:
+                for entity_id in session[kind]:
+                    _release(kind, entity_id)
+
+
+def get_session_stats() -> Dict[str, int]:
+    """Get the number of deferred saves and of entities actually written."""
+    with _stats_lock:
+        return dict(_session_stats)
@@ -0,0 +1,67 @@
+"""
+Parallel warm-up of the vault caches.
+
+Cold start used to walk the vault three times on a single thread: once for
+the entity index, once for projects and once for topics. warm_up_vault walks
+it once through the entity index and parses the metadata files with a pool
+of worker threads, filling the entity, project and topic caches together.
+Project and topic metadata parsed while refreshing the index is reused, so
+each metadata file is read at most once.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import common, project_db, topic_db
+
+
+def warm_up_vault(max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load the entity, project and topic caches using a worker pool.
+
+    Args:
+        max_workers: Number of worker threads, defaults to the executor default
+
+    Returns:
+        Dict with the number of files read, entities found and seconds taken
+    """
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="vault-loader"
+    ) as executor:
+        metadata: Dict[Path, Dict] = {}
+        index_files = common.initialize_entity_cache(executor, metadata)
+
+        project_dirs = common.get_indexed_dirs("project")
+        topic_dirs = common.get_indexed_dirs("topic")
+        projects = [
+            project
+            for project in executor.map(
+                lambda path: project_db.load_project_dir(path, metadata.get(path)),
+                project_dirs,
+            )
+            if project
+        ]
+        topics = [
+            topic
+            for topic in executor.map(
+                lambda path: topic_db.load_topic_dir(path, metadata.get(path)),
+                topic_dirs,
+            )
+            if topic
+        ]
+        reparsed = sum(path not in metadata for path in project_dirs + topic_dirs)
+
+    project_db.populate_cache(projects)
+    topic_db.populate_cache(topics)
+
+    return {
+        "files": index_files + reparsed,
+        "entities": common.get_entity_cache_stats()["entities"],
+        "projects": len(projects),
+        "topics": len(topics),
+        "seconds": time.perf_counter() - start,
+    }
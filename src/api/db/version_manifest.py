@@ -0,0 +1,202 @@
+"""
+Per-topic manifest of article versions.
+
+Every topic directory holds a versions.jsonl log listing the articles stored
+below it in the order they were saved, with their version number, the id of
+the version they refine, timestamps and the URL of the feed item that
+triggered them. Version history queries read this single file instead of
+loading every article along the previous/next version chain.
+
+Saving an article appends only its entry; a deleted article appends a
+removal record, and the last record for an id wins on load. The log is
+rewritten with one line per version once it holds mostly superseded
+records. Parsed logs are kept per topic and re-read only when the file
+changed on disk.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..models.article import Article
+
+MANIFEST_FILE = "versions.jsonl"
+
+# Compact once the log has this many lines and at least twice as many lines
+# as it holds versions
+COMPACT_MIN_LINES = 256
+
+# Per topic directory: ((mtime_ns, size) of the log when parsed, lines in the
+# log, entries by article id in save order)
+Manifest = Tuple[int, Dict[str, Dict]]
+_manifests: Dict[Path, Tuple[Tuple[int, int], int, Dict[str, Dict]]] = {}
+_manifest_lock = threading.Lock()
+
+
+def get_manifest_path(topic_path: Path) -> Path:
+    """Return the path of the version manifest of a topic directory."""
+    return topic_path / MANIFEST_FILE
+
+
+def manifest_entry(article: Article) -> Dict:
+    """Build the manifest entry describing an article version."""
+    return {
+        "id": article.id,
+        "version": article.version,
+        "previous_version": article.previous_version,
+        "created_at": article.created_at.isoformat(),
+        "updated_at": article.updated_at.isoformat() if article.updated_at else None,
+        "source_feed_url": article.source_feed.url if article.source_feed else None,
+    }
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Get the (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_manifest(topic_path: Path) -> Optional[Manifest]:
+    """
+    Read the manifest log of a topic.
+
+    Returns:
+        Tuple of (lines read, entries by id), or None if there is no manifest
+    """
+    entries: Dict[str, Dict] = {}
+    line_count = 0
+    try:
+        with open(get_manifest_path(topic_path), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    article_id = record["id"]
+                except (ValueError, KeyError, TypeError):
+                    # Skip a line left incomplete by an interrupted write
+                    continue
+                line_count += 1
+                if record.get("removed"):
+                    entries.pop(article_id, None)
+                else:
+                    entries[article_id] = record
+    except OSError:
+        return None
+    return line_count, entries
+
+
+def _load(topic_path: Path) -> Optional[Manifest]:
+    """Get the parsed manifest of a topic, re-reading it only if it changed."""
+    signature = _signature(get_manifest_path(topic_path))
+    cached = _manifests.get(topic_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    manifest = _read_manifest(topic_path)
+    if manifest is not None and signature is not None:
+        _manifests[topic_path] = (signature, *manifest)
+    else:
+        _manifests.pop(topic_path, None)
+    return manifest
+
+
+def _dump(record: Dict) -> str:
+    """Serialize a manifest record as one line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _write(
+    topic_path: Path, line_count: int, entries: Dict[str, Dict], records: List[Dict]
+) -> None:
+    """Append records to a topic's log, rewriting it when due, and cache it."""
+    manifest_file = get_manifest_path(topic_path)
+    line_count += len(records)
+    if not manifest_file.exists() or (
+        line_count >= COMPACT_MIN_LINES and line_count >= 2 * len(entries)
+    ):
+        tmp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write("".join(_dump(entry) for entry in entries.values()))
+        os.replace(tmp_file, manifest_file)
+        line_count = len(entries)
+    else:
+        with open(manifest_file, "a", encoding="utf-8") as f:
+            f.write("".join(_dump(record) for record in records))
+    _manifests[topic_path] = (_signature(manifest_file), line_count, entries)
+
+
+def load_manifest(topic_path: Path) -> Optional[List[Dict]]:
+    """
+    Load the version entries of a topic.
+
+    Returns:
+        List of entries in save order, or None if there is no readable manifest
+    """
+    with _manifest_lock:
+        manifest = _load(topic_path)
+        return list(manifest[1].values()) if manifest is not None else None
+
+
+def record_versions(topic_path: Path, articles: List[Article]) -> None:
+    """Add or update the manifest entries of articles, writing only on change."""
+    with _manifest_lock:
+        line_count, entries = _load(topic_path) or (0, {})
+        changed = []
+        for article in articles:
+            entry = manifest_entry(article)
+            if entries.get(article.id) != entry:
+                entries[article.id] = entry
+                changed.append(entry)
+        if changed:
+            _write(topic_path, line_count, entries, changed)
+
+
+def remove_version(topic_path: Path, article_id: str) -> None:
+    """Remove the manifest entry of a deleted article."""
+    with _manifest_lock:
+        manifest = _load(topic_path)
+        if manifest is None or article_id not in manifest[1]:
+            return
+        line_count, entries = manifest
+        del entries[article_id]
+        _write(topic_path, line_count, entries, [{"id": article_id, "removed": True}])
+
+
+def get_version_chain(entries: List[Dict], article_id: str) -> Optional[List[Dict]]:
+    """
+    Get the entries of the version chain containing an article.
+
+    Returns:
+        Entries ordered from oldest to newest, or None if the article is not listed
+    """
+    by_id = {entry["id"]: entry for entry in entries}
+    if article_id not in by_id:
+        return None
+    next_ids = {
+        entry["previous_version"]: entry["id"]
+        for entry in entries
+        if entry.get("previous_version")
+    }
+
+    # Go back to the earliest version that is still listed
+    current = by_id[article_id]
+    seen = {article_id}
+    while current.get("previous_version") in by_id:
+        if current["previous_version"] in seen:
+            break
+        current = by_id[current["previous_version"]]
+        seen.add(current["id"])
+
+    # Collect all versions going forward
+    chain = [current]
+    seen = {current["id"]}
+    while next_ids.get(chain[-1]["id"]) in by_id:
+        next_id = next_ids[chain[-1]["id"]]
+        if next_id in seen:
+            break
+        chain.append(by_id[next_id])
+        seen.add(next_id)
+    return chain
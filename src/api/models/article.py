@@ -1,7 +1,7 @@
 """Article model definitions."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -40,7 +40,10 @@ class Article(BaseModel):
     )
 
     def add_representation(
-        self, content_type: str, content: str, metadata: Optional[Dict] = None
+        self,
+        content_type: str,
+        content: Union[str, bytes],
+        metadata: Optional[Dict] = None,
     ) -> None:
         """Add a new representation to the article."""
         if metadata is None:
@@ -48,3 +51,10 @@ class Article(BaseModel):
         self.representations.append(
             Representation(type=content_type, content=content, metadata=metadata)
         )
+
+    def get_latest_text_representation(self) -> Optional[Representation]:
+        """Return the newest representation holding text, skipping binary ones."""
+        for representation in reversed(self.representations):
+            if not representation.is_binary:
+                return representation
+        return None
@@ -1,9 +1,18 @@
 """Topic-related data models."""
 
+import base64
+import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    Field,
+    FieldSerializationInfo,
+    PrivateAttr,
+    field_serializer,
+)
 
 from .feed_item import FeedItem
 
@@ -59,7 +68,10 @@ class Representation(BaseModel):
     """Model for content representations."""
 
     type: str = Field(description="Type of representation (e.g., 'markdown', 'html')")
-    content: str = Field(description="Content of this representation")
+    content: Union[str, bytes] = Field(
+        description="Content of this representation, bytes for binary data "
+        "(base64 encoded in JSON)"
+    )
     created_at: datetime = Field(
         default_factory=datetime.now,
         description="Timestamp when this representation was created",
@@ -69,6 +81,91 @@ class Representation(BaseModel):
         description="Additional metadata associated with this representation",
     )
 
+    # File the content is read from on first access, None once it is in memory
+    _content_path: Optional[Path] = PrivateAttr(default=None)
+    _content_binary: bool = PrivateAttr(default=False)
+
+    @classmethod
+    def from_file(
+        cls, path: Path, binary: bool = False, **data: Any
+    ) -> "Representation":
+        """
+        Create a representation whose content is read from a file on first access.
+
+        Args:
+            path: File holding the representation content
+            binary: Whether the file holds binary data
+            **data: The remaining representation fields
+        """
+        representation = cls(content="", **data)
+        representation._content_path = path
+        representation._content_binary = binary
+        return representation
+
+    @property
+    def content_path(self) -> Optional[Path]:
+        """Path the content will be loaded from, or None if it is in memory."""
+        return self._content_path
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether this representation holds binary data."""
+        if self._content_path is not None:
+            return self._content_binary
+        return isinstance(self.content, bytes) or bool(
+            self.metadata and self.metadata.get("binary") is True
+        )
+
+    def get_bytes(self) -> bytes:
+        """
+        Return the content as bytes.
+
+        Binary content held as a hex string, as written by older versions,
+        is decoded; text content is encoded as UTF-8.
+        """
+        content = self.content
+        if isinstance(content, bytes):
+            return content
+        if self.metadata and self.metadata.get("binary") is True:
+            return bytes.fromhex(content)
+        return content.encode("utf-8")
+
+    def get_size(self) -> int:
+        """Return the content size in bytes without loading file-backed content."""
+        if self._content_path is not None and self._content_binary:
+            return os.path.getsize(self._content_path)
+        return len(self.get_bytes())
+
+    def _load_content(self) -> None:
+        """Read the content from its backing file."""
+        path = self._content_path
+        if self._content_binary:
+            with open(path, "rb") as f:
+                content = f.read()
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        self.__dict__["content"] = content
+        self._content_path = None
+
+    def __getattribute__(self, name: str) -> Any:
+        """Load file-backed content the first time it is accessed."""
+        if name == "content":
+            private = super().__getattribute__("__pydantic_private__")
+            if private and private.get("_content_path") is not None:
+                self._load_content()
+        return super().__getattribute__(name)
+
+    @field_serializer("content")
+    def _serialize_content(
+        self, content: Union[str, bytes], info: FieldSerializationInfo
+    ) -> Union[str, bytes]:
+        """Serialize the content, loading it from disk if needed."""
+        content = self.content
+        if isinstance(content, bytes) and info.mode_is_json():
+            return base64.b64encode(content).decode("ascii")
+        return content
+
 
 class Topic(TopicBase):
     """Complete topic model."""
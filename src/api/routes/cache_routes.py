@@ -0,0 +1,43 @@
+"""Feed cache API routes."""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException
+
+from api.db.cache_manager import cleanup_cache, get_cache_stats, purge_connector
+from utils.logging import error, info
+
+router = APIRouter()
+
+
+@router.get(
+    "/cache/stats",
+    summary="Get Cache Statistics",
+    description="Returns the size of the feed cache and its hit, miss, expiration and eviction counters since startup, in total and per connector",
+    response_description="Cache size, compression and running counters with a per-connector breakdown",
+)
+async def get_cache_stats_route() -> Dict[str, Any]:
+    """Get feed cache statistics."""
+    return get_cache_stats()
+
+
+@router.post(
+    "/cache/cleanup",
+    summary="Clean Up Cache",
+    description="Removes expired entries and the oldest entries beyond the size limit, or all entries of one connector if a connector is given",
+    response_description="The number of removed cache entries",
+    responses={500: {"description": "Internal server error"}},
+)
+async def cleanup_cache_route(connector: Optional[str] = None) -> Dict[str, Any]:
+    """Clean up the feed cache or purge the entries of a connector."""
+    try:
+        if connector:
+            removed = purge_connector(connector)
+            info("CACHE", "Purged connector", f"{connector}: {removed} entries")
+        else:
+            removed = cleanup_cache()
+            info("CACHE", "Cleaned up", f"{removed} entries")
+        return {"removed": removed, "connector": connector}
+    except Exception as e:
+        error("CACHE", "Cleanup error", str(e))
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
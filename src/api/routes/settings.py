@@ -1,15 +1,13 @@
-import os
 import sys
-from pathlib import Path
 from typing import Dict
 
 import webview
-import yaml
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from services.settings_service import load_settings, save_settings
+
 router = APIRouter()
-SETTINGS_FILE = "settings.yaml"
 
 
 class LLMTaskSettings(BaseModel):
@@ -29,30 +27,6 @@ class LLMSettings(BaseModel):
     )
 
 
-def load_settings():
-    """Load settings from YAML file"""
-    if os.path.exists(SETTINGS_FILE):
-        with open(SETTINGS_FILE, "r") as f:
-            return yaml.safe_load(f) or {}
-    return {}
-
-
-def save_settings(settings):
-    """Save settings to YAML file"""
-    # Convert any Path objects to strings before saving
-    serializable_settings = {}
-    for key, value in settings.items():
-        if isinstance(value, Path):
-            serializable_settings[key] = str(value)
-        elif isinstance(value, dict):
-            serializable_settings[key] = value
-        else:
-            serializable_settings[key] = str(value)
-
-    with open(SETTINGS_FILE, "w") as f:
-        yaml.safe_dump(serializable_settings, f, sort_keys=False, allow_unicode=True)
-
-
 @router.get(
     "/settings/db-path",
     summary="Get Database Path",
@@ -14,7 +14,7 @@ from api.db.topic_db import (
 from api.models.topic import Topic, TopicCreate, TopicUpdate
 from curator.topic_updater import (
     handle_topic_publishing,
-    process_feed_item,
+    queue_article_generation,
     queue_topic_update,
 )
 from services.pexels_service import get_random_thumbnail
@@ -27,7 +27,7 @@ router = APIRouter()
 
 def request_article_generation(topic_id: str):
     """Background task to request article generation."""
-    process_feed_item(topic_id)
+    queue_article_generation(topic_id)
 
 
 def request_topic_update(topic_id: str):
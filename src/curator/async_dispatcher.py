@@ -0,0 +1,176 @@
+"""
+Asyncio dispatcher that curates feed items concurrently.
+
+Feed items are run through the curator graph with aprocess_feed_item on an
+event loop in a dedicated thread. Items of different topics are curated
+concurrently, at most max_concurrency at a time; items of one topic are
+curated one at a time in the order they were submitted, so concurrent
+refinements never fork article versions. Each LLM request additionally holds
+a slot of its provider, see llm_service.provider_slot.
+
+The loop state is only touched from the loop thread, except for starting
+and stopping, which are guarded by a lock.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, Optional
+
+from api.models.feed_item import FeedItem
+from curator.graph_workflow import aprocess_feed_item
+from utils.logging import info, warning
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_dispatcher_lock = threading.Lock()
+
+# Limits the items being curated across all topics
+_semaphore: Optional[asyncio.Semaphore] = None
+
+# Lock per topic and the number of items holding or waiting for it
+_topic_locks: Dict[str, asyncio.Lock] = {}
+_topic_jobs: Dict[str, int] = {}
+
+# Set while stopping, so waiting items are dropped instead of curated
+_stopping = False
+_running = 0
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run the event loop until stopped, then release its resources."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
+
+
+def start_dispatcher(max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+    """
+    Start the event loop thread if it is not running.
+
+    Args:
+        max_concurrency: Maximum number of items curated at the same time
+    """
+    global _loop, _thread, _semaphore, _stopping
+
+    with _dispatcher_lock:
+        if _loop is not None:
+            return
+        _semaphore = asyncio.Semaphore(max_concurrency)
+        _stopping = False
+        _loop = asyncio.new_event_loop()
+        _thread = threading.Thread(
+            target=_run_loop, args=(_loop,), name="curation-loop", daemon=True
+        )
+        _thread.start()
+        info(
+            "SYSTEM",
+            "Curation dispatcher started",
+            f"{max_concurrency} concurrent items",
+        )
+
+
+def stop_dispatcher(timeout: float = 5) -> None:
+    """
+    Stop the event loop thread after the items being curated.
+
+    Items still waiting for their topic or a free slot are dropped; items
+    that do not finish within the timeout are cancelled. Stopping waits at
+    most twice the timeout, even for items that ignore the cancellation.
+    """
+    global _loop, _thread
+
+    with _dispatcher_lock:
+        if _loop is None:
+            return
+        loop, thread = _loop, _thread
+        try:
+            asyncio.run_coroutine_threadsafe(_drain(timeout), loop).result(
+                timeout=2 * timeout
+            )
+        except FutureTimeoutError:
+            warning("SYSTEM", "Curation dispatcher did not drain", f"{timeout}s")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=timeout)
+            _loop = _thread = None
+
+
+async def _drain(timeout: float) -> None:
+    """Wait for the items being curated and drop the waiting ones."""
+    global _stopping
+
+    _stopping = True
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    if not tasks:
+        return
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def submit_feed_item(
+    topic_id: str,
+    feed_content: Optional[str] = None,
+    feed_item: Optional[FeedItem] = None,
+) -> Future:
+    """
+    Schedule a feed item for curation.
+
+    Args:
+        topic_id: The ID of the topic
+        feed_content: The content from the feed (optional)
+        feed_item: The feed item being processed (optional)
+
+    Returns:
+        A future resolving to the final graph state, cancelled if the item
+        was dropped while stopping
+
+    Raises:
+        RuntimeError: If the dispatcher is not running
+    """
+    with _dispatcher_lock:
+        if _loop is None:
+            raise RuntimeError("Curation dispatcher is not running")
+        return asyncio.run_coroutine_threadsafe(
+            _curate(topic_id, feed_content, feed_item), _loop
+        )
+
+
+async def _curate(
+    topic_id: str, feed_content: Optional[str], feed_item: Optional[FeedItem]
+) -> Dict[str, Any]:
+    """Curate an item once its topic is free and a slot is available."""
+    global _running
+
+    # Tasks start in submission order and asyncio locks are fair, so the
+    # items of a topic acquire its lock in the order they were submitted
+    lock = _topic_locks.setdefault(topic_id, asyncio.Lock())
+    _topic_jobs[topic_id] = _topic_jobs.get(topic_id, 0) + 1
+    try:
+        async with lock:
+            async with _semaphore:
+                if _stopping:
+                    raise asyncio.CancelledError()
+                _running += 1
+                try:
+                    return await aprocess_feed_item(topic_id, feed_content, feed_item)
+                finally:
+                    _running -= 1
+    finally:
+        _topic_jobs[topic_id] -= 1
+        if not _topic_jobs[topic_id]:
+            del _topic_jobs[topic_id]
+            del _topic_locks[topic_id]
+
+
+def get_dispatcher_stats() -> Dict[str, int]:
+    """Get the number of items being curated and of topics with items."""
+    return {"running": _running, "active_topics": len(_topic_jobs)}
@@ -3,18 +3,30 @@ LangGraph-based topic curator workflow.
 
 This module implements a LangGraph workflow that replaces the previous LCEL chain
 for topic curation. It provides better state management, error handling, and visualization.
+
+The graph is compiled once, on first use, and shared by all runs. A compiled
+graph holds no per-run state, so pipeline workers invoke it concurrently.
+Steps that call an LLM have an async twin, so the same graph also runs on an
+event loop through aprocess_feed_item.
 """
 
+import threading
 from typing import Any, Callable, Dict, Optional, TypedDict
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
+from api.db.unit_of_work import aflush, write_session
 from api.models.article import Article
 from api.models.feed_item import FeedItem
 from api.models.topic import Topic
 
 # Import the step functions directly
 from curator.steps import (
+    aextract_substance,
+    agenerate_article,
+    anews_relevance,
+    arefine_article,
     extract_substance,
     generate_article,
     is_relevant,
@@ -24,6 +36,7 @@ from curator.steps import (
     should_generate,
     should_skip_news,
 )
+from curator.steps.news_relevance import forget_item
 from utils.logging import error, info
 
 
@@ -55,6 +68,11 @@ class CuratorState(TypedDict, total=False):
     error_step: str
 
 
+# Compiled graph shared by all runs, see get_curator_graph
+_curator_graph = None
+_graph_lock = threading.Lock()
+
+
 # Identity function for passthrough nodes
 def identity(state: Dict[str, Any]) -> Dict[str, Any]:
     """Identity function that returns the state unchanged."""
@@ -69,11 +87,20 @@ def create_curator_graph() -> Callable:
 
     # Add nodes for processing steps
     graph.add_node("prepare_input", process_input)
-    graph.add_node("generate_article", generate_article)
+    graph.add_node(
+        "generate_article", RunnableLambda(generate_article, afunc=agenerate_article)
+    )
     graph.add_node("prepare_news_item", identity)
-    graph.add_node("news_relevance", news_relevance)
-    graph.add_node("extract_substance", extract_substance)
-    graph.add_node("refine_article", refine_article)
+    graph.add_node(
+        "news_relevance", RunnableLambda(news_relevance, afunc=anews_relevance)
+    )
+    graph.add_node(
+        "extract_substance",
+        RunnableLambda(extract_substance, afunc=aextract_substance),
+    )
+    graph.add_node(
+        "refine_article", RunnableLambda(refine_article, afunc=arefine_article)
+    )
 
     # Add edges with explicit routing targets using function factories
     graph.add_conditional_edges(
@@ -104,6 +131,45 @@ def create_curator_graph() -> Callable:
     return graph.compile()
 
 
+def get_curator_graph() -> Callable:
+    """Get the compiled curator graph, compiling it on first use."""
+    global _curator_graph
+
+    if _curator_graph is None:
+        with _graph_lock:
+            if _curator_graph is None:
+                _curator_graph = create_curator_graph()
+    return _curator_graph
+
+
+def _initial_state(
+    topic_id: str, feed_content: Optional[str], feed_item: Optional[FeedItem]
+) -> Dict[str, Any]:
+    """Build the graph input for a feed item."""
+    return {
+        "topic_id": topic_id,
+        "feed_content": feed_content,
+        "feed_item": feed_item,
+    }
+
+
+def _failed_run(topic_id: str, e: Exception) -> Dict[str, Any]:
+    """Log a failed graph run and describe it as a final state."""
+    error("CURATOR", "Graph execution failed", str(e))
+    return {
+        "topic_id": topic_id,
+        "has_error": True,
+        "error_message": str(e),
+        "error_step": "graph_execution",
+    }
+
+
+def _end_run(topic_id: str, feed_item: Optional[FeedItem]) -> None:
+    """Drop the relevance batch state kept for an item, wherever its run ended."""
+    if feed_item is not None:
+        forget_item(topic_id, feed_item.url)
+
+
 def process_feed_item(
     topic_id: str,
     feed_content: Optional[str] = None,
@@ -120,26 +186,52 @@ def process_feed_item(
     Returns:
         The final state after processing
     """
-    # Create the graph
-    graph = create_curator_graph()
+    graph = get_curator_graph()
 
-    # Initial state
-    initial_state = {
-        "topic_id": topic_id,
-        "feed_content": feed_content,
-        "feed_item": feed_item,
-    }
+    # Execute the graph, writing each touched topic and article once at the end
+    try:
+        with write_session():
+            result = graph.invoke(_initial_state(topic_id, feed_content, feed_item))
+        info("CURATOR", "Graph execution completed", f"Topic: {topic_id}")
+        return result
+    except Exception as e:
+        return _failed_run(topic_id, e)
+    finally:
+        _end_run(topic_id, feed_item)
+
+
+async def aprocess_feed_item(
+    topic_id: str,
+    feed_content: Optional[str] = None,
+    feed_item: Optional[FeedItem] = None,
+) -> Dict[str, Any]:
+    """
+    Process a feed item through the curator graph on the running event loop.
+
+    LLM steps await their requests, so many items can be in flight at once.
+    The write session lives in the calling task's context and is not shared
+    with other items; it is written in a worker thread so the loop is never
+    blocked on disk.
+
+    Args:
+        topic_id: The ID of the topic
+        feed_content: The content from the feed (optional)
+        feed_item: The feed item being processed (optional)
+
+    Returns:
+        The final state after processing
+    """
+    graph = get_curator_graph()
 
-    # Execute the graph
     try:
-        result = graph.invoke(initial_state)
+        with write_session():
+            result = await graph.ainvoke(
+                _initial_state(topic_id, feed_content, feed_item)
+            )
+            await aflush()
         info("CURATOR", "Graph execution completed", f"Topic: {topic_id}")
         return result
     except Exception as e:
-        error("CURATOR", "Graph execution failed", str(e))
-        return {
-            "topic_id": topic_id,
-            "has_error": True,
-            "error_message": str(e),
-            "error_step": "graph_execution",
-        }
+        return _failed_run(topic_id, e)
+    finally:
+        _end_run(topic_id, feed_item)
@@ -6,13 +6,17 @@ version_graph = ArticleVersionGraph()
 
 # Import and re-export your step modules/functions as usual
 
+from .article_generator import aprocess as agenerate_article
 from .article_generator import process as generate_article
 from .article_generator import should_generate
+from .article_refiner import aprocess as arefine_article
 from .article_refiner import process as refine_article
 from .input_creator import process as process_input
 from .input_creator import should_skip_news
+from .news_relevance import aprocess as anews_relevance
 from .news_relevance import is_relevant
 from .news_relevance import process as news_relevance
+from .substance_extractor import aprocess as aextract_substance
 from .substance_extractor import process as extract_substance
 
 __all__ = [
@@ -21,6 +25,10 @@ __all__ = [
     "refine_article",
     "generate_article",
     "extract_substance",
+    "anews_relevance",
+    "arefine_article",
+    "agenerate_article",
+    "aextract_substance",
     "should_generate",
     "is_relevant",
     "should_skip_news",
@@ -4,8 +4,9 @@ Article generator step for the curator workflow.
 This module handles generating new articles for topics that don't have one yet.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from langchain.prompts import PromptTemplate
 
@@ -17,7 +18,7 @@ from api.models.topic import Topic
 
 # Import the global version graph instance from the curator package
 from curator.steps import version_graph
-from services.llm_service import get_llm
+from services.llm_service import get_llm, provider_slot
 from utils.logging import debug, error, info
 
 
@@ -53,42 +54,70 @@ def process(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated state with generated_article if one was created.
     """
+    try:
+        # Generate the article using the helper function
+        new_article = generate_article(state.get("topic"))
+        return _record_article(state, new_article)
+    except Exception as e:
+        return _handle_generation_error(state, e)
+
+
+async def aprocess(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a new article without blocking the event loop.
+
+    Args:
+        state: Current workflow state with topic and existing_article.
+
+    Returns:
+        Updated state with generated_article if one was created.
+    """
+    try:
+        new_article = await agenerate_article(state.get("topic"))
+        # Saving may read and write the vault, keep it off the event loop
+        return await asyncio.to_thread(_record_article, state, new_article)
+    except Exception as e:
+        return _handle_generation_error(state, e)
+
+
+def _record_article(state: Dict[str, Any], new_article: Article) -> Dict[str, Any]:
+    """Store a generated article in the new state and the version graph."""
     new_state = {**state}
     topic = state.get("topic")
     feed_item = state.get("feed_item")
 
-    try:
-        # Generate the article using the helper function
-        new_article = generate_article(topic)
-
-        # Update state with the new article
-        new_state["generated_article"] = new_article
-        new_state["existing_article"] = new_article
-
-        # If there is a feed item, assign the article ID and update the topic
-        if feed_item:
-            feed_item.article_id = new_article.id
-            save_topic(topic)
-
-        # Add a version node to the global version graph
-        # For the first version, we can use a simple scheme like appending "-v1"
-        version_id = f"{new_article.id}-v1"
-        version_graph.add_version(
-            article_id=new_article.id,
-            version_id=version_id,
-            content=new_article.content,
-            timestamp=datetime.utcnow(),
-            metadata={"reason": "initial creation"},
-        )
-
-        return new_state
-    except Exception as e:
-        error_message = str(e)
-        error("GENERATOR", "Failed to generate article", error_message)
-        new_state["has_error"] = True
-        new_state["error_message"] = f"Failed to generate article: {error_message}"
-        new_state["error_step"] = "article_generator"
-        return new_state
+    # Update state with the new article
+    new_state["generated_article"] = new_article
+    new_state["existing_article"] = new_article
+
+    # If there is a feed item, assign the article ID and update the topic
+    if feed_item:
+        feed_item.article_id = new_article.id
+        save_topic(topic)
+
+    # Add a version node to the global version graph
+    # For the first version, we can use a simple scheme like appending "-v1"
+    version_id = f"{new_article.id}-v1"
+    version_graph.add_version(
+        article_id=new_article.id,
+        version_id=version_id,
+        content=new_article.content,
+        timestamp=datetime.utcnow(),
+        metadata={"reason": "initial creation"},
+    )
+
+    return new_state
+
+
+def _handle_generation_error(state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Handle errors in the generation process."""
+    error_message = str(e)
+    error("GENERATOR", "Failed to generate article", error_message)
+    new_state = {**state}
+    new_state["has_error"] = True
+    new_state["error_message"] = f"Failed to generate article: {error_message}"
+    new_state["error_step"] = "article_generator"
+    return new_state
 
 
 def generate_article(topic: Topic) -> Article:
@@ -104,9 +133,26 @@ def generate_article(topic: Topic) -> Article:
     Raises:
         Exception: If article generation fails.
     """
-    topic_title = topic.name
-    topic_description = topic.description
+    llm, prompt = _generation_request(topic)
+    content = llm.invoke(prompt).content
+    return _save_article(topic, content)
 
+
+async def agenerate_article(topic: Topic) -> Article:
+    """
+    Generate a new article for the topic asynchronously.
+
+    Holds a slot of the article generation provider while the request is in
+    flight; otherwise behaves like generate_article.
+    """
+    llm, prompt = _generation_request(topic)
+    async with provider_slot("article_generation"):
+        content = (await llm.ainvoke(prompt)).content
+    return _save_article(topic, content)
+
+
+def _generation_request(topic: Topic) -> Tuple[Any, str]:
+    """Get the LLM and the formatted prompt to generate a topic's article."""
     # Get the LLM service for article generation
     llm = get_llm("article_generation")
 
@@ -118,18 +164,20 @@ def generate_article(topic: Topic) -> Article:
     # Create and format the prompt
     prompt = PromptTemplate.from_template(prompt_data.template)
 
-    # Invoke the LLM to generate content
-    info("GENERATOR", "Generating article", f"Topic: {topic_title}")
-    content = llm.invoke(
-        prompt.format(topic_title=topic_title, topic_description=topic_description)
-    ).content
+    info("GENERATOR", "Generating article", f"Topic: {topic.name}")
+    return llm, prompt.format(
+        topic_title=topic.name, topic_description=topic.description
+    )
+
 
+def _save_article(topic: Topic, content: str) -> Article:
+    """Create the article for generated content and link it to the topic."""
     # Create the article using the database function
-    new_article = create_article(title=topic_title, topic_id=topic.id, content=content)
+    new_article = create_article(title=topic.name, topic_id=topic.id, content=content)
 
     # Update the topic with the new article ID and save changes
     topic.article = new_article.id
     save_topic(topic)
 
-    info("GENERATOR", "Article generated", f"Topic: {topic_title}")
+    info("GENERATOR", "Article generated", f"Topic: {topic.name}")
     return new_article
@@ -4,14 +4,15 @@ Article refiner step for the curator workflow.
 This module refines existing articles with new relevant content.
 """
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Tuple
 
 from langchain.prompts import PromptTemplate
 
 from api.db.article_db import update_article
 from api.db.prompt_db import get_prompt
 from api.db.topic_db import save_topic
-from services.llm_service import get_llm
+from services.llm_service import get_llm, provider_slot
 from utils.logging import debug, error, info
 
 
@@ -36,72 +37,96 @@ def process(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated state with refined_article
     """
+    try:
+        llm, prompt = _refinement_request(state)
+        refined_content = llm.invoke(prompt).content
+        return _record_refinement(state, refined_content)
+    except Exception as e:
+        return _handle_refinement_error(state, e)
+
+
+async def aprocess(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Refine an existing article without blocking the event loop.
+
+    Args:
+        state: Current workflow state with topic, article, and feed content
+
+    Returns:
+        Updated state with refined_article
+    """
+    try:
+        llm, prompt = _refinement_request(state)
+        async with provider_slot("article_refinement"):
+            refined_content = (await llm.ainvoke(prompt)).content
+        # Saving may read and write the vault, keep it off the event loop
+        return await asyncio.to_thread(_record_refinement, state, refined_content)
+    except Exception as e:
+        return _handle_refinement_error(state, e)
+
+
+def _refinement_request(state: Dict[str, Any]) -> Tuple[Any, str]:
+    """Get the LLM and the formatted prompt to refine the state's article."""
+    topic = state.get("topic")
+    feed_item = state.get("feed_item")
+
+    # Get the LLM
+    llm = get_llm("article_refinement")
+
+    # Get the prompt template from the database
+    prompt_data = get_prompt("article-refinement")
+    if not prompt_data:
+        raise ValueError("Article refinement prompt not found in the database")
+
+    # Create and format the prompt
+    prompt = PromptTemplate.from_template(prompt_data.template)
+
+    debug(
+        "REFINER",
+        "Refining article",
+        f"Topic: {topic.name}, Source: {feed_item.url}",
+    )
+    return llm, prompt.format(
+        topic_title=topic.name,
+        topic_description=topic.description,
+        article=state.get("existing_article").content,
+        new_context=state.get("feed_content"),
+        new_information=state.get("new_information"),
+        enforcing_information=state.get("enforcing_information"),
+        contradicting_information=state.get("contradicting_information"),
+    )
+
+
+def _record_refinement(state: Dict[str, Any], refined_content: str) -> Dict[str, Any]:
+    """Save refined content to the article and the new state."""
     # Create a new state starting with the current state
     new_state = {**state}
-
-    # Extract needed data from state
     topic = state.get("topic")
-    article = state.get("existing_article")
-    feed_content = state.get("feed_content")
     feed_item = state.get("feed_item")
-    new_information = state.get("new_information")
-    enforcing_information = state.get("enforcing_information")
-    contradicting_information = state.get("contradicting_information")
 
-    try:
-        # Get the LLM
-        llm = get_llm("article_refinement")
-
-        # Get the prompt template from the database
-        prompt_data = get_prompt("article-refinement")
-        if not prompt_data:
-            raise ValueError("Article refinement prompt not found in the database")
-
-        # Create and format the prompt
-        prompt = PromptTemplate.from_template(prompt_data.template)
-
-        # Invoke the LLM to refine the article
-        debug(
-            "REFINER",
-            "Refining article",
-            f"Topic: {topic.name}, Source: {feed_item.url}",
-        )
-        refined_content = llm.invoke(
-            prompt.format(
-                topic_title=topic.name,
-                topic_description=topic.description,
-                article=article.content,
-                new_context=feed_content,
-                new_information=new_information,
-                enforcing_information=enforcing_information,
-                contradicting_information=contradicting_information,
-            )
-        ).content
-
-        # Update the article in the database
-        refined_article = update_article(
-            article_id=article.id, content=refined_content, feed_item=feed_item
-        )
-
-        # Update the topic reference and save
-        topic.article = refined_article.id
-
-        # Store the article ID in the feed item
-        feed_item.article_id = refined_article.id
-
-        # Save the topic with updated feed item
-        save_topic(topic)
-
-        info(
-            "CURATOR",
-            "Article refined",
-            f"Topic: {topic.name}, Source: {feed_item.url}",
-        )
-
-        # Update state with refined article
-        new_state["refined_article"] = refined_article
-
-        return new_state
+    # Update the article in the database
+    refined_article = update_article(
+        article_id=state.get("existing_article").id,
+        content=refined_content,
+        feed_item=feed_item,
+    )
 
-    except Exception as e:
-        return _handle_refinement_error(state, e)
+    # Update the topic reference and save
+    topic.article = refined_article.id
+
+    # Store the article ID in the feed item
+    feed_item.article_id = refined_article.id
+
+    # Save the topic with updated feed item
+    save_topic(topic)
+
+    info(
+        "CURATOR",
+        "Article refined",
+        f"Topic: {topic.name}, Source: {feed_item.url}",
+    )
+
+    # Update state with refined article
+    new_state["refined_article"] = refined_article
+
+    return new_state
@@ -2,17 +2,37 @@
 News relevance step for the curator workflow.
 
 This module checks if new content is relevant to an existing topic and article.
+
+With batching enabled, the pipeline registers the items it queues for
+curation here. The first of a topic's items to reach this step is judged in
+one LLM call together with the topic's other pending items, so the topic
+description and article are sent once per batch instead of once per item.
+The verdicts of the other items are kept until they reach this step; items
+the batch call gives no verdict for, or all items of a failed batch, are
+judged one by one. Whatever is kept for an item is dropped when its run
+ends, also if it never reaches this step. Batches are configured in
+settings.yaml:
+
+    relevance_batch:
+      batch_size: 10       # items judged per call, 1 disables batching
+      token_budget: 6000   # estimated tokens of the item texts per call
 """
 
-from typing import Any, Callable, Dict
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel, Field
 
 from api.db.prompt_db import get_prompt
 from api.db.topic_db import save_topic
-from services.llm_service import get_llm
+from api.models.feed_item import FeedItem
+from api.models.topic import Topic
+from services.llm_service import get_llm, load_llm_settings, provider_slot
+from services.settings_service import get_setting
 from utils.logging import debug, error, warning
 
 
@@ -27,6 +47,47 @@ class RelevanceResponse(BaseModel):
     )
 
 
+class RelevanceVerdict(RelevanceResponse):
+    """Relevance of one of the sources judged in a batch."""
+
+    index: int = Field(description="Number of the source this verdict is for")
+
+
+class BatchRelevanceResponse(BaseModel):
+    """Model for the batched relevance filter response."""
+
+    verdicts: List[RelevanceVerdict] = Field(
+        description="One verdict for each numbered source"
+    )
+
+
+DEFAULT_BATCH_SIZE = 1
+DEFAULT_TOKEN_BUDGET = 6000
+
+# Rough characters per token, to keep batches within the token budget
+CHARS_PER_TOKEN = 4
+
+# A feed item with its content
+BatchItem = Tuple[FeedItem, str]
+
+# Items queued for curation per topic, by URL, in queue order
+_pending: Dict[str, Dict[str, BatchItem]] = {}
+
+# Verdicts from earlier batches by (topic_id, url)
+_verdicts: Dict[Tuple[str, str], RelevanceResponse] = {}
+
+# Items of failed batches by (topic_id, url), judged on their own
+_single: Set[Tuple[str, str]] = set()
+_batch_lock = threading.Lock()
+
+
+# Default "not relevant" response when the prompt template is missing
+_PROMPT_MISSING = RelevanceResponse(
+    is_relevant=False,
+    explanation="Unable to determine relevance: prompt template not found",
+)
+
+
 def is_relevant(true_node: str, false_node: str) -> Callable[[Dict[str, Any]], str]:
     """
     Create a routing function that decides if the content is relevant to the topic.
@@ -64,62 +125,339 @@ def process(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated state with is_relevant flag
     """
-    # Create a new state starting with the current state
-    new_state = {**state}
+    try:
+        relevance_result = _batched_relevance(state)
+        if relevance_result is None:
+            relevance_result = determine_relevance(**_relevance_inputs(state))
+        return _record_relevance(state, relevance_result)
+    except Exception as e:
+        return _relevance_failed(state, e)
 
-    # Extract needed data from state
-    topic = state.get("topic")
-    article = state.get("existing_article")
-    feed_content = state.get("feed_content")
-    feed_item = state.get("feed_item")
 
+async def aprocess(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check if feed content is relevant without blocking the event loop.
+
+    Args:
+        state: Current workflow state with topic, article, and feed content
+
+    Returns:
+        Updated state with is_relevant flag
+    """
+    try:
+        relevance_result = await _abatched_relevance(state)
+        if relevance_result is None:
+            relevance_result = await adetermine_relevance(**_relevance_inputs(state))
+        # Saving may read and write the vault, keep it off the event loop
+        return await asyncio.to_thread(_record_relevance, state, relevance_result)
+    except Exception as e:
+        return _relevance_failed(state, e)
+
+
+def _batched_relevance(state: Dict[str, Any]) -> Optional[RelevanceResponse]:
+    """Get the item's verdict from a batch, or None to judge it on its own."""
+    verdict, batch = _claim_batch(state)
+    if not batch:
+        return verdict
+    try:
+        verdicts = determine_relevance_batch(
+            state.get("topic"), state.get("existing_article").content, batch
+        )
+    except Exception as e:
+        # Fall back to judging this item on its own
+        _batch_failed(state, batch, e)
+        return None
+    return _keep_verdicts(state, verdicts)
+
+
+async def _abatched_relevance(state: Dict[str, Any]) -> Optional[RelevanceResponse]:
+    """Get the item's verdict from a batch judged without blocking the loop."""
+    verdict, batch = _claim_batch(state)
+    if not batch:
+        return verdict
+    try:
+        verdicts = await adetermine_relevance_batch(
+            state.get("topic"), state.get("existing_article").content, batch
+        )
+    except Exception as e:
+        # Fall back to judging this item on its own
+        _batch_failed(state, batch, e)
+        return None
+    return _keep_verdicts(state, verdicts)
+
+
+def _relevance_inputs(state: Dict[str, Any]) -> Dict[str, str]:
+    """Get the relevance check arguments from the workflow state."""
     # By the time we reach this step, we assume the graph structure ensures:
     # 1. We have a topic
     # 2. We have an article (either existing or newly generated)
     # 3. We have feed content to check
+    topic = state.get("topic")
+    article = state.get("existing_article")
 
     # Log that we're checking relevance
     debug(
-        "CURATOR", "Checking relevance", f"Topic: {topic.name}, Feed: {feed_item.url}"
+        "CURATOR",
+        "Checking relevance",
+        f"Topic: {topic.name}, Feed: {state.get('feed_item').url}",
     )
 
-    try:
-        # Get the relevance determination from LLM
-        relevance_result = determine_relevance(
-            topic_title=topic.name,
-            topic_description=topic.description,
-            article_content=article.content,
-            feed_content=feed_content,
-        )
+    return {
+        "topic_title": topic.name,
+        "topic_description": topic.description,
+        "article_content": article.content,
+        "feed_content": state.get("feed_content"),
+    }
 
-        debug(
-            "CURATOR",
-            f"Content relevance: {relevance_result.is_relevant}",
-            f"Topic: {topic.name}, Reason: {relevance_result.explanation}",
-        )
 
-        # Update feed item with relevance information
-        feed_item.is_relevant = relevance_result.is_relevant
-        feed_item.relevance_explanation = relevance_result.explanation
+def _record_relevance(
+    state: Dict[str, Any], relevance_result: RelevanceResponse
+) -> Dict[str, Any]:
+    """Store a relevance result on the feed item and in the new state."""
+    # Create a new state starting with the current state
+    new_state = {**state}
+    topic = state.get("topic")
+    feed_item = state.get("feed_item")
 
-        # Add to processed feeds and save topic
-        topic.processed_feeds.append(feed_item)
-        save_topic(topic)
+    debug(
+        "CURATOR",
+        f"Content relevance: {relevance_result.is_relevant}",
+        f"Topic: {topic.name}, Reason: {relevance_result.explanation}",
+    )
 
-        # If content is not relevant, add explanation but don't set has_error
-        if not relevance_result.is_relevant:
-            new_state["error_message"] = relevance_result.explanation
-            new_state["error_step"] = "news_relevance"
+    # Update feed item with relevance information
+    feed_item.is_relevant = relevance_result.is_relevant
+    feed_item.relevance_explanation = relevance_result.explanation
 
-        return new_state
+    # Add to processed feeds and save topic
+    topic.processed_feeds.append(feed_item)
+    save_topic(topic)
 
-    except Exception as e:
-        error_message = str(e)
-        error("CURATOR", "Failed to check relevance", error_message)
-        new_state["has_error"] = True
-        new_state["error_message"] = f"Failed to check relevance: {error_message}"
+    # If content is not relevant, add explanation but don't set has_error
+    if not relevance_result.is_relevant:
+        new_state["error_message"] = relevance_result.explanation
         new_state["error_step"] = "news_relevance"
-        return new_state
+
+    return new_state
+
+
+def _relevance_failed(state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Mark the state as failed in the relevance step."""
+    error_message = str(e)
+    error("CURATOR", "Failed to check relevance", error_message)
+    return {
+        **state,
+        "has_error": True,
+        "error_message": f"Failed to check relevance: {error_message}",
+        "error_step": "news_relevance",
+    }
+
+
+def load_batch_settings() -> Tuple[int, int]:
+    """Load the relevance batch settings as (batch size, token budget)."""
+    settings = get_setting("relevance_batch") or {}
+    return (
+        max(1, int(settings.get("batch_size", DEFAULT_BATCH_SIZE))),
+        max(0, int(settings.get("token_budget", DEFAULT_TOKEN_BUDGET))),
+    )
+
+
+def add_pending_item(topic_id: str, feed_item: FeedItem, content: str) -> None:
+    """Register an item queued for curation so it can join its topic's batch."""
+    if load_batch_settings()[0] <= 1:
+        return
+    with _batch_lock:
+        _pending.setdefault(topic_id, {})[feed_item.url] = (feed_item, content)
+
+
+def forget_item(topic_id: str, url: str) -> None:
+    """Drop what is kept for an item whose curation run has ended."""
+    with _batch_lock:
+        pending = _pending.get(topic_id)
+        if pending is not None:
+            pending.pop(url, None)
+            if not pending:
+                del _pending[topic_id]
+        _verdicts.pop((topic_id, url), None)
+        _single.discard((topic_id, url))
+
+
+def clear_relevance_batches() -> None:
+    """Forget all pending items and unused verdicts."""
+    with _batch_lock:
+        _pending.clear()
+        _verdicts.clear()
+        _single.clear()
+
+
+def _estimate_tokens(content: str) -> int:
+    """Estimate the number of tokens of a text."""
+    return len(content or "") // CHARS_PER_TOKEN
+
+
+def _claim_batch(
+    state: Dict[str, Any],
+) -> Tuple[Optional[RelevanceResponse], List[BatchItem]]:
+    """
+    Take the item's verdict from an earlier batch or start a new batch.
+
+    Returns the verdict if one was kept for the item, otherwise the items to
+    judge together, led by this one; the batch is empty when there is nothing
+    to batch the item with or the item was in a failed batch.
+    """
+    topic = state.get("topic")
+    feed_item = state.get("feed_item")
+    batch_size, token_budget = load_batch_settings()
+
+    with _batch_lock:
+        pending = _pending.get(topic.id, {})
+        pending.pop(feed_item.url, None)
+        verdict = _verdicts.pop((topic.id, feed_item.url), None)
+        if (topic.id, feed_item.url) in _single:
+            _single.discard((topic.id, feed_item.url))
+            return None, []
+        if verdict is not None or batch_size <= 1 or not pending:
+            if not pending:
+                _pending.pop(topic.id, None)
+            return verdict, []
+
+        processed = {item.url for item in topic.processed_feeds}
+        batch = [(feed_item, state.get("feed_content"))]
+        tokens = _estimate_tokens(batch[0][1])
+        for url, item in list(pending.items()):
+            if url in processed:
+                del pending[url]
+                continue
+            if len(batch) >= batch_size:
+                break
+            tokens += _estimate_tokens(item[1])
+            if tokens > token_budget:
+                break
+            batch.append(item)
+            del pending[url]
+        if not pending:
+            del _pending[topic.id]
+
+    return None, batch if len(batch) > 1 else []
+
+
+def _keep_verdicts(
+    state: Dict[str, Any], verdicts: Dict[str, RelevanceResponse]
+) -> Optional[RelevanceResponse]:
+    """Keep the verdicts of the other batch items and return this item's."""
+    topic_id = state.get("topic").id
+    url = state.get("feed_item").url
+    with _batch_lock:
+        for item_url, verdict in verdicts.items():
+            if item_url != url:
+                _verdicts[(topic_id, item_url)] = verdict
+    return verdicts.get(url)
+
+
+def _batch_failed(state: Dict[str, Any], batch: List[BatchItem], e: Exception) -> None:
+    """Mark the items of a failed batch to be judged one by one."""
+    topic_id = state.get("topic").id
+    url = state.get("feed_item").url
+    with _batch_lock:
+        _single.update((topic_id, item.url) for item, _ in batch if item.url != url)
+    warning(
+        "CURATOR",
+        "Batched relevance check failed",
+        f"Judging {len(batch)} items separately: {str(e)}",
+    )
+
+
+def determine_relevance_batch(
+    topic: Topic, article_content: str, items: List[BatchItem]
+) -> Dict[str, RelevanceResponse]:
+    """
+    Determine the relevance of several feed items of a topic in one call.
+
+    Args:
+        topic: The topic the items were found for
+        article_content: The current article content
+        items: The feed items with their content
+
+    Returns:
+        The verdicts by feed item URL; items the response has no verdict for
+        are left out
+
+    Raises:
+        Exception: If the prompt is missing or the response cannot be parsed
+    """
+    chain = _batch_chain(len(items))
+    response = chain.invoke(_batch_inputs(topic, article_content, items))
+    return _verdicts_by_url(response, items)
+
+
+async def adetermine_relevance_batch(
+    topic: Topic, article_content: str, items: List[BatchItem]
+) -> Dict[str, RelevanceResponse]:
+    """
+    Determine the relevance of several feed items asynchronously.
+
+    Takes the same arguments as determine_relevance_batch and holds a slot of
+    the relevance filter's provider while the request is in flight.
+    """
+    chain = _batch_chain(len(items))
+    async with provider_slot("relevance_filter"):
+        response = await chain.ainvoke(_batch_inputs(topic, article_content, items))
+    return _verdicts_by_url(response, items)
+
+
+def _batch_chain(size: int) -> Runnable:
+    """Build the batch prompt | llm | parser chain for a number of items."""
+    prompt_data = get_prompt("article-relevance-batch-filter")
+    if not prompt_data:
+        raise ValueError("Batch relevance prompt not found in the database")
+
+    # The relevance filter's max_tokens is the budget for each verdict
+    max_tokens = load_llm_settings().get("relevance_filter", {}).get("max_tokens")
+    llm = get_llm("relevance_filter")
+    if max_tokens:
+        llm = llm.bind(max_tokens=max_tokens * size)
+
+    parser = PydanticOutputParser(pydantic_object=BatchRelevanceResponse)
+    prompt = PromptTemplate(
+        template=prompt_data.template + "\n\n {format_instructions}",
+        input_variables=["topic_title", "topic_description", "article", "sources"],
+        partial_variables={"format_instructions": parser.get_format_instructions()},
+    )
+    return prompt | llm | parser
+
+
+def _batch_inputs(
+    topic: Topic, article_content: str, items: List[BatchItem]
+) -> Dict[str, str]:
+    """Get the batch prompt variables, numbering the sources from 1."""
+    debug(
+        "CURATOR",
+        "Checking relevance in batch",
+        f"Topic: {topic.name}, Items: {len(items)}",
+    )
+    sources = "\n\n".join(
+        f"SOURCE {index}:\n-------------\n{content}\n-------------"
+        for index, (_, content) in enumerate(items, 1)
+    )
+    return {
+        "topic_title": topic.name,
+        "topic_description": topic.description,
+        "article": article_content,
+        "sources": sources,
+    }
+
+
+def _verdicts_by_url(
+    response: BatchRelevanceResponse, items: List[BatchItem]
+) -> Dict[str, RelevanceResponse]:
+    """Map the numbered verdicts of a batch response to feed item URLs."""
+    verdicts = {}
+    for verdict in response.verdicts:
+        if 1 <= verdict.index <= len(items):
+            verdicts[items[verdict.index - 1][0].url] = RelevanceResponse(
+                is_relevant=verdict.is_relevant, explanation=verdict.explanation
+            )
+    return verdicts
 
 
 def determine_relevance(
@@ -140,6 +478,44 @@ def determine_relevance(
     Raises:
         Exception: If the relevance check fails
     """
+    relevance_chain = _relevance_chain()
+    if relevance_chain is None:
+        return _PROMPT_MISSING
+    return relevance_chain.invoke(
+        {
+            "topic_title": topic_title,
+            "topic_description": topic_description,
+            "article": article_content,
+            "new_context": feed_content,
+        }
+    )
+
+
+async def adetermine_relevance(
+    topic_title: str, topic_description: str, article_content: str, feed_content: str
+) -> RelevanceResponse:
+    """
+    Determine if feed content is relevant to a topic and article asynchronously.
+
+    Takes the same arguments as determine_relevance and holds a slot of the
+    relevance filter's provider while the request is in flight.
+    """
+    relevance_chain = _relevance_chain()
+    if relevance_chain is None:
+        return _PROMPT_MISSING
+    async with provider_slot("relevance_filter"):
+        return await relevance_chain.ainvoke(
+            {
+                "topic_title": topic_title,
+                "topic_description": topic_description,
+                "article": article_content,
+                "new_context": feed_content,
+            }
+        )
+
+
+def _relevance_chain() -> Optional[Runnable]:
+    """Build the prompt | llm | parser chain, or None if the prompt is missing."""
     # Get the LLM
     llm = get_llm("relevance_filter")
 
@@ -151,11 +527,7 @@ def determine_relevance(
             "Prompt not found",
             "article-relevance-filter prompt not found in database",
         )
-        # Return a default "not relevant" response
-        return RelevanceResponse(
-            is_relevant=False,
-            explanation="Unable to determine relevance: prompt template not found",
-        )
+        return None
 
     # Set up the parser
     parser = PydanticOutputParser(pydantic_object=RelevanceResponse)
@@ -167,13 +539,4 @@ def determine_relevance(
         partial_variables={"format_instructions": parser.get_format_instructions()},
     )
 
-    # Create and invoke the relevance chain
-    relevance_chain = prompt | llm | parser
-    return relevance_chain.invoke(
-        {
-            "topic_title": topic_title,
-            "topic_description": topic_description,
-            "article": article_content,
-            "new_context": feed_content,
-        }
-    )
+    return prompt | llm | parser
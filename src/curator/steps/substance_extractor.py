@@ -4,7 +4,8 @@ Substance extractor step for the curator workflow.
 Extract the substance of an article: new information, enforcing information, and contradicting information.
 """
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Tuple
 
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
@@ -15,7 +16,7 @@ from api.db.topic_db import save_topic
 from api.models.article import Article
 from api.models.feed_item import FeedItem
 from api.models.topic import Topic
-from services.llm_service import get_llm
+from services.llm_service import get_llm, provider_slot
 from utils.logging import debug, error, info
 
 
@@ -43,50 +44,77 @@ def process(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Updated state with extracted substance
     """
+    try:
+        # Extract substance from the new content
+        extracted_substance = extract_substance(**_extraction_inputs(state))
+        return _record_substance(state, extracted_substance)
+    except Exception as e:
+        return _handle_extraction_error(state, e)
+
+
+async def aprocess(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract substance from new content without blocking the event loop.
+
+    Args:
+        state: Current workflow state with topic, article, and feed content
+
+    Returns:
+        Updated state with extracted substance
+    """
+    try:
+        extracted_substance = await aextract_substance(**_extraction_inputs(state))
+        # Saving may read and write the vault, keep it off the event loop
+        return await asyncio.to_thread(_record_substance, state, extracted_substance)
+    except Exception as e:
+        return _handle_extraction_error(state, e)
+
+
+def _extraction_inputs(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the substance extraction arguments from the workflow state."""
+    return {
+        "topic": state.get("topic"),
+        "current_article": state.get("existing_article"),
+        "feed_content": state.get("feed_content"),
+        "feed_item": state.get("feed_item"),
+    }
+
+
+def _record_substance(
+    state: Dict[str, Any], extracted_substance: SubstanceResponse
+) -> Dict[str, Any]:
+    """Store extracted substance on the feed item and in the new state."""
     # Create a new state starting with the current state
     new_state = {**state}
-
-    # Extract needed data from state
-    topic = state.get("topic")
-    article = state.get("existing_article")
-    feed_content = state.get("feed_content")
     feed_item = state.get("feed_item")
 
-    try:
-        # Extract substance from the new content
-        extracted_substance = extract_substance(
-            topic=topic,
-            current_article=article,
-            feed_content=feed_content,
-            feed_item=feed_item,
-        )
-
-        # Update state with extracted substance
-        new_state["new_information"] = extracted_substance.new_information
-        new_state["enforcing_information"] = extracted_substance.enforcing_information
-        new_state["contradicting_information"] = (
-            extracted_substance.contradicting_information
-        )
-
-        # Store the extracted substance in the feed item
-        feed_item.new_information = extracted_substance.new_information
-        feed_item.enforcing_information = extracted_substance.enforcing_information
-        feed_item.contradicting_information = (
-            extracted_substance.contradicting_information
-        )
-
-        # Save the updated topic with the modified feed item
-        save_topic(topic)
-
-        return new_state
+    # Update state with extracted substance
+    new_state["new_information"] = extracted_substance.new_information
+    new_state["enforcing_information"] = extracted_substance.enforcing_information
+    new_state["contradicting_information"] = (
+        extracted_substance.contradicting_information
+    )
 
-    except Exception as e:
-        error_message = str(e)
-        error("CURATOR", "Failed to extract substance", error_message)
-        new_state["has_error"] = True
-        new_state["error_message"] = f"Failed to extract substance: {error_message}"
-        new_state["error_step"] = "substance_extractor"
-        return new_state
+    # Store the extracted substance in the feed item
+    feed_item.new_information = extracted_substance.new_information
+    feed_item.enforcing_information = extracted_substance.enforcing_information
+    feed_item.contradicting_information = extracted_substance.contradicting_information
+
+    # Save the updated topic with the modified feed item
+    save_topic(state.get("topic"))
+
+    return new_state
+
+
+def _handle_extraction_error(state: Dict[str, Any], e: Exception) -> Dict[str, Any]:
+    """Handle errors in the extraction process."""
+    error_message = str(e)
+    error("CURATOR", "Failed to extract substance", error_message)
+    new_state = {**state}
+    new_state["has_error"] = True
+    new_state["error_message"] = f"Failed to extract substance: {error_message}"
+    new_state["error_step"] = "substance_extractor"
+    return new_state
 
 
 def extract_substance(
@@ -107,6 +135,34 @@ def extract_substance(
     Raises:
         Exception: If substance extraction fails
     """
+    llm, parser, prompt = _extraction_request(
+        topic, current_article, feed_content, feed_item
+    )
+    extraction_result = llm.invoke(prompt)
+    return _parse_substance(parser, extraction_result.content, topic, feed_item)
+
+
+async def aextract_substance(
+    topic: Topic, current_article: Article, feed_content: str, feed_item: FeedItem
+) -> SubstanceResponse:
+    """
+    Extract substance from new content asynchronously.
+
+    Takes the same arguments as extract_substance and holds a slot of the
+    article refinement provider while the request is in flight.
+    """
+    llm, parser, prompt = _extraction_request(
+        topic, current_article, feed_content, feed_item
+    )
+    async with provider_slot("article_refinement"):
+        extraction_result = await llm.ainvoke(prompt)
+    return _parse_substance(parser, extraction_result.content, topic, feed_item)
+
+
+def _extraction_request(
+    topic: Topic, current_article: Article, feed_content: str, feed_item: FeedItem
+) -> Tuple[Any, PydanticOutputParser, str]:
+    """Get the LLM, the parser and the formatted extraction prompt."""
     # Get the LLM
     llm = get_llm("article_refinement")
 
@@ -125,23 +181,28 @@ def extract_substance(
         partial_variables={"format_instructions": parser.get_format_instructions()},
     )
 
-    # Invoke the LLM to extract substance
     debug(
         "EXTRACTOR",
         "Extracting substance",
         f"Topic: {topic.name}, Source: {feed_item.url}",
     )
-    extraction_result = llm.invoke(
+    return (
+        llm,
+        parser,
         prompt.format(
             topic_title=topic.name,
             topic_description=topic.description,
             article=current_article.content,
             new_context=feed_content,
-        )
+        ),
     )
 
-    # Parse the result into a SubstanceResponse object using the parser
-    substance = parser.parse(extraction_result.content)
+
+def _parse_substance(
+    parser: PydanticOutputParser, content: str, topic: Topic, feed_item: FeedItem
+) -> SubstanceResponse:
+    """Parse the extraction result into a SubstanceResponse."""
+    substance = parser.parse(content)
 
     info(
         "CURATOR",
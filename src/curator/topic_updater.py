@@ -1,30 +1,136 @@
+"""
+Staged pipeline that fetches feeds, curates their items and publishes topics.
+
+Work flows through three stages, each with its own pool of worker threads:
+
+- fetch: resolves feed URLs through the connectors (I/O bound)
+- curation: runs feed items through the curator workflow (LLM bound)
+- publish: converts and publishes refined articles
+
+The stages are joined by bounded queues that workers block on, so idle
+workers use no CPU and a slow PDF, LLM call or TTS conversion only holds up
+its own stage. Each topic is curated by one worker at a time, in the order
+its items were queued, so concurrent refinements never fork article versions.
+The pool and queue sizes are configured in settings.yaml:
+
+    pipeline:
+      fetch_workers: 4
+      curation_workers: 2
+      publish_workers: 1
+      queue_size: 1000
+      curation_mode: threads   # or async
+      max_concurrency: 8       # items curated at once in async mode
+
+In async mode the curation workers are replaced by one thread that hands
+items to the asyncio dispatcher (see async_dispatcher), which curates up to
+max_concurrency items of different topics at once, still one at a time and
+in order per topic.
+"""
+
 import threading
-import time
-from queue import Queue
+from collections import deque
+from concurrent.futures import Future
+from queue import Full, Queue
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from api.db.article_db import get_article
 from api.db.cache_manager import get_all_connectors
 from api.db.topic_db import get_topic
 from api.models.feed_item import FeedItem
+from curator.async_dispatcher import (
+    get_dispatcher_stats,
+    start_dispatcher,
+    stop_dispatcher,
+    submit_feed_item,
+)
 
 # Import the LangGraph-based implementation
 from curator.graph_workflow import process_feed_item as graph_process_feed_item
+from curator.steps.news_relevance import add_pending_item, clear_relevance_batches
 from news.converter import CONVERTERS
 from news.publishers import PUBLISHERS
+from services.settings_service import get_setting
 from utils.logging import debug, error, info, warning
 
-# Single processing queue for all items
-# Each item is a tuple (topic_id, content, feed_item)
-processing_queue = Queue()
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_CURATION_WORKERS = 2
+DEFAULT_PUBLISH_WORKERS = 1
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_CURATION_MODE = "threads"
+DEFAULT_MAX_CONCURRENCY = 8
+
+# A curation job: (topic_id, content, feed_item)
+CurationJob = Tuple[str, Optional[str], Optional[FeedItem]]
+
+# Stage queues, bounded when the pipeline starts. Fetch jobs are
+# (topic_id, feed_url) and publish jobs a topic_id; workers stop when they
+# receive the stop event of their run.
+fetch_queue: "Queue[Any]" = Queue()
+curation_queue: "Queue[Any]" = Queue()
+publish_queue: "Queue[Any]" = Queue()
+
+_workers: List[threading.Thread] = []
+_pipeline_lock = threading.Lock()
+
+# Set to stop the current run's workers; each run gets a new one
+_stop_event = threading.Event()
+
+# Topics being curated, each with the items queued for it meanwhile
+_active_topics: Dict[str, Deque[CurationJob]] = {}
+_active_lock = threading.Lock()
+
+# In async mode, bounds the items handed to the dispatcher but not yet curated
+_in_flight = threading.Semaphore(DEFAULT_QUEUE_SIZE)
+
+# Topics waiting in the publish queue, so bursts of refinements publish once
+_pending_publish: Set[str] = set()
+_publish_lock = threading.Lock()
+
+_pipeline_stats = {
+    "fetched": 0,
+    "curated": 0,
+    "published": 0,
+    "errors": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def load_settings() -> Tuple[int, int, int, int]:
+    """Load the pipeline settings as (fetch, curation, publish workers, queue size)."""
+    settings = get_setting("pipeline") or {}
+    return (
+        max(1, int(settings.get("fetch_workers", DEFAULT_FETCH_WORKERS))),
+        max(1, int(settings.get("curation_workers", DEFAULT_CURATION_WORKERS))),
+        max(1, int(settings.get("publish_workers", DEFAULT_PUBLISH_WORKERS))),
+        max(1, int(settings.get("queue_size", DEFAULT_QUEUE_SIZE))),
+    )
+
+
+def load_curation_settings() -> Tuple[str, int]:
+    """Load the curation mode ('threads' or 'async') and async concurrency."""
+    settings = get_setting("pipeline") or {}
+    mode = settings.get("curation_mode", DEFAULT_CURATION_MODE)
+    if mode not in ("threads", "async"):
+        warning("SYSTEM", "Unknown curation mode", f"{mode}, using threads")
+        mode = "threads"
+    return (
+        mode,
+        max(1, int(settings.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))),
+    )
+
+
+def _count(counter: str) -> None:
+    """Increment a pipeline counter."""
+    with _stats_lock:
+        _pipeline_stats[counter] += 1
 
 
 def queue_topic_update(topic_id: str):
     """
-    Queue a topic update by adding its feed URLs to the processing queue.
+    Queue a topic update by adding its feed URLs to the fetch stage.
 
     Args:
         topic_id: The ID of the topic to update
-        sender: The name of the component requesting the update
     """
     try:
         # Load topic
@@ -37,19 +143,72 @@ def queue_topic_update(topic_id: str):
 
         # Queue each feed URL as a separate item
         for feed_url in topic.feed_urls:
-            # Create a feed item for the URL with needs_further_processing=True
-            feed_item = FeedItem.create(
-                url=feed_url, content="", needs_further_processing=True
-            )
-
-            # Add to queue (topic_id, content=None, feed_item)
-            processing_queue.put((topic_id, None, feed_item))
+            fetch_queue.put((topic_id, feed_url))
             debug("TOPIC", "Feed queued", f"Topic: {topic.name}, URL: {feed_url}")
 
     except Exception as e:
         error("TOPIC", "Update error", f"{topic_id}: {str(e)}")
 
 
+def queue_article_generation(topic_id: str):
+    """
+    Queue a curator run without new content, e.g. to generate a first article.
+
+    Args:
+        topic_id: The ID of the topic
+    """
+    debug("TOPIC", "Queuing generation", topic_id)
+    curation_queue.put((topic_id, None, None))
+
+
+def add_feed_item_to_queue(topic_id: str, feed_item: FeedItem, content: str):
+    """
+    Add a feed item to the pipeline.
+
+    Items that need further processing are resolved by the fetch stage, the
+    rest go to curation.
+    """
+    debug("FEED", "Queuing item", feed_item.url)
+
+    if not feed_item.needs_further_processing:
+        # Let the relevance step judge the item together with its topic's others
+        add_pending_item(topic_id, feed_item, content)
+        curation_queue.put((topic_id, content, feed_item))
+        return
+
+    # Fetch workers queue the entries they find here; with the fetch queue
+    # full they would wait on their own stage, so resolve the entry directly
+    try:
+        fetch_queue.put((topic_id, feed_item.url), block=False)
+    except Full:
+        process_feed_url(topic_id, feed_item.url)
+
+
+def queue_topic_publishing(topic_id: str, block: bool = True):
+    """
+    Queue a topic for publishing unless it is already waiting.
+
+    Args:
+        topic_id: The ID of the topic
+        block: Whether to wait for room in the publish queue; otherwise a
+            full queue is waited on in a separate thread
+    """
+    with _publish_lock:
+        if topic_id in _pending_publish:
+            return
+        _pending_publish.add(topic_id)
+    if block:
+        publish_queue.put(topic_id)
+        return
+    try:
+        publish_queue.put_nowait(topic_id)
+    except Full:
+        warning("TOPIC", "Publish queue full, waiting in a thread", topic_id)
+        threading.Thread(
+            target=publish_queue.put, args=(topic_id,), daemon=True
+        ).start()
+
+
 def handle_topic_publishing(sender):
     """Signal handler for topic publishing requests."""
     info("TOPIC", "Publishing", sender.name)
@@ -87,58 +246,250 @@ def handle_topic_publishing(sender):
                     publisher.handle_publish_requested(article, cmd)
 
 
-def process_queue():
-    """Process items from the unified processing queue."""
+def _next_job(queue: Queue, stop: threading.Event) -> Any:
+    """
+    Block until a job arrives, returning None once the pipeline is stopping.
+
+    Stop requests left in the queue by an earlier run are skipped.
+    """
     while True:
+        job = queue.get()
+        if isinstance(job, threading.Event):
+            queue.task_done()
+            if job is stop:
+                return None
+            continue
+        if stop.is_set():
+            queue.task_done()
+            return None
+        return job
+
+
+def _fetch_worker(stop: threading.Event):
+    """Resolve feed URLs from the fetch queue until told to stop."""
+    while True:
+        job = _next_job(fetch_queue, stop)
+        if job is None:
+            return
+        topic_id, feed_url = job
         try:
-            # Get the next item from the queue
-            if not processing_queue.empty():
-                topic_id, content, feed_item = processing_queue.get()
-
-                if feed_item.needs_further_processing:
-                    # Process the feed URL
-                    debug("FEED", "Processing URL", feed_item.url)
-                    process_feed_url(topic_id, feed_item.url)
-                else:
-                    # Process through curator chain
-                    debug("FEED", "Processing content", feed_item.url)
-                    result = process_feed_item(topic_id, content, feed_item)
-
-                    if result.get("refined_article"):
-                        # Trigger publishing after processing
-                        topic = get_topic(topic_id)
-                        if topic:
-                            handle_topic_publishing(topic)
-            else:
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.1)
+            process_feed_url(topic_id, feed_url)
+            _count("fetched")
+        except Exception as e:
+            _count("errors")
+            error("SYSTEM", "Fetch stage error", f"{feed_url}: {str(e)}")
+        finally:
+            fetch_queue.task_done()
+
 
+def _curate(topic_id: str, content: Optional[str], feed_item: Optional[FeedItem]):
+    """
+    Run one item through the curator and queue the topic for publishing.
+
+    The caller marks the item done in the curation queue once the topic's
+    bookkeeping is updated.
+    """
+    try:
+        debug("FEED", "Processing content", feed_item.url if feed_item else topic_id)
+        result = process_feed_item(topic_id, content, feed_item)
+        _count("curated")
+        if result.get("refined_article"):
+            queue_topic_publishing(topic_id)
+    except Exception as e:
+        _count("errors")
+        error("SYSTEM", "Curation stage error", f"{topic_id}: {str(e)}")
+
+
+def _curation_worker(stop: threading.Event):
+    """
+    Curate feed items from the curation queue until told to stop.
+
+    A worker that takes an item for a topic another worker is curating hands
+    it to that worker, which curates it after the current one.
+    """
+    while True:
+        job = _next_job(curation_queue, stop)
+        if job is None:
+            return
+        topic_id = job[0]
+        with _active_lock:
+            backlog = _active_topics.get(topic_id)
+            if backlog is not None:
+                backlog.append(job)
+                continue
+            _active_topics[topic_id] = deque()
+
+        while job is not None:
+            try:
+                _curate(*job)
+            finally:
+                with _active_lock:
+                    backlog = _active_topics[topic_id]
+                    if backlog:
+                        job = backlog.popleft()
+                    else:
+                        del _active_topics[topic_id]
+                        job = None
+                # Only now, so a joined queue never leaves the topic active
+                curation_queue.task_done()
+
+
+def _async_curation_worker(stop: threading.Event):
+    """
+    Hand feed items from the curation queue to the dispatcher until told to stop.
+
+    At most queue_size items are handed over and not yet curated, so the
+    curation queue keeps holding back the producers.
+    """
+    while True:
+        job = _next_job(curation_queue, stop)
+        if job is None:
+            return
+        _in_flight.acquire()
+        try:
+            future = submit_feed_item(*job)
         except Exception as e:
-            error("SYSTEM", "Queue processing error", str(e))
+            future = Future()
+            future.set_exception(e)
+        future.add_done_callback(
+            lambda future, topic_id=job[0]: _async_curation_done(topic_id, future)
+        )
 
 
-def add_feed_item_to_queue(topic_id: str, feed_item: FeedItem, content: str):
-    """Add a feed item to the processing queue."""
+def _async_curation_done(topic_id: str, future: Future):
+    """
+    Account for an item curated by the dispatcher and queue publishing.
 
-    debug("FEED", "Queuing item", feed_item.url)
+    Runs on the dispatcher's event loop thread, so it must never block.
+    """
+    try:
+        if future.cancelled():
+            debug("FEED", "Curation dropped", topic_id)
+            return
+        result = future.result()
+        _log_result(result)
+        _count("curated")
+        if result.get("refined_article"):
+            queue_topic_publishing(topic_id, block=False)
+    except Exception as e:
+        _count("errors")
+        error("SYSTEM", "Curation stage error", f"{topic_id}: {str(e)}")
+    finally:
+        _in_flight.release()
+        curation_queue.task_done()
+
+
+def _publish_worker(stop: threading.Event):
+    """Publish topics from the publish queue until told to stop."""
+    while True:
+        topic_id = _next_job(publish_queue, stop)
+        if topic_id is None:
+            return
+        with _publish_lock:
+            _pending_publish.discard(topic_id)
+        try:
+            topic = get_topic(topic_id)
+            if topic:
+                handle_topic_publishing(topic)
+                _count("published")
+        except Exception as e:
+            _count("errors")
+            error("SYSTEM", "Publish stage error", f"{topic_id}: {str(e)}")
+        finally:
+            publish_queue.task_done()
 
-    # Add directly to queue using the uniform format
-    processing_queue.put((topic_id, content, feed_item))
 
+def _start_workers(
+    name: str, target: Callable[[threading.Event], None], count: int
+) -> None:
+    """Start a pool of daemon worker threads for a stage."""
+    for index in range(count):
+        thread = threading.Thread(
+            target=target,
+            args=(_stop_event,),
+            name=f"{name}-worker-{index}",
+            daemon=True,
+        )
+        thread.start()
+        _workers.append(thread)
+
+
+def start_update_processor() -> List[threading.Thread]:
+    """Start the fetch, curation and publish worker pools."""
+    global _stop_event, _in_flight
+
+    with _pipeline_lock:
+        if _workers:
+            return list(_workers)
+
+        fetch_workers, curation_workers, publish_workers, queue_size = load_settings()
+        curation_mode, max_concurrency = load_curation_settings()
+        _stop_event = threading.Event()
+
+        # Bound the queues in place, keeping anything queued before startup
+        for queue in (fetch_queue, curation_queue, publish_queue):
+            queue.maxsize = queue_size
+
+        _start_workers("fetch", _fetch_worker, fetch_workers)
+        if curation_mode == "async":
+            _in_flight = threading.Semaphore(queue_size)
+            start_dispatcher(max_concurrency)
+            _start_workers("curation", _async_curation_worker, 1)
+            curation = f"async curation of {max_concurrency}"
+        else:
+            _start_workers("curation", _curation_worker, curation_workers)
+            curation = f"{curation_workers} curation"
+        _start_workers("publish", _publish_worker, publish_workers)
+        info(
+            "SYSTEM",
+            "Content processor started",
+            f"{fetch_workers} fetch, {curation}, {publish_workers} publish workers",
+        )
+        return list(_workers)
 
-def start_update_processor():
-    """Start the update processor thread."""
-    # Start queue processor thread
-    processor_thread = threading.Thread(target=process_queue, daemon=True)
-    processor_thread.start()
-    info("SYSTEM", "Content processor started", "Topic updater ready")
 
-    return processor_thread
+def stop_update_processor(timeout: float = 5) -> None:
+    """Stop the worker pools after their current jobs, dropping queued work."""
+    with _pipeline_lock:
+        _stop_event.set()
+
+        # Wake idle workers; busy ones see the stop event after their job
+        stages = {"fetch": fetch_queue, "curation": curation_queue}
+        for thread in _workers:
+            queue = stages.get(thread.name.split("-")[0], publish_queue)
+            try:
+                queue.put_nowait(_stop_event)
+            except Full:
+                pass
+
+        # Let the dispatcher finish its items, which frees a blocked hand-off
+        stop_dispatcher(timeout=timeout)
+        for thread in _workers:
+            thread.join(timeout=timeout)
+        _workers.clear()
+        clear_relevance_batches()
+
+
+def get_pipeline_stats() -> Dict[str, Any]:
+    """Get the queue depths, worker counts and processed item counters."""
+    with _active_lock:
+        active = len(_active_topics)
+    active += get_dispatcher_stats()["active_topics"]
+    with _stats_lock:
+        counters = dict(_pipeline_stats)
+    return {
+        "fetch_queue": fetch_queue.qsize(),
+        "curation_queue": curation_queue.qsize(),
+        "publish_queue": publish_queue.qsize(),
+        "workers": len(_workers),
+        "active_topics": active,
+        **counters,
+    }
 
 
 def process_feed_item(
     topic_id: str, feed_content: str = None, feed_item: FeedItem = None
-) -> None:
+) -> Dict[str, Any]:
     """
     Process a single feed item for a topic through the curator workflow.
 
@@ -146,20 +497,27 @@ def process_feed_item(
         topic_id: The ID of the topic
         feed_content: The content from the feed
         feed_item: The feed item being processed
+
+    Returns:
+        The final state of the curator run
     """
     # Use the new LangGraph implementation
     result = graph_process_feed_item(
         topic_id=topic_id, feed_content=feed_content, feed_item=feed_item
     )
 
-    # Handle the result as needed (most handling is done in the graph implementation)
+    _log_result(result)
+    return result
+
+
+def _log_result(result: Dict[str, Any]) -> None:
+    """Log a failed curator run (most handling is done in the graph implementation)."""
     if result.get("has_error"):
         debug(
             "CURATOR",
             "Processing failed",
             f"Step: {result.get('error_step')}, Error: {result.get('error_message')}",
         )
-    return result
 
 
 def process_feed_url(topic_id: str, feed_url: str):
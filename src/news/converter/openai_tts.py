@@ -78,12 +78,13 @@ class OpenAITTS(Converter):
             info("TTS", "Starting conversion", f"Article: {article.title}")
 
             # Use the most recent representation's content, or fall back to article content
-            if article.representations:
-                content = article.representations[-1].content
+            representation = article.get_latest_text_representation()
+            if representation:
+                content = representation.content
                 info(
                     "TTS",
                     "Using previous representation",
-                    f"Type: {article.representations[-1].type}",
+                    f"Type: {representation.type}",
                 )
             else:
                 content = article.content
@@ -121,7 +122,7 @@ class OpenAITTS(Converter):
             )
             article.add_representation(
                 content_type,
-                audio_bytes.hex(),
+                audio_bytes,
                 {"format": "mp3", "binary": True, "extension": "mp3"},
             )
             return True
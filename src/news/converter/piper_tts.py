@@ -261,12 +261,13 @@ class PiperTTS(Converter):
                 _, voice_key = content_type.split("/", 1)
 
             # Use the most recent representation's content, or fall back to article content
-            if article.representations:
-                content = article.representations[-1].content
+            representation = article.get_latest_text_representation()
+            if representation:
+                content = representation.content
                 info(
                     "PIPER_TTS",
                     "Using previous representation",
-                    f"Type: {article.representations[-1].type}",
+                    f"Type: {representation.type}",
                 )
             else:
                 content = article.content
@@ -315,7 +316,7 @@ class PiperTTS(Converter):
             )
             article.add_representation(
                 content_type,
-                audio_bytes.hex(),
+                audio_bytes,
                 {"format": "mp3", "binary": True, "extension": "mp3"},
             )
             return True
@@ -145,21 +145,13 @@ class PodcastEpisodeRSSConverter(Converter):
         """
         # Look for MP3 data in representations
         for rep in article.representations:
-            # Check if it's MP3 data (binary data or has binary metadata)
-            if getattr(rep.metadata, "format", "") == "mp3":
-                rep_data = rep.content
-                # If it's binary data
-                if isinstance(rep_data, bytes):
-                    return len(rep_data)
-                # If it's a hex string
-                elif isinstance(rep_data, str):
-                    try:
-                        # Try to convert hex to bytes to get size
-                        binary_data = bytes.fromhex(rep_data)
-                        return len(binary_data)
-                    except ValueError:
-                        # If not hex, might be base64 or just the content
-                        return len(rep_data.encode("utf-8"))
+            if rep.metadata and rep.metadata.get("format") == "mp3":
+                try:
+                    # Stats file-backed data, decodes legacy hex strings
+                    return rep.get_size()
+                except ValueError:
+                    # Not hex encoded, use the size of the text content
+                    return len(rep.content.encode("utf-8"))
 
         # Default size if no MP3 data found
         return 0
@@ -305,13 +297,15 @@ class PodcastEpisodeRSSConverter(Converter):
         pub_date = SubElement(item, "pubDate")
         pub_date.text = article.created_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
 
-        # Get content from the latest representation or fall back to article.content
-        if article.representations:
-            content = article.representations[-1].content
+        # Get content from the latest text representation, e.g. not the MP3
+        # itself, or fall back to article.content
+        representation = article.get_latest_text_representation()
+        if representation:
+            content = representation.content
             debug(
                 "PODCAST",
                 "Using previous representation",
-                f"Type: {article.representations[-1].type}",
+                f"Type: {representation.type}",
             )
         else:
             content = article.content
@@ -68,12 +68,13 @@ Use a clear, concise style appropriate for the content.
             info("PROMPT", "Starting conversion", f"Article: {article.title}")
 
             # Use the most recent representation's content, or fall back to article content
-            if article.representations:
-                content = article.representations[-1].content
+            representation = article.get_latest_text_representation()
+            if representation:
+                content = representation.content
                 info(
                     "PROMPT",
                     "Using previous representation",
-                    f"Type: {article.representations[-1].type}",
+                    f"Type: {representation.type}",
                 )
             else:
                 content = article.content
@@ -1,13 +1,18 @@
 """Base interface for feed connectors."""
 
-from typing import Any, Dict, List, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from typing_extensions import runtime_checkable
 
-from api.db.cache_manager import add_to_cache, get_from_cache
+from api.db.cache_manager import (
+    add_to_cache,
+    get_from_cache,
+    get_stale_from_cache,
+    touch_cache_entry,
+)
 from api.models.feed_item import FeedItem
-from curator.topic_updater import processing_queue
-from utils.logging import debug, error, info
+from curator.topic_updater import add_feed_item_to_queue
+from utils.logging import debug, error, info, warning
 
 
 @runtime_checkable
@@ -37,6 +42,81 @@ class FeedConnector(Protocol):
         """
         ...
 
+    @classmethod
+    def fetch_content_conditional(
+        cls, url: str, validators: Dict[str, str]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, str]]:
+        """
+        Fetch content unless it is unchanged since it was last fetched.
+
+        Connectors that support conditional requests override this; by default
+        the content is always fetched.
+
+        Args:
+            url: The URL to fetch
+            validators: Validators of the cached response, with optional
+                'etag' and 'last_modified' keys
+
+        Returns:
+            Tuple of (items, or None if not modified; validators of the response)
+        """
+        return cls.fetch_content(url), {}
+
+    @classmethod
+    def refresh_content(cls, feed_url: str) -> List[Dict[str, Any]]:
+        """
+        Fetch fresh content, revalidating an expired cache entry if there is one.
+
+        A not-modified response extends the cached entry instead of downloading
+        it again. If the refresh fails or returns nothing, the expired entry is
+        served until a later refresh succeeds.
+
+        Args:
+            feed_url: The URL to refresh
+
+        Returns:
+            List of content items
+        """
+        connector = cls.__name__
+        stale = (
+            get_stale_from_cache(feed_url, connector)
+            if cls.cache_expiration != 0
+            else None
+        )
+        validators = stale.get("validators", {}) if stale else {}
+
+        try:
+            items, validators = cls.fetch_content_conditional(feed_url, validators)
+        except Exception as e:
+            if stale is None:
+                raise
+            warning(
+                "FEED",
+                "Refresh failed, using stale data",
+                f"URL: {feed_url}, Error: {str(e)}",
+            )
+            return stale["items"]
+
+        if items is None:
+            debug("FEED", "Content not modified", feed_url)
+            touch_cache_entry(feed_url, cls.cache_expiration)
+            return stale["items"] if stale else []
+        if not items and stale:
+            warning("FEED", "Refresh returned no items, using stale data", feed_url)
+            return stale["items"]
+
+        info("FEED", "Content fetched", f"Items: {len(items)}, URL: {feed_url}")
+
+        # Cache the results if caching is enabled
+        if cls.cache_expiration != 0 and items:
+            add_to_cache(
+                feed_url,
+                {"items": items, "validators": validators},
+                cls.cache_expiration,
+                connector,
+            )
+        return items
+
     @classmethod
     def handle_feed_update(cls, topic_id: str, feed_url: str):
         """
@@ -61,18 +141,13 @@ class FeedConnector(Protocol):
         debug("FEED", "Using handler", f"URL: {feed_url}, Handler: {cls.__name__}")
         try:
             # Check cache first
-            cached_data = get_from_cache(feed_url)
+            cached_data = get_from_cache(feed_url, cls.__name__)
             if cached_data:
                 debug("FEED", "Using cached data", feed_url)
                 items = cached_data["items"]
             else:
                 # Fetch fresh content
-                items = cls.fetch_content(feed_url)
-                info("FEED", "Content fetched", f"Items: {len(items)}, URL: {feed_url}")
-
-            # Cache the results if caching is enabled
-            if cls.cache_expiration != 0 and items:
-                add_to_cache(feed_url, {"items": items}, cls.cache_expiration)
+                items = cls.refresh_content(feed_url)
 
             # Process each item
             for item in items:
@@ -81,17 +156,7 @@ class FeedConnector(Protocol):
                     item.get("content", ""),
                     item.get("needs_further_processing", False),
                 )
-                processing_queue.put(
-                    (
-                        topic_id,
-                        (
-                            item.get("content")
-                            if not feed_item.needs_further_processing
-                            else None
-                        ),
-                        feed_item,
-                    )
-                )
+                add_feed_item_to_queue(topic_id, feed_item, item.get("content"))
                 # process_feed_item(topic_id, item.get("url"))
                 # cls._process_feed_item(item, topic_id)
 
@@ -5,7 +5,7 @@ RSS connector for fetching links from RSS feeds.
 import ssl
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import feedparser
@@ -48,27 +48,67 @@ def get_pub_date(entry) -> datetime:
         return datetime.min
 
 
-def fetch_rss_links(url: str) -> List[Dict[str, Any]]:
+def fetch_rss_feed(
+    url: str, validators: Optional[Dict[str, str]] = None
+) -> feedparser.FeedParserDict:
     """
-    Fetch all entries from an RSS feed and return their links.
+    Fetch and parse an RSS feed.
 
     Args:
         url: The RSS feed URL
+        validators: Optional 'etag' and 'last_modified' values of a previous
+            response, sent so the server can answer 304 Not Modified
 
     Returns:
-        List of dicts containing title, link, and published date
+        The parsed feed, with status 304 and no entries if not modified
     """
     # Disable SSL verification
     if hasattr(ssl, "_create_unverified_context"):
         ssl._create_default_https_context = ssl._create_unverified_context
 
-    feed = feedparser.parse(url)
-    entries = feed.entries
+    validators = validators or {}
+    return feedparser.parse(
+        url, etag=validators.get("etag"), modified=validators.get("last_modified")
+    )
+
+
+def get_feed_validators(feed: feedparser.FeedParserDict) -> Dict[str, str]:
+    """Get the ETag and Last-Modified values of a fetched feed."""
+    validators = {}
+    if feed.get("etag"):
+        validators["etag"] = feed["etag"]
+    if feed.get("modified"):
+        validators["last_modified"] = feed["modified"]
+    return validators
+
+
+def fetch_rss_links(url: str) -> List[Dict[str, Any]]:
+    """
+    Fetch all entries from an RSS feed and return their links.
+
+    Args:
+        url: The RSS feed URL
+
+    Returns:
+        List of dicts containing title, link, and published date
+    """
+    feed = fetch_rss_feed(url)
 
     # Sort entries by published date (oldest to newest)
-    sorted_entries = sorted(entries, key=get_pub_date)
+    return sorted(feed.entries, key=get_pub_date)
 
-    return sorted_entries
+
+def entries_to_items(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert feed entries to content items for further processing."""
+    return [
+        {
+            "url": entry.get("link", ""),
+            "content": f"{entry.get('title', '')}\n\n{entry.get('summary', '')}",
+            "title": entry.get("title", ""),
+            "needs_further_processing": True,  # Mark RSS items as needing further processing
+        }
+        for entry in entries
+    ]
 
 
 class RSSConnector(FeedConnector):
@@ -85,16 +125,21 @@ class RSSConnector(FeedConnector):
     @staticmethod
     def fetch_content(url: str) -> List[Dict[str, Any]]:
         try:
-            entries = fetch_rss_links(url)
-            return [
-                {
-                    "url": entry.get("link", ""),
-                    "content": f"{entry.get('title', '')}\n\n{entry.get('summary', '')}",
-                    "title": entry.get("title", ""),
-                    "needs_further_processing": True,  # Mark RSS items as needing further processing
-                }
-                for entry in entries
-            ]
+            return entries_to_items(fetch_rss_links(url))
         except Exception as e:
             error("RSS", "Fetch failed", f"URL: {url}, Error: {str(e)}")
             return []
+
+    @staticmethod
+    def fetch_content_conditional(
+        url: str, validators: Dict[str, str]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, str]]:
+        try:
+            feed = fetch_rss_feed(url, validators)
+            if feed.get("status") == 304:
+                return None, validators
+            entries = sorted(feed.entries, key=get_pub_date)
+            return entries_to_items(entries), get_feed_validators(feed)
+        except Exception as e:
+            error("RSS", "Fetch failed", f"URL: {url}, Error: {str(e)}")
+            return [], {}
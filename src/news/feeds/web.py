@@ -2,7 +2,7 @@
 Web connector for fetching and parsing webpage content.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -33,7 +33,55 @@ def fetch_webpage(url: str) -> Dict[str, Any]:
     response = requests.get(url, headers=HEADERS, timeout=15)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return parse_webpage(url, response.text)
+
+
+def fetch_webpage_conditional(
+    url: str, validators: Dict[str, str]
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+    """
+    Fetch a webpage unless it is unchanged since a previous response.
+
+    Args:
+        url: The webpage URL to fetch
+        validators: Optional 'etag' and 'last_modified' values of a previous
+            response
+
+    Returns:
+        Tuple of (title and main content, or None if not modified; validators
+        of the response)
+    """
+    headers = dict(HEADERS)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = requests.get(url, headers=headers, timeout=15)
+    if response.status_code == 304:
+        return None, validators
+    response.raise_for_status()
+
+    new_validators = {}
+    if response.headers.get("ETag"):
+        new_validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        new_validators["last_modified"] = response.headers["Last-Modified"]
+    return parse_webpage(url, response.text), new_validators
+
+
+def parse_webpage(url: str, html: str) -> Dict[str, Any]:
+    """
+    Extract the title and useful text from a webpage.
+
+    Args:
+        url: The webpage URL
+        html: The HTML of the webpage
+
+    Returns:
+        Dict containing title and main content
+    """
+    soup = BeautifulSoup(html, "html.parser")
 
     # Get title
     title = soup.title.string if soup.title else ""
@@ -66,3 +114,14 @@ class WebConnector(FeedConnector):
         except Exception as e:
             error("WEB", "Fetch failed", f"URL: {url}, Error: {str(e)}")
             return []
+
+    @staticmethod
+    def fetch_content_conditional(
+        url: str, validators: Dict[str, str]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Dict[str, str]]:
+        try:
+            content, validators = fetch_webpage_conditional(url, validators)
+            return (None if content is None else [content]), validators
+        except Exception as e:
+            error("WEB", "Fetch failed", f"URL: {url}, Error: {str(e)}")
+            return [], {}
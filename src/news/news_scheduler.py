@@ -1,14 +1,12 @@
 """Scheduler for automatically updating topics."""
 
-import os
 import threading
 from datetime import datetime, timedelta
 
-import yaml
-
 from api.db.topic_db import list_topics
 from api.models.topic import Topic
 from curator.topic_updater import queue_topic_update
+from services.settings_service import get_setting
 from utils.logging import error, info
 
 # Default configuration values
@@ -23,22 +21,19 @@ _stop_event = threading.Event()
 
 
 def load_settings():
-    """Load scheduler settings from settings.yaml."""
+    """Load scheduler settings from the memoized settings service."""
     try:
-        if os.path.exists("settings.yaml"):
-            with open("settings.yaml", "r") as f:
-                settings = yaml.safe_load(f) or {}
-                scheduler_settings = settings.get("scheduler", {})
+        scheduler_settings = get_setting("scheduler") or {}
 
-                update_interval = scheduler_settings.get(
-                    "update_interval_minutes", DEFAULT_UPDATE_INTERVAL_MINUTES
-                )
-                threshold_hours = scheduler_settings.get(
-                    "update_threshold_hours", DEFAULT_TOPIC_UPDATE_THRESHOLD_HOURS
-                )
-                enabled = scheduler_settings.get("enabled", DEFAULT_SCHEDULER_ENABLED)
+        update_interval = scheduler_settings.get(
+            "update_interval_minutes", DEFAULT_UPDATE_INTERVAL_MINUTES
+        )
+        threshold_hours = scheduler_settings.get(
+            "update_threshold_hours", DEFAULT_TOPIC_UPDATE_THRESHOLD_HOURS
+        )
+        enabled = scheduler_settings.get("enabled", DEFAULT_SCHEDULER_ENABLED)
 
-                return update_interval, threshold_hours, enabled
+        return update_interval, threshold_hours, enabled
     except Exception as e:
         error("SCHEDULER", "Error loading settings", str(e))
 
@@ -1,6 +1,8 @@
 """File system publisher for storing content in files."""
 
 from pathlib import Path
+from shutil import copyfile
+from typing import Union
 from urllib.parse import unquote, urlparse
 
 from api.models.article import Article
@@ -26,19 +28,23 @@ class FilePublisher(Publisher):
         return parsed.scheme == "file"
 
     @staticmethod
-    def write_content(path: Path, content: str, is_binary: bool = False) -> None:
+    def write_content(
+        path: Path, content: Union[str, bytes], is_binary: bool = False
+    ) -> None:
         """Write content to file, handling both text and binary data."""
         debug("FILE", "Creating directory", str(path.parent))
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if is_binary:
-            # Convert hex string back to bytes
+        if is_binary or isinstance(content, bytes):
+            # Hex strings come from representations written by older versions
+            binary_data = (
+                content if isinstance(content, bytes) else bytes.fromhex(content)
+            )
             debug(
                 "FILE",
                 "Writing binary content",
-                f"Path: {path}, Size: {len(content)//2} bytes",
+                f"Path: {path}, Size: {len(binary_data)} bytes",
             )
-            binary_data = bytes.fromhex(content)
             with open(path, "wb") as f:
                 f.write(binary_data)
         else:
@@ -59,9 +65,15 @@ class FilePublisher(Publisher):
             # Use the most recent representation if available, otherwise use article content
             if article.representations:
                 rep = article.representations[-1]
-                content = rep.content
-                is_binary = rep.metadata.get("binary", False)
                 info("FILE", "Using representation", f"Type: {rep.type}")
+                if rep.content_path is not None and rep.is_binary:
+                    # Copy binary data straight from the vault
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    copyfile(rep.content_path, file_path)
+                    info("FILE", "Published successfully", f"Path: {file_path}")
+                    return True
+                content = rep.content
+                is_binary = rep.is_binary
             else:
                 content = article.content
                 is_binary = False
@@ -135,8 +135,8 @@ class FTPPublisher(Publisher):
             # Use the most recent representation if available, otherwise use article content
             if article.representations:
                 rep = article.representations[-1]
-                content = rep.content
-                is_binary = rep.metadata.get("binary", False)
+                content = rep.get_bytes() if rep.is_binary else rep.content
+                is_binary = rep.is_binary
                 info("FTP", "Using representation", f"Type: {rep.type}")
             else:
                 content = article.content
@@ -147,8 +147,7 @@ class FTPPublisher(Publisher):
 
             # Create a file-like object in memory
             if is_binary:
-                # Convert hex string back to bytes
-                binary_data = bytes.fromhex(content)
+                binary_data = content
                 file_obj = io.BytesIO(binary_data)
                 debug(
                     "FTP", "Prepared binary content", f"Size: {len(binary_data)} bytes"
@@ -1,5 +1,6 @@
 """GitLab publisher for committing content to GitLab repositories."""
 
+import base64
 import os
 from urllib.parse import urlparse
 
@@ -81,9 +82,15 @@ class GitLabPublisher(Publisher):
             token = get_api_key()
 
             # Use the most recent representation if available, otherwise use article content
+            encoding = "text"
             if article.representations:
                 rep = article.representations[-1]
-                content = rep.content
+                if rep.is_binary:
+                    # JSON cannot carry raw bytes, GitLab decodes base64 content
+                    content = base64.b64encode(rep.get_bytes()).decode("ascii")
+                    encoding = "base64"
+                else:
+                    content = rep.content
                 info("GITLAB", "Using representation", f"Type: {rep.type}")
             else:
                 content = article.content
@@ -109,7 +116,12 @@ class GitLabPublisher(Publisher):
                 "branch": branch,
                 "commit_message": f"Update {file_path} via SynthPub",
                 "actions": [
-                    {"action": "update", "file_path": file_path, "content": content}
+                    {
+                        "action": "update",
+                        "file_path": file_path,
+                        "content": content,
+                        "encoding": encoding,
+                    }
                 ],
             }
             debug(
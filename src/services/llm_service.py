@@ -1,54 +1,244 @@
+"""
+LLM client registry with rate limits shared per provider.
+
+Chat model clients are created once per (provider, model, max_tokens) and
+reused by every step that asks for them, so their HTTP connections are kept
+alive between calls. All clients of a provider share one token bucket that
+limits requests per second and, optionally, tokens per minute. The registry
+is rebuilt when the LLM settings, the rate limits or the environment variables
+(which hold the API keys) change. Async callers additionally hold a provider
+slot while a request is in flight, which caps the concurrent requests per
+provider.
+
+The limits are configured per provider in settings.yaml:
+
+    llm_rate_limits:
+      openai:
+        requests_per_second: 0.75
+        tokens_per_minute: 90000   # 0 or missing for no token limit
+        max_concurrency: 4         # concurrent async requests
+"""
+
+import asyncio
 import os
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 
-import yaml
 from langchain.chat_models import init_chat_model
 from langchain.globals import set_llm_cache
 from langchain_core.caches import InMemoryCache
-from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+
+from services.settings_service import get_setting
 
 set_llm_cache(InMemoryCache())
 
+DEFAULT_REQUESTS_PER_SECOND = 0.75
+DEFAULT_MAX_CONCURRENCY = 4
 
-def load_llm_settings():
-    """Load LLM settings from settings.yaml"""
-    if os.path.exists("settings.yaml"):
-        with open("settings.yaml", "r") as f:
-            settings = yaml.safe_load(f)
-            return settings.get("llm", {})
-    return {}
+# Settings whose changes invalidate the registry
+REGISTRY_SETTINGS = ("llm", "llm_rate_limits", "env_vars")
 
+# Map providers to their API key environment variables
+PROVIDER_API_KEYS = {
+    "openai": "OPENAI_API_KEY",
+    "mistralai": "MISTRAL_API_KEY",
+}
 
-def get_llm(task: str):
-    """
-    Initialize the LLM based on the task and configuration.
+ClientKey = Tuple[str, str, int]
 
-    Args:
-        task: The task for which the LLM is needed ('article_generation' or 'article_refinement')
+_clients: Dict[ClientKey, Any] = {}
+_rate_limiters: Dict[str, "ProviderRateLimiter"] = {}
 
-    Returns:
-        An instance of the LLM
+# Provider semaphores per event loop, as asyncio primitives are bound to a loop
+ProviderSlots = Dict[str, asyncio.Semaphore]
+_provider_slots: "weakref.WeakKeyDictionary[Any, ProviderSlots]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Values of REGISTRY_SETTINGS the clients and limiters were created with
+_registry_settings: Optional[Dict[str, Any]] = None
+_registry_lock = threading.Lock()
+
+
+class ProviderRateLimiter(BaseRateLimiter):
+    """
+    Token bucket limiting the requests and tokens sent to one provider.
+
+    Requests are admitted while both buckets hold credit. Token usage is only
+    known once a response arrives, so it is charged afterwards through
+    record_tokens and may leave the token bucket in debt, which delays the
+    following requests until it has refilled.
     """
-    settings = load_llm_settings()
-    task_settings = settings.get(task, {})
 
-    provider = task_settings.get("provider", "openai")
-    model_name = task_settings.get("model_name", "gpt-4")
-    max_tokens = task_settings.get("max_tokens", 800)
+    def __init__(
+        self,
+        requests_per_second: float,
+        tokens_per_minute: int = 0,
+        check_every_n_seconds: float = 0.1,
+    ):
+        """
+        Create a limiter with full buckets.
 
-    # Create rate limiter
-    rate_limiter = InMemoryRateLimiter(
-        requests_per_second=0.75,
-    )
+        Args:
+            requests_per_second: Requests admitted per second, 0 for no limit
+            tokens_per_minute: Tokens used per minute, 0 for no limit
+            check_every_n_seconds: Polling interval while waiting for credit
+        """
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self.check_every_n_seconds = check_every_n_seconds
+        self._request_credit = 1.0
+        self._token_credit = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the credit earned since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_credit = min(
+            1.0, self._request_credit + elapsed * self.requests_per_second
+        )
+        self._token_credit = min(
+            float(self.tokens_per_minute),
+            self._token_credit + elapsed * self.tokens_per_minute / 60,
+        )
+
+    def _consume(self) -> bool:
+        """Admit a request if both buckets have credit."""
+        with self._lock:
+            self._refill()
+            if self.requests_per_second > 0 and self._request_credit < 1:
+                return False
+            if self.tokens_per_minute > 0 and self._token_credit <= 0:
+                return False
+            if self.requests_per_second > 0:
+                self._request_credit -= 1
+            return True
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Wait until a request may be sent, or check once if not blocking."""
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            time.sleep(self.check_every_n_seconds)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Wait without blocking the event loop until a request may be sent."""
+        if not blocking:
+            return self._consume()
+        while not self._consume():
+            await asyncio.sleep(self.check_every_n_seconds)
+        return True
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charge the tokens used by a completed request."""
+        if self.tokens_per_minute <= 0:
+            return
+        with self._lock:
+            self._refill()
+            self._token_credit -= tokens
+
+
+class _TokenUsageRecorder(BaseCallbackHandler):
+    """Charges the tokens reported in responses to a provider's limiter."""
+
+    def __init__(self, rate_limiter: ProviderRateLimiter):
+        """Record usage on the given limiter."""
+        self.rate_limiter = rate_limiter
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Charge the total tokens of a finished request."""
+        self.rate_limiter.record_tokens(_count_tokens(response))
+
+
+def _count_tokens(response: LLMResult) -> int:
+    """Get the total tokens used by a response, 0 if not reported."""
+    tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                tokens += usage.get("total_tokens", 0)
+    if not tokens and response.llm_output:
+        tokens = (response.llm_output.get("token_usage") or {}).get("total_tokens", 0)
+    return tokens
+
+
+def load_llm_settings():
+    """Load LLM settings from the memoized settings service."""
+    return get_setting("llm") or {}
+
+
+def _sync_registry() -> None:
+    """Drop the clients and limiters if settings they depend on changed."""
+    global _registry_settings
+
+    # Read before locking: a settings reload notifies subscribers synchronously
+    snapshot = {key: get_setting(key) for key in REGISTRY_SETTINGS}
+    with _registry_lock:
+        if snapshot != _registry_settings:
+            _clients.clear()
+            _rate_limiters.clear()
+            _provider_slots.clear()
+            _registry_settings = snapshot
 
-    # Map providers to their API key environment variables
-    provider_api_keys = {
-        "openai": "OPENAI_API_KEY",
-        "mistralai": "MISTRAL_API_KEY",
-    }
+
+def clear_llm_clients() -> None:
+    """Drop all clients and rate limiters; they are recreated on next use."""
+    global _registry_settings
+
+    with _registry_lock:
+        _clients.clear()
+        _rate_limiters.clear()
+        _provider_slots.clear()
+        _registry_settings = None
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """Get the rate limiter shared by all clients of a provider."""
+    _sync_registry()
+    with _registry_lock:
+        return _get_rate_limiter(provider)
+
+
+def _provider_limits(provider: str) -> Dict[str, Any]:
+    """Get a provider's configured limits; the registry lock must be held."""
+    return (_registry_settings["llm_rate_limits"] or {}).get(provider) or {}
+
+
+def _get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """Get or create a provider's rate limiter; the registry lock must be held."""
+    rate_limiter = _rate_limiters.get(provider)
+    if rate_limiter is None:
+        limits = _provider_limits(provider)
+        rate_limiter = ProviderRateLimiter(
+            requests_per_second=float(
+                limits.get("requests_per_second", DEFAULT_REQUESTS_PER_SECOND)
+            ),
+            tokens_per_minute=int(limits.get("tokens_per_minute", 0)),
+        )
+        _rate_limiters[provider] = rate_limiter
+    return rate_limiter
+
+
+def _create_client(key: ClientKey, rate_limiter: ProviderRateLimiter):
+    """Create a chat model client for a (provider, model, max_tokens) key."""
+    provider, model_name, max_tokens = key
 
     # Prepare API key if needed
     api_key = None
-    api_key_env = provider_api_keys[provider]
+    api_key_env = PROVIDER_API_KEYS[provider]
     if api_key_env:
         api_key = os.getenv(api_key_env)
         if not api_key:
@@ -60,5 +250,66 @@ def get_llm(task: str):
         api_key=api_key,
         max_tokens=max_tokens,
         rate_limiter=rate_limiter,
+        callbacks=[_TokenUsageRecorder(rate_limiter)],
         temperature=0,
     )
+
+
+def _client_key(task: str) -> ClientKey:
+    """Get the (provider, model, max_tokens) key configured for a task."""
+    task_settings = load_llm_settings().get(task, {})
+    return (
+        task_settings.get("provider", "openai"),
+        task_settings.get("model_name", "gpt-4"),
+        task_settings.get("max_tokens", 800),
+    )
+
+
+def get_llm(task: str):
+    """
+    Get the shared LLM client configured for a task.
+
+    Args:
+        task: The task for which the LLM is needed ('article_generation' or 'article_refinement')
+
+    Returns:
+        An instance of the LLM
+    """
+    key = _client_key(task)
+
+    _sync_registry()
+    with _registry_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _create_client(key, _get_rate_limiter(key[0]))
+            _clients[key] = client
+        return client
+
+
+@asynccontextmanager
+async def provider_slot(task: str) -> AsyncIterator[None]:
+    """
+    Hold one of the concurrent request slots of the provider used by a task.
+
+    Wrap each async LLM call in this context so that no more than the
+    provider's max_concurrency requests are in flight on the running loop.
+
+    Args:
+        task: The task whose configured provider is limited
+    """
+    provider = _client_key(task)[0]
+    loop = asyncio.get_running_loop()
+
+    _sync_registry()
+    with _registry_lock:
+        slots = _provider_slots.setdefault(loop, {})
+        semaphore = slots.get(provider)
+        if semaphore is None:
+            limit = _provider_limits(provider).get(
+                "max_concurrency", DEFAULT_MAX_CONCURRENCY
+            )
+            semaphore = asyncio.Semaphore(int(limit))
+            slots[provider] = semaphore
+
+    async with semaphore:
+        yield
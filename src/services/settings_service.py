@@ -0,0 +1,154 @@
+"""
+Settings service providing a process-wide, memoized view of settings.yaml.
+
+The file is parsed once and reused for as long as its modification time and
+size stay the same, so hot paths can read settings without paying for a YAML
+parse on every call. Writes through save_settings invalidate the cached copy
+and notify subscribers registered with subscribe.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+SETTINGS_FILE = "settings.yaml"
+
+# Cached settings and the (mtime_ns, size) signature they were parsed from
+_settings: Dict[str, Any] = {}
+_settings_signature: Optional[Tuple[int, int]] = None
+_settings_loaded = False
+_settings_valid = False
+_settings_lock = threading.Lock()
+
+# Callbacks invoked with the new settings whenever they change
+_subscribers: List[Callable[[Dict[str, Any]], None]] = []
+
+
+def _get_file_signature() -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) of the settings file, or None if missing."""
+    try:
+        stat = os.stat(SETTINGS_FILE)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_settings_file() -> Dict[str, Any]:
+    """Parse the settings file from disk."""
+    if not os.path.exists(SETTINGS_FILE):
+        return {}
+    with open(SETTINGS_FILE, "r") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _notify_subscribers(settings: Dict[str, Any]) -> None:
+    """Call every subscriber with a copy of the new settings."""
+    for callback in list(_subscribers):
+        try:
+            callback(dict(settings))
+        except Exception as e:
+            # Imported here: utils.logging imports api.db, which reads settings
+            from utils.logging import error
+
+            error("CONFIG", "Settings subscriber failed", f"{callback!r}: {e}")
+
+
+def _refresh_settings() -> Dict[str, Any]:
+    """Re-parse the settings file if it changed since the last read."""
+    global _settings, _settings_signature, _settings_loaded, _settings_valid
+
+    signature = _get_file_signature()
+    with _settings_lock:
+        if _settings_valid and signature == _settings_signature:
+            return _settings
+
+        previous = _settings
+        _settings = _read_settings_file()
+        _settings_signature = signature
+        was_loaded = _settings_loaded
+        _settings_loaded = True
+        _settings_valid = True
+        settings = _settings
+
+    if was_loaded and settings != previous:
+        _notify_subscribers(settings)
+    return settings
+
+
+def load_settings() -> Dict[str, Any]:
+    """
+    Load settings, re-parsing settings.yaml only when it changed on disk.
+
+    Returns a shallow copy so callers can set top-level keys before passing
+    the result to save_settings. Nested values are shared and read-only.
+    """
+    return dict(_refresh_settings())
+
+
+def get_setting(key: str, default: Any = None) -> Any:
+    """Get a single top-level setting without copying the settings dict."""
+    return _refresh_settings().get(key, default)
+
+
+def save_settings(settings: Dict[str, Any]) -> None:
+    """Save settings to YAML file and invalidate the cached copy."""
+    # Convert any Path objects to strings before saving
+    serializable_settings = {}
+    for key, value in settings.items():
+        if isinstance(value, Path):
+            serializable_settings[key] = str(value)
+        elif isinstance(value, dict):
+            serializable_settings[key] = value
+        else:
+            serializable_settings[key] = str(value)
+
+    with open(SETTINGS_FILE, "w") as f:
+        yaml.safe_dump(serializable_settings, f, sort_keys=False, allow_unicode=True)
+
+    invalidate_settings()
+    _refresh_settings()
+
+
+def invalidate_settings() -> None:
+    """Force the next read to re-parse the settings file."""
+    global _settings_valid
+    with _settings_lock:
+        _settings_valid = False
+
+
+def subscribe(callback: Callable[[Dict[str, Any]], None]) -> None:
+    """
+    Register a callback that receives the new settings whenever they change.
+
+    Args:
+        callback: Function taking the updated settings dict
+    """
+    if callback not in _subscribers:
+        _subscribers.append(callback)
+
+
+def unsubscribe(callback: Callable[[Dict[str, Any]], None]) -> None:
+    """Remove a previously registered settings callback."""
+    if callback in _subscribers:
+        _subscribers.remove(callback)
+
+
+def apply_env_vars(settings: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Export the env_vars section of the settings to os.environ.
+
+    Args:
+        settings: Settings to apply, defaults to the current settings
+
+    Returns:
+        Number of environment variables that were set
+    """
+    if settings is None:
+        settings = load_settings()
+    env_vars = settings.get("env_vars") or {}
+    for key, value in env_vars.items():
+        os.environ[key] = value
+    return len(env_vars)
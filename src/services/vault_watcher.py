@@ -0,0 +1,365 @@
+"""
+Watcher that keeps the vault caches in sync with changes made on disk.
+
+The vault is plain files that may be edited outside the application, e.g. by
+git pulls, Obsidian or rsync. When enabled, the watcher picks up changes to
+metadata.yaml, article.md and processed_feeds.jsonl files and updates only the
+affected entries of the entity, project, topic and article caches. Files this
+process wrote itself are already reflected in the caches and are ignored.
+
+On Linux the watcher uses inotify through libc; elsewhere, or when inotify is
+unavailable, it polls file mtimes. It is configured in settings.yaml:
+
+    vault_watcher:
+      enabled: true
+      backend: auto            # auto, inotify or polling
+      poll_interval_seconds: 2
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from api.db import article_db, common, entity_index, project_db, topic_db
+from services.settings_service import get_setting
+from utils.logging import debug, error, info
+
+DEFAULT_POLL_INTERVAL_SECONDS = 2
+
+# Changes arriving within this window are applied together
+DEBOUNCE_SECONDS = 0.5
+
+# Files whose changes affect the caches
+WATCHED_FILES = {"metadata.yaml", "article.md", "processed_feeds.jsonl"}
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+_watcher_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+_watcher_stats = {"changes": 0, "errors": 0, "ignored": 0}
+
+
+def load_settings() -> Tuple[bool, str, float]:
+    """Load the watcher settings as (enabled, backend, poll interval)."""
+    settings = get_setting("vault_watcher") or {}
+    return (
+        bool(settings.get("enabled", False)),
+        settings.get("backend", "auto"),
+        float(settings.get("poll_interval_seconds", DEFAULT_POLL_INTERVAL_SECONDS)),
+    )
+
+
+def _entity_dirs(vault_path: Path) -> Iterable[Path]:
+    """Yield the vault's project, topic and article directories."""
+    stack = [(vault_path, 0)]
+    while stack:
+        path, depth = stack.pop()
+        if depth:
+            yield path
+        if depth >= entity_index.MAX_DEPTH:
+            continue
+        try:
+            with os.scandir(path) as entries:
+                subdirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        except OSError:
+            continue
+        stack.extend((subdir, depth + 1) for subdir in subdirs)
+
+
+def _snapshot(vault_path: Path) -> Dict[Path, Tuple[int, int]]:
+    """Get the (mtime_ns, size) of every watched file in the vault."""
+    signatures = {}
+    for entity_dir in _entity_dirs(vault_path):
+        for name in WATCHED_FILES:
+            path = entity_dir / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signatures[path] = (stat.st_mtime_ns, stat.st_size)
+    return signatures
+
+
+def _remove_entities(entity_dir: Path) -> None:
+    """Drop every cached entity stored in or below a removed directory."""
+    for entity_id, entity_type, path in common.get_entities_below(entity_dir):
+        if entity_type == "project":
+            project_db.evict_project(entity_id)
+        elif entity_type == "topic":
+            topic_db.evict_topic(entity_id, path)
+        else:
+            article_db.evict_cached_article(entity_id)
+        common.remove_from_entity_cache(entity_id)
+
+
+def apply_change(vault_path: Path, path: Path) -> None:
+    """
+    Update the caches for a changed file or directory in the vault.
+
+    Args:
+        vault_path: Path of the vault
+        path: The watched file or entity directory that changed
+    """
+    entity_dir = path.parent if path.name in WATCHED_FILES else path
+    try:
+        rel_dir = entity_dir.relative_to(vault_path).as_posix()
+    except ValueError:
+        return
+    entity_type = entity_index.entity_type_for(rel_dir)
+    if entity_type is None:
+        return
+
+    entity_id = entity_index.read_entity_id(entity_dir / "metadata.yaml")
+    if entity_id is None:
+        if not (entity_dir / "metadata.yaml").exists():
+            _remove_entities(entity_dir)
+        return
+
+    # An edited id leaves the old id pointing at this directory
+    for old_id, _, old_dir in common.get_entities_below(entity_dir):
+        if old_dir == entity_dir and old_id != entity_id:
+            common.remove_from_entity_cache(old_id)
+    common.add_to_entity_cache(entity_id, entity_dir, entity_type)
+
+    if entity_type == "project":
+        project_db.reload_project(entity_dir)
+    elif entity_type == "topic":
+        topic_db.reload_topic(entity_dir)
+    else:
+        article_db.evict_cached_article(entity_id)
+
+
+def _is_own_change(path: Path) -> bool:
+    """Check whether a changed file or directory was written by this process."""
+    if path.name not in WATCHED_FILES:
+        # A new entity directory is known by the metadata written into it
+        path = path / "metadata.yaml"
+    return common.is_own_write(path)
+
+
+def _apply_changes(vault_path: Path, paths: Set[Path]) -> None:
+    """Apply a batch of changes, each entity directory once."""
+    own_changes = {path for path in paths if _is_own_change(path)}
+    _watcher_stats["ignored"] += len(own_changes)
+    paths = paths - own_changes
+    entity_paths = {
+        path.parent if path.name in WATCHED_FILES else path for path in paths
+    }
+    for path in sorted(entity_paths):
+        try:
+            apply_change(vault_path, path)
+            _watcher_stats["changes"] += 1
+        except Exception as e:
+            _watcher_stats["errors"] += 1
+            error("WATCHER", "Failed to apply change", f"{path}: {e}")
+    debug("WATCHER", "Applied changes", f"{len(entity_paths)} entities")
+
+
+def _run_polling(vault_path: Path, interval: float) -> None:
+    """Detect changes by comparing file mtimes every interval."""
+    signatures = _snapshot(vault_path)
+    while not _stop_event.wait(interval):
+        current = _snapshot(vault_path)
+        changed = {
+            path
+            for path in current.keys() | signatures.keys()
+            if current.get(path) != signatures.get(path)
+        }
+        signatures = current
+        if changed:
+            _apply_changes(vault_path, changed)
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc if it provides inotify, else None."""
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+class _Inotify:
+    """Minimal recursive inotify watch on the vault's entity directories."""
+
+    def __init__(self, libc: ctypes.CDLL, vault_path: Path):
+        """Create the inotify instance and watch the vault tree."""
+        self.libc = libc
+        self.vault_path = vault_path
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, Path] = {}
+        self.add_tree(vault_path)
+
+    def add_watch(self, path: Path) -> None:
+        """Watch a single directory."""
+        wd = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(path), ctypes.c_uint32(WATCH_MASK)
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.watches[wd] = path
+
+    def add_tree(self, path: Path) -> Set[Path]:
+        """Watch a directory and the entity directories below it, returning those."""
+        self.add_watch(path)
+        entity_dirs = set()
+        depth = len(path.relative_to(self.vault_path).parts)
+        for entity_dir in _entity_dirs(path):
+            subdepth = len(entity_dir.relative_to(path).parts)
+            if depth + subdepth <= entity_index.MAX_DEPTH:
+                self.add_watch(entity_dir)
+                entity_dirs.add(entity_dir)
+        return entity_dirs
+
+    def read_changes(self, timeout: float) -> Optional[Set[Path]]:
+        """
+        Wait for events and return the changed paths.
+
+        Returns None if the kernel queue overflowed and events were lost.
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            parent = self.watches.get(wd)
+            if parent is None or not name:
+                continue
+
+            path = parent / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                depth = len(path.relative_to(self.vault_path).parts)
+                if depth > entity_index.MAX_DEPTH:
+                    continue
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        changed |= self.add_tree(path)
+                    except OSError:
+                        pass
+                changed.add(path)
+            elif path.name in WATCHED_FILES:
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        """Close the inotify instance."""
+        os.close(self.fd)
+
+
+def _run_inotify(libc: ctypes.CDLL, vault_path: Path) -> None:
+    """Apply changes reported by inotify, batching bursts of events."""
+    inotify = _Inotify(libc, vault_path)
+    try:
+        while not _stop_event.is_set():
+            changed = inotify.read_changes(1.0)
+            if changed is None:
+                info("WATCHER", "Event queue overflowed", "Reloading all entities")
+                _apply_changes(vault_path, set(_snapshot(vault_path)))
+                continue
+            if not changed:
+                continue
+
+            # Collect the rest of the burst before applying it
+            while not _stop_event.is_set():
+                more = inotify.read_changes(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            _apply_changes(vault_path, changed)
+    finally:
+        inotify.close()
+
+
+def run_watcher(backend: str, poll_interval: float) -> None:
+    """Run the watcher loop with the requested backend."""
+    vault_path = common.get_hierarchical_path()
+    common.ensure_path_exists(vault_path)
+    libc = _load_libc() if backend in ("auto", "inotify") else None
+
+    if libc is not None:
+        try:
+            info("WATCHER", "Watching vault", f"inotify: {vault_path}")
+            _run_inotify(libc, vault_path)
+            return
+        except OSError as e:
+            error("WATCHER", "inotify unavailable", str(e))
+
+    info("WATCHER", "Watching vault", f"polling every {poll_interval}s: {vault_path}")
+    _run_polling(vault_path, poll_interval)
+
+
+def start_vault_watcher() -> bool:
+    """
+    Start the vault watcher in a background thread if enabled in settings.
+
+    Returns:
+        True if the watcher is running
+    """
+    global _watcher_thread
+
+    enabled, backend, poll_interval = load_settings()
+    if not enabled:
+        debug("WATCHER", "Vault watcher disabled in settings")
+        return False
+    if _watcher_thread and _watcher_thread.is_alive():
+        return True
+
+    _stop_event.clear()
+    _watcher_thread = threading.Thread(
+        target=run_watcher, args=(backend, poll_interval), daemon=True
+    )
+    _watcher_thread.start()
+    return True
+
+
+def stop_vault_watcher() -> None:
+    """Stop the vault watcher thread."""
+    global _watcher_thread
+
+    _stop_event.set()
+    if _watcher_thread:
+        _watcher_thread.join(timeout=5)
+        _watcher_thread = None
+
+
+def get_watcher_stats() -> Dict[str, int]:
+    """Get the number of applied, failed and ignored own changes."""
+    return dict(_watcher_stats)
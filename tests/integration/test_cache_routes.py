@@ -0,0 +1,65 @@
+"""
+Integration tests for feed cache endpoints.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from api.db import cache_manager
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Point the feed cache at an empty temporary directory."""
+    with patch("api.db.cache_manager.CACHE_PATH", return_value=tmp_path):
+        cache_manager.clear_cache()
+        cache_manager.reset_cache_stats()
+        yield tmp_path
+        cache_manager.clear_cache()
+
+
+def test_cache_stats(client, cache_dir):
+    """Test that the stats endpoint reports counters per connector."""
+    cache_manager.add_to_cache(
+        "https://example.com/feed", {"items": [1]}, 3600, "RSSConnector"
+    )
+    cache_manager.get_from_cache("https://example.com/feed", "RSSConnector")
+    cache_manager.get_from_cache("https://example.com/page", "WebConnector")
+
+    response = client.get("/api/cache/stats")
+
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["entries"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["connectors"]["RSSConnector"]["entries"] == 1
+    assert stats["connectors"]["RSSConnector"]["bytes_written"] > 0
+    assert stats["connectors"]["WebConnector"]["misses"] == 1
+
+
+def test_cache_cleanup_and_purge(client, cache_dir):
+    """Test cleaning up expired entries and purging a connector."""
+    cache_manager.add_to_cache(
+        "https://example.com/old", {"items": [1]}, 3600, "RSSConnector"
+    )
+    cache_manager.add_to_cache(
+        "https://example.com/a", {"items": [2]}, -1, "RSSConnector"
+    )
+    cache_manager.add_to_cache(
+        "https://example.com/b", {"items": [3]}, -1, "WebConnector"
+    )
+    cache_manager._cache_metadata["https://example.com/old"]["expires_at"] = 1
+    cache_manager._rebuild_heaps()
+
+    response = client.post("/api/cache/cleanup")
+    assert response.status_code == 200
+    assert response.json() == {"removed": 1, "connector": None}
+
+    response = client.post("/api/cache/cleanup", params={"connector": "RSSConnector"})
+    assert response.json() == {"removed": 1, "connector": "RSSConnector"}
+
+    assert list(cache_manager._cache_metadata) == ["https://example.com/b"]
+    assert cache_manager.get_cache_stats()["evictions"] == 1
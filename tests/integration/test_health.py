@@ -2,9 +2,29 @@
 Integration tests for health endpoints.
 """
 
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from api.app import app
+from curator import async_dispatcher, topic_updater
+
 
 def test_health_check(client):
     """Test that the health check endpoint returns a healthy status."""
     response = client.get("/api/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_shutdown_stops_background_threads():
+    """Test that leaving the app lifespan stops the pipeline and dispatcher."""
+    with patch(
+        "curator.topic_updater.load_curation_settings", return_value=("async", 2)
+    ):
+        with TestClient(app):
+            assert topic_updater._workers
+            assert async_dispatcher._loop is not None
+
+    assert topic_updater._workers == []
+    assert async_dispatcher._loop is None
@@ -7,13 +7,19 @@ from unittest.mock import MagicMock, patch
 import pytest
 import yaml
 
+from src.api.db import version_manifest
 from src.api.db.article_db import (
+    _cache_article,
     article_to_files,
+    clear_article_cache,
     create_article,
     files_to_article,
     get_article,
+    get_article_cache_stats,
     get_article_history,
     get_latest_version,
+    get_version_count,
+    get_version_history,
     list_articles,
     mark_article_deleted,
     save_article,
@@ -126,7 +132,9 @@ def test_save_article(mock_article, mock_topic):
             with patch("src.api.db.article_db.get_article_path") as mock_get_path:
                 with patch("src.api.db.article_db.article_to_files") as mock_to_files:
                     with patch("pathlib.Path.exists", return_value=True):
-                        with patch("src.api.db.article_db.add_to_entity_cache"):
+                        with patch("src.api.db.article_db.add_to_entity_cache"), patch(
+                            "src.api.db.version_manifest.record_versions"
+                        ) as mock_record:
                             with patch("src.api.db.topic_db.save_topic"):
                                 # Setup mocks
                                 mock_get_topic.return_value = mock_topic
@@ -151,6 +159,9 @@ def test_save_article(mock_article, mock_topic):
                                 mock_to_files.assert_called_once_with(
                                     mock_article, mock_path
                                 )
+                                mock_record.assert_called_once_with(
+                                    mock_path.parent, [mock_article]
+                                )
 
 
 def test_get_article():
@@ -366,3 +377,214 @@ def test_mark_article_deleted():
                     assert result is True
                     mock_rmtree.assert_called_once_with(mock_path)
                     mock_remove.assert_called_once_with("test-article-123")
+
+
+@pytest.fixture
+def article_cache():
+    """Start each article cache test with an empty cache."""
+    clear_article_cache()
+    yield
+    clear_article_cache()
+
+
+def test_get_article_uses_cache(mock_article_files, article_cache):
+    """Test that repeated loads are served from the article cache."""
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        return_value=(mock_article_files, "article"),
+    ):
+        stats_before = get_article_cache_stats()
+        first = get_article("test-article-123")
+
+        with patch(
+            "src.api.db.article_db.files_to_article",
+            side_effect=AssertionError("article should come from cache"),
+        ):
+            second = get_article("test-article-123")
+
+    stats = get_article_cache_stats()
+    assert second == first
+    assert second is not first
+    assert stats["misses"] == stats_before["misses"] + 1
+    assert stats["hits"] == stats_before["hits"] + 1
+
+
+def test_get_article_cache_detects_file_changes(mock_article_files, article_cache):
+    """Test that cached articles are reloaded when their files change."""
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        return_value=(mock_article_files, "article"),
+    ):
+        assert get_article("test-article-123").content == "This is test content."
+
+        content_file = mock_article_files / "article.md"
+        content_file.write_text("Edited outside the app.", encoding="utf-8")
+
+        assert get_article("test-article-123").content == "Edited outside the app."
+
+
+def test_get_article_cache_returns_copies(mock_article_files, article_cache):
+    """Test that modifying a returned article does not change the cache."""
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        return_value=(mock_article_files, "article"),
+    ):
+        article = get_article("test-article-123")
+        article.add_representation("content", "Some text")
+        article.next_version = "other-version"
+
+        cached = get_article("test-article-123")
+
+    assert cached.representations == []
+    assert cached.next_version is None
+
+
+def test_article_cache_keeps_representations_unloaded(mock_article, tmp_path):
+    """Test that loading a returned article's representation leaves the cache lean."""
+    article_path = tmp_path / "article"
+    article_path.mkdir()
+    mock_article.add_representation(
+        "audio", b"mp3 data", {"binary": True, "extension": "mp3"}
+    )
+    article_to_files(mock_article, article_path)
+    clear_article_cache()
+
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        return_value=(article_path, "article"),
+    ):
+        article = get_article(mock_article.id)
+        assert article.representations[0].content == b"mp3 data"
+        cached = get_article(mock_article.id)
+
+    assert cached.representations[0].content_path is not None
+    assert get_article_cache_stats()["size"] == 1
+
+    # Articles saved with their content in memory are not cached
+    with patch("src.api.db.article_db._get_article_signature", return_value=(1,)):
+        _cache_article(article_path, article)
+    assert get_article_cache_stats()["size"] == 0
+    clear_article_cache()
+
+
+def test_article_cache_bounded_and_evicted_on_delete(mock_article_files, article_cache):
+    """Test that the cache size is bounded and deleted articles are evicted."""
+    with patch("src.api.db.article_db.ARTICLE_CACHE_SIZE", 1):
+        with patch(
+            "src.api.db.article_db.find_entity_by_id",
+            return_value=(mock_article_files, "article"),
+        ):
+            get_article("test-article-123")
+            assert get_article_cache_stats()["size"] == 1
+
+            with patch("src.api.db.article_db.rmtree"):
+                with patch("src.api.db.article_db.remove_from_entity_cache"):
+                    with patch("src.api.db.article_db.get_article", return_value=None):
+                        mark_article_deleted("test-article-123")
+
+    assert get_article_cache_stats()["size"] == 0
+
+
+def test_files_to_article_loads_representations_lazily(mock_article, tmp_path):
+    """Test that representation content is only read when accessed."""
+    article_path = tmp_path / "article"
+    article_path.mkdir()
+    mock_article.add_representation("summary", "A short summary")
+    article_to_files(mock_article, article_path)
+
+    article = files_to_article(article_path / "metadata.yaml")
+    representation = article.representations[0]
+    rep_file = representation.content_path
+
+    assert rep_file is not None
+    rep_file.write_text("Changed summary", encoding="utf-8")
+
+    assert representation.content == "Changed summary"
+    assert representation.content_path is None
+    assert article.model_dump()["representations"][0]["content"] == "Changed summary"
+
+
+def test_article_to_files_keeps_unloaded_representations(mock_article, tmp_path):
+    """Test that saving does not read representations that were never loaded."""
+    article_path = tmp_path / "article"
+    article_path.mkdir()
+    mock_article.add_representation("summary", "A short summary")
+    article_to_files(mock_article, article_path)
+
+    article = files_to_article(article_path / "metadata.yaml")
+    copy_path = tmp_path / "copy"
+    copy_path.mkdir()
+    with patch("src.api.models.topic.Representation._load_content") as load:
+        article_to_files(article, article_path)
+        article_to_files(article, copy_path)
+
+    load.assert_not_called()
+    copied = files_to_article(copy_path / "metadata.yaml")
+    assert copied.representations[0].content == "A short summary"
+
+
+def test_binary_representation_round_trip(mock_article, tmp_path):
+    """Test that binary representations are stored and loaded as raw bytes."""
+    article_path = tmp_path / "article"
+    article_path.mkdir()
+    audio = bytes(range(256))
+    mock_article.add_representation(
+        "audio", audio, {"format": "mp3", "binary": True, "extension": "mp3"}
+    )
+    mock_article.add_representation(
+        "legacy", audio.hex(), {"binary": True, "extension": "mp3"}
+    )
+    article_to_files(mock_article, article_path)
+
+    assert (article_path / "representations" / "audio.0.mp3").read_bytes() == audio
+    assert (article_path / "representations" / "legacy.1.mp3").read_bytes() == audio
+
+    article = files_to_article(article_path / "metadata.yaml")
+    assert article.representations[0].get_size() == len(audio)
+    assert article.representations[0].content == audio
+    assert article.representations[1].content == audio
+
+
+def test_article_history_from_version_manifest(mock_article, tmp_path):
+    """Test that history queries use the manifest instead of walking versions."""
+    versions = [mock_article]
+    for version in range(2, 5):
+        versions.append(
+            versions[-1].model_copy(
+                update={
+                    "id": f"article-v{version}",
+                    "version": version,
+                    "previous_version": versions[-1].id,
+                }
+            )
+        )
+    paths = {article.id: tmp_path / "topic" / article.id for article in versions}
+    for article in versions:
+        paths[article.id].mkdir(parents=True)
+    version_manifest.record_versions(tmp_path / "topic", versions)
+    by_id = {article.id: article for article in versions}
+
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        side_effect=lambda id: (paths.get(id), "article" if id in paths else None),
+    ):
+        with patch(
+            "src.api.db.article_db.get_article", side_effect=by_id.get
+        ) as mock_get:
+            assert get_version_count("article-v3") == 4
+            assert [
+                entry["version"] for entry in get_version_history("article-v2")
+            ] == [
+                1,
+                2,
+                3,
+                4,
+            ]
+            mock_get.assert_not_called()
+
+            assert get_latest_version(mock_article.id).id == "article-v4"
+            assert mock_get.call_count == 1
+
+            history = get_article_history("article-v4")
+            assert [article.version for article in history] == [1, 2, 3, 4]
+            assert mock_get.call_count == 5
@@ -0,0 +1,28 @@
+"""Unit tests for the content-addressed blob store."""
+
+from src.api.db import blob_store, cache_codec
+
+
+def test_store_text_deduplicates(tmp_path):
+    """Test that identical texts are written once and read back."""
+    codec = cache_codec.CODECS["gzip"]
+    blob_id, size = blob_store.store_text(tmp_path, "same text", codec, 6)
+    same_id, same_size = blob_store.store_text(tmp_path, "same text", codec, 6)
+
+    assert (same_id, same_size) == (blob_id, size)
+    assert blob_id == f"{blob_store.content_hash('same text')}.gzip"
+    assert len(list(blob_store.get_blob_dir(tmp_path).glob("*/*"))) == 1
+
+    blob_store.clear_blobs()
+    assert blob_store.read_text(tmp_path, blob_id) == "same text"
+
+
+def test_collect_garbage_keeps_live_blobs(tmp_path):
+    """Test that only unreferenced blob files are deleted."""
+    codec = cache_codec.CODECS["none"]
+    live_id, _ = blob_store.store_text(tmp_path, "live", codec, 6)
+    dead_id, _ = blob_store.store_text(tmp_path, "dead", codec, 6)
+
+    assert blob_store.collect_garbage(tmp_path, {live_id}) == 1
+    assert blob_store.get_blob_path(tmp_path, live_id).exists()
+    assert not blob_store.get_blob_path(tmp_path, dead_id).exists()
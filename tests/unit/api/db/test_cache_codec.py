@@ -0,0 +1,35 @@
+"""Unit tests for the feed cache compression codecs."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.api.db import cache_codec
+
+
+@pytest.mark.parametrize("name", sorted(cache_codec.CODECS))
+def test_round_trip(name):
+    """Test that every codec decodes what it encoded, based on the file name."""
+    codec = cache_codec.CODECS[name]
+    data = b'{"items": ["' + b"text " * 1000 + b'"]}'
+
+    encoded = cache_codec.encode(data, codec, 6)
+
+    assert cache_codec.decode(Path("entry_1234abcd" + codec.suffix), encoded) == data
+    if name != "none":
+        assert len(encoded) < len(data) / 5
+
+
+def test_load_settings():
+    """Test reading the codec and level, falling back on invalid values."""
+    settings = {"compression": "lzma", "compression_level": 12}
+    with patch("src.api.db.cache_codec.get_setting", return_value=settings):
+        assert cache_codec.load_settings() == (cache_codec.CODECS["lzma"], 9)
+
+    settings = {"compression": "snappy", "compression_level": "fast"}
+    with patch("src.api.db.cache_codec.get_setting", return_value=settings):
+        assert cache_codec.load_settings() == (
+            cache_codec.CODECS[cache_codec.DEFAULT_CODEC],
+            cache_codec.DEFAULT_LEVEL,
+        )
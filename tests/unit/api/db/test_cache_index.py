@@ -0,0 +1,38 @@
+"""Unit tests for the feed cache index."""
+
+from src.api.db import cache_index
+
+
+def test_last_record_wins(tmp_path):
+    """Test that later records replace or remove earlier ones."""
+    cache_index.append_index(
+        tmp_path,
+        [
+            cache_index.entry_record("http://a", "a.json", 10, 1.0, -1),
+            cache_index.entry_record("http://b", "b.json", 20, 2.0, -1),
+            cache_index.entry_record("http://a", "a.json", 30, 3.0, 99.0),
+            cache_index.removal_record("http://b"),
+        ],
+    )
+
+    records, line_count = cache_index.read_index(tmp_path)
+
+    assert line_count == 4
+    assert list(records) == ["http://a"]
+    assert records["http://a"]["size"] == 30
+    assert records["http://a"]["expires_at"] == 99.0
+
+
+def test_skips_incomplete_lines(tmp_path):
+    """Test that a line cut off by an interrupted write is ignored."""
+    cache_index.write_index(
+        tmp_path, [cache_index.entry_record("http://a", "a.json", 10, 1.0, -1)]
+    )
+    with open(cache_index.get_index_path(tmp_path), "a", encoding="utf-8") as f:
+        f.write('{"url": "http://b", "pa')
+
+    records, line_count = cache_index.read_index(tmp_path)
+
+    assert list(records) == ["http://a"]
+    assert line_count == 1
+    assert not cache_index.needs_compaction(line_count, len(records))
@@ -1,12 +1,14 @@
 """Unit tests for cache manager module."""
 
 import json
+import os
 import time
 from pathlib import Path
 from unittest.mock import call, mock_open, patch
 
 import pytest
 
+from src.api.db import blob_store, cache_index, cache_manager
 from src.api.db.cache_manager import (
     CACHE_PATH,
     _cleanup_cache,
@@ -34,6 +36,24 @@ def mock_cache_dir():
     return Path("/mock/db/cache")
 
 
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Point the cache at an empty temporary directory."""
+    with patch("src.api.db.cache_manager.CACHE_PATH", return_value=tmp_path):
+        clear_cache()
+        yield tmp_path
+        clear_cache()
+
+
+def _restart_cache():
+    """Forget the in-memory cache state as a new process would."""
+    cache_manager._cache_initialized = False
+    cache_manager._cache_metadata = {}
+    cache_manager._age_heap.clear()
+    cache_manager._expiry_heap.clear()
+    cache_manager._clear_memory_tier()
+
+
 @pytest.fixture
 def mock_cache_file():
     """Create a mock cache file metadata."""
@@ -555,3 +575,237 @@ def test_get_all_connectors():
             result = get_all_connectors()
             # Should return unique connectors
             assert sorted(result) == ["connector1", "connector2"]
+
+
+def test_cache_index_restored_without_reading_payloads(cache_dir):
+    """Test that the cache metadata is rebuilt from the index alone."""
+    add_to_cache("http://example.com/a", {"items": [1]})
+    add_to_cache("http://example.com/b", {"items": [2]}, expiration_time=3600)
+    add_to_cache("http://example.com/c", {"items": [3]})
+    remove_from_cache("http://example.com/c")
+    size = cache_manager._cache_size_bytes
+
+    _restart_cache()
+    with patch(
+        "src.api.db.cache_manager._get_file_metadata", side_effect=AssertionError
+    ):
+        _initialize_cache()
+
+    assert set(cache_manager._cache_metadata) == {
+        "http://example.com/a",
+        "http://example.com/b",
+    }
+    assert cache_manager._cache_size_bytes == size
+    assert get_cache_info("http://example.com/b")["expires_at"] > time.time()
+    assert get_from_cache("http://example.com/a")["items"] == [1]
+
+
+def test_re_adding_url_replaces_its_size(cache_dir):
+    """Test that overwriting an entry does not double count its size."""
+    add_to_cache("http://example.com/a", {"items": [1]})
+    add_to_cache("http://example.com/a", {"items": [1, 2, 3]})
+
+    path = cache_manager._cache_metadata["http://example.com/a"]["path"]
+    assert cache_manager._cache_size_bytes == path.stat().st_size
+    assert len(cache_manager._cache_metadata) == 1
+
+
+def test_cleanup_evicts_expired_then_oldest(cache_dir):
+    """Test that cleanup removes expired entries, then the oldest ones by URL."""
+    with patch("src.api.db.cache_manager.MAX_CACHE_SIZE_MB", 1):
+        add_to_cache("http://example.com/expired", {"items": []}, 3600)
+        add_to_cache("http://example.com/old", {"items": []})
+        add_to_cache("http://example.com/new", {"items": []})
+        cache_manager._cache_metadata["http://example.com/expired"]["expires_at"] = 1
+        cache_manager._cache_metadata["http://example.com/old"]["added_at"] -= 60
+        cache_manager._rebuild_heaps()
+
+        # Only room for a single entry
+        size = cache_manager._cache_metadata["http://example.com/new"]["size"]
+        with patch(
+            "src.api.db.cache_manager.CACHE_CLEANUP_THRESHOLD",
+            (size + 1) / (1024 * 1024),
+        ):
+            _cleanup_cache()
+
+    assert list(cache_manager._cache_metadata) == ["http://example.com/new"]
+    assert list(cache_dir.glob("*old*")) == []
+    records, _ = cache_index.read_index(cache_dir)
+    assert list(records) == ["http://example.com/new"]
+
+
+def test_legacy_cache_files_are_indexed_once(cache_dir):
+    """Test that cache files written before the index are migrated into it."""
+    url = "http://example.com/legacy"
+    _get_cache_path(url).write_text(
+        json.dumps({"items": [1], "url": url, "expires_at": -1}), encoding="utf-8"
+    )
+    (cache_dir / "broken.json").write_text("{", encoding="utf-8")
+
+    _initialize_cache()
+
+    assert get_from_cache(url)["items"] == [1]
+    assert not (cache_dir / "broken.json").exists()
+    records, line_count = cache_index.read_index(cache_dir)
+    assert list(records) == [url]
+    assert line_count == 1
+
+
+def test_lost_index_is_rebuilt_from_compressed_payloads(cache_dir):
+    """Test that payloads of every codec and their blobs survive a lost index."""
+    items = [{"url": "http://example.com/1", "content": "text " * 300}]
+    with patch(
+        "src.api.db.cache_codec.get_setting", return_value={"compression": "none"}
+    ):
+        add_to_cache("http://example.com/feed", {"items": [1]})
+    old_path = cache_manager._cache_metadata["http://example.com/feed"]["path"]
+    with patch(
+        "src.api.db.cache_codec.get_setting", return_value={"compression": "lzma"}
+    ):
+        add_to_cache("http://example.com/blobs", {"items": items})
+    # A payload of the same URL left behind by an earlier codec
+    old_path.write_text(
+        json.dumps({"items": [0], "url": "http://example.com/blobs"}),
+        encoding="utf-8",
+    )
+    stale = time.time() - 60
+    os.utime(old_path, (stale, stale))
+    (cache_dir / "broken.json.gz").write_bytes(b"not gzip")
+
+    cache_index.get_index_path(cache_dir).unlink()
+    blob_store.clear_blobs()
+    _restart_cache()
+    _initialize_cache()
+
+    assert set(cache_manager._cache_metadata) == {"http://example.com/blobs"}
+    assert not old_path.exists()
+    assert not (cache_dir / "broken.json.gz").exists()
+    assert cache_manager._cache_metadata["http://example.com/blobs"]["blobs"]
+    assert cache_manager.cleanup_cache() == 0
+    assert get_from_cache("http://example.com/blobs")["items"] == items
+
+
+def test_compressed_and_legacy_entries_are_readable(cache_dir):
+    """Test that compressed and uncompressed payloads are read transparently."""
+    legacy_url = "http://example.com/legacy"
+    _get_cache_path(legacy_url).write_text(
+        json.dumps({"items": [1], "url": legacy_url, "expires_at": -1}),
+        encoding="utf-8",
+    )
+    items = [
+        {"url": f"http://example.com/{i}", "content": "text " * 200} for i in range(5)
+    ]
+    settings = {"compression": "gzip", "compression_level": 6}
+    with patch("src.api.db.cache_codec.get_setting", return_value=settings):
+        add_to_cache("http://example.com/feed", {"items": items})
+
+    path = cache_manager._cache_metadata["http://example.com/feed"]["path"]
+    assert path.name.endswith(".json.gz")
+    assert get_from_cache("http://example.com/feed")["items"] == items
+    assert get_from_cache(legacy_url)["items"] == [1]
+
+    stats = cache_manager.get_cache_stats()
+    assert stats["entries"] == 2
+    assert stats["raw_size_bytes"] > stats["size_bytes"]
+    assert stats["compression_ratio"] > 2
+
+    # Switching codecs replaces the payload file
+    settings = {"compression": "none"}
+    with patch("src.api.db.cache_codec.get_setting", return_value=settings):
+        add_to_cache("http://example.com/feed", {"items": items})
+    assert not path.exists()
+    assert get_from_cache("http://example.com/feed")["items"] == items
+
+
+def test_memory_tier_serves_hot_urls(cache_dir):
+    """Test that repeated reads are served from memory without reading files."""
+    url = "http://example.com/feed"
+    add_to_cache(url, {"items": [1]})
+    _restart_cache()
+    before = cache_manager.get_cache_stats()
+
+    assert get_from_cache(url)["items"] == [1]
+    with patch("src.api.db.cache_manager._read_payload", side_effect=AssertionError):
+        assert get_from_cache(url)["items"] == [1]
+    assert get_from_cache("http://example.com/missing") is None
+
+    stats = cache_manager.get_cache_stats()
+    assert stats["disk_hits"] - before["disk_hits"] == 1
+    assert stats["memory_hits"] - before["memory_hits"] == 1
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["memory_entries"] == 1
+
+
+def test_stale_reads_are_not_counted_as_hits(cache_dir):
+    """Test that revalidating an expired entry counts one miss and no hits."""
+    url = "http://example.com/feed"
+    add_to_cache(url, {"items": [1]}, expiration_time=3600, connector="RSS")
+    cache_manager._cache_metadata[url]["expires_at"] = time.time() - 1
+    cache_manager.reset_cache_stats()
+
+    assert get_from_cache(url, "RSS") is None
+    assert cache_manager.get_stale_from_cache(url, "RSS")["items"] == [1]
+    cache_manager._clear_memory_tier()
+    assert cache_manager.get_stale_from_cache(url, "RSS")["items"] == [1]
+
+    stats = cache_manager.get_cache_stats()
+    assert stats["memory_hits"] == stats["disk_hits"] == 0
+    assert stats["misses"] == stats["expirations"] == 1
+    assert stats["stale_reads"] == 2
+    assert stats["hit_ratio"] == 0.0
+    assert stats["connectors"]["RSS"]["stale_reads"] == 2
+
+
+def test_memory_tier_is_bounded_and_honours_expiry(cache_dir):
+    """Test that the memory tier evicts least recent payloads and expired ones."""
+    with patch("src.api.db.cache_manager.MEMORY_CACHE_SIZE_MB", 1):
+        for i in range(3):
+            add_to_cache(f"http://example.com/{i}", {"items": ["x" * 400 * 1024]})
+
+        # The first payload was evicted from memory but is still on disk
+        assert list(cache_manager._memory_cache) == [
+            "http://example.com/1",
+            "http://example.com/2",
+        ]
+        assert cache_manager._memory_bytes <= 1024 * 1024
+        assert get_from_cache("http://example.com/0") is not None
+
+    url = "http://example.com/expiring"
+    add_to_cache(url, {"items": [1]}, expiration_time=3600)
+    cache_manager._cache_metadata[url]["expires_at"] = time.time() - 1
+
+    assert get_from_cache(url) is None
+    assert cache_manager.get_stale_from_cache(url)["items"] == [1]
+
+    # Entries expired for too long are dropped from both tiers
+    cache_manager._cache_metadata[url]["expires_at"] -= cache_manager.MAX_STALE_SECONDS
+    assert cache_manager.get_stale_from_cache(url) is None
+    assert url not in cache_manager._memory_cache
+
+
+def test_shared_texts_are_stored_once(cache_dir):
+    """Test that identical long texts under different URLs share one blob."""
+    text = "Syndicated article body. " * 100
+    add_to_cache("http://example.com/a", {"items": [{"url": "a", "content": text}]})
+    add_to_cache("http://mirror.com/a", {"items": [{"url": "b", "content": text}]})
+    add_to_cache("http://example.com/short", {"items": [{"content": "short"}]})
+
+    blob_files = list(blob_store.get_blob_dir(cache_dir).glob("*/*"))
+    assert len(blob_files) == 1
+    assert blob_files[0].name.startswith(blob_store.content_hash(text))
+    assert cache_manager._blob_refs == {blob_files[0].name: 2}
+
+    # Payloads reference the blob and are resolved when read from disk
+    path = cache_manager._cache_metadata["http://example.com/a"]["path"]
+    assert text not in cache_manager._read_payload(path)["items"][0].values()
+    _restart_cache()
+    assert get_from_cache("http://mirror.com/a")["items"][0]["content"] == text
+    assert cache_manager._blob_refs == {blob_files[0].name: 2}
+
+    # The blob is deleted with the last entry referencing it
+    remove_from_cache("http://example.com/a")
+    assert blob_files[0].exists()
+    add_to_cache("http://mirror.com/a", {"items": [{"url": "b", "content": "new"}]})
+    assert not blob_files[0].exists()
+    assert cache_manager._blob_refs == {}
+    assert cache_manager.get_cache_stats()["blob_bytes"] == 0
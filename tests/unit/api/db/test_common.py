@@ -5,7 +5,9 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import yaml
 
+from src.api.db import common
 from src.api.db.common import get_base_db_path, get_db_path
 
 
@@ -42,3 +44,64 @@ def test_get_db_path():
     with patch("src.api.db.common.get_base_db_path", return_value=Path("/base/path")):
         result = get_db_path("test_subfolder")
         assert result == Path("/base/path/test_subfolder")
+
+
+@pytest.fixture
+def entity_vault(tmp_path):
+    """Point the entity cache at a temporary vault with a single project."""
+    vault_path = tmp_path / "vault"
+    (vault_path / "project-a").mkdir(parents=True)
+    with open(vault_path / "project-a" / "metadata.yaml", "w") as f:
+        yaml.safe_dump({"id": "project-1"}, f)
+
+    index_paths = (tmp_path / "vault_index.json", tmp_path / "vault_index.journal")
+    common.invalidate_entity_cache()
+    with patch("src.api.db.common.get_hierarchical_path", return_value=vault_path):
+        with patch(
+            "src.api.db.common.get_entity_index_paths", return_value=index_paths
+        ):
+            yield vault_path
+    common.invalidate_entity_cache()
+
+
+def test_find_entity_by_id_negative_cache(entity_vault):
+    """Test that repeated misses are answered without rescanning the vault."""
+    rescans_before = common.get_entity_cache_stats()["rescans"]
+
+    assert common.find_entity_by_id("missing-id") == (None, None)
+    assert common.find_entity_by_id("missing-id") == (None, None)
+    assert common.find_entity_by_id("missing-id") == (None, None)
+
+    stats = common.get_entity_cache_stats()
+    assert stats["rescans"] == rescans_before + 1
+    assert stats["negative_entries"] == 1
+
+
+def test_find_entity_by_id_negative_cache_expires(entity_vault):
+    """Test that misses are retried after the negative cache TTL."""
+    assert common.find_entity_by_id("missing-id") == (None, None)
+    rescans_before = common.get_entity_cache_stats()["rescans"]
+
+    with patch("src.api.db.common.NEGATIVE_CACHE_TTL", -1):
+        assert common.find_entity_by_id("missing-id") == (None, None)
+
+    assert common.get_entity_cache_stats()["rescans"] == rescans_before + 1
+
+
+def test_find_entity_by_id_added_entity_clears_miss(entity_vault):
+    """Test that adding an entity removes it from the negative cache."""
+    assert common.find_entity_by_id("project-2") == (None, None)
+
+    project_path = entity_vault / "project-b"
+    common.add_to_entity_cache("project-2", project_path, "project")
+
+    assert common.find_entity_by_id("project-2") == (project_path, "project")
+
+
+def test_find_entity_by_id_negative_cache_bounded(entity_vault):
+    """Test that the negative cache evicts the oldest misses."""
+    with patch("src.api.db.common.NEGATIVE_CACHE_SIZE", 2):
+        for entity_id in ["miss-1", "miss-2", "miss-3"]:
+            common.find_entity_by_id(entity_id)
+
+        assert list(common._negative_cache) == ["miss-2", "miss-3"]
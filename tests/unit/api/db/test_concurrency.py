@@ -0,0 +1,244 @@
+"""Stress tests running the database caches from many threads at once."""
+
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.api.db import (
+    article_db,
+    cache_index,
+    cache_manager,
+    common,
+    project_db,
+    topic_db,
+)
+from src.api.models.topic import Topic
+
+THREADS = 8
+ROUNDS = 200
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    """Switch threads often so the operations interleave."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _run_threads(worker):
+    """Run a worker in THREADS threads starting together, re-raising failures."""
+    barrier = threading.Barrier(THREADS)
+
+    def run(index):
+        barrier.wait()
+        worker(index)
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        for future in [pool.submit(run, index) for index in range(THREADS)]:
+            future.result()
+
+
+def test_feed_cache_stays_consistent(tmp_path):
+    """Test that concurrent adds, reads and removals keep the accounting exact."""
+    urls = [f"https://example.com/feed/{i}" for i in range(20)]
+    texts = [f"shared text {i} " * 100 for i in range(5)]
+
+    def worker(index):
+        rng = random.Random(index)
+        for _ in range(ROUNDS):
+            url = rng.choice(urls)
+            action = rng.random()
+            if action < 0.4:
+                content = {"items": [{"content": rng.choice(texts)}]}
+                cache_manager.add_to_cache(url, content, 3600, f"Connector{index % 3}")
+            elif action < 0.8:
+                cache_manager.get_from_cache(url)
+            elif action < 0.9:
+                cache_manager.remove_from_cache(url)
+            else:
+                cache_manager.touch_cache_entry(url, 3600)
+
+    with patch("src.api.db.cache_manager.CACHE_PATH", return_value=tmp_path):
+        cache_manager.clear_cache()
+        # Small enough that cleanup runs concurrently with the other operations
+        with patch("src.api.db.cache_manager.MAX_CACHE_SIZE_MB", 0.02):
+            _run_threads(worker)
+
+        metadata = dict(cache_manager._cache_metadata)
+        assert cache_manager._cache_size_bytes == sum(
+            entry["size"] for entry in metadata.values()
+        )
+        assert cache_manager._cache_raw_bytes == sum(
+            entry["raw_size"] for entry in metadata.values()
+        )
+        assert cache_manager._memory_bytes == sum(
+            size for _, size in cache_manager._memory_cache.values()
+        )
+        references = {}
+        for entry in metadata.values():
+            assert entry["path"].exists()
+            for blob_id in entry["blobs"]:
+                references[blob_id] = references.get(blob_id, 0) + 1
+        assert cache_manager._blob_refs == references
+
+        # The index describes exactly the entries held in memory
+        entries, _ = cache_index.read_index(tmp_path)
+        assert entries.keys() == metadata.keys()
+        for url, record in entries.items():
+            assert record["size"] == metadata[url]["size"]
+        cache_manager.clear_cache()
+
+
+def test_entity_cache_concurrent_updates(tmp_path):
+    """Test that entities added while others are looked up are all found."""
+    vault_path = tmp_path / "vault"
+    vault_path.mkdir()
+    index_paths = (tmp_path / "vault_index.json", tmp_path / "vault_index.journal")
+
+    def worker(index):
+        for i in range(ROUNDS // 4):
+            project_dir = vault_path / f"project-{index}-{i}"
+            project_dir.mkdir()
+            with open(project_dir / "metadata.yaml", "w") as f:
+                yaml.safe_dump({"id": f"project-{index}-{i}"}, f)
+            common.add_to_entity_cache(f"project-{index}-{i}", project_dir, "project")
+            common.find_entity_by_id(f"project-{(index + 1) % THREADS}-{i}")
+            if i % 10 == 0:
+                common.remove_from_entity_cache(f"project-{index}-{i}")
+
+    common.invalidate_entity_cache()
+    with patch("src.api.db.common.get_hierarchical_path", return_value=vault_path):
+        with patch(
+            "src.api.db.common.get_entity_index_paths", return_value=index_paths
+        ):
+            _run_threads(worker)
+
+            for index in range(THREADS):
+                for i in range(ROUNDS // 4):
+                    project_dir = vault_path / f"project-{index}-{i}"
+                    assert common.find_entity_by_id(f"project-{index}-{i}") == (
+                        project_dir,
+                        "project",
+                    )
+    common.invalidate_entity_cache()
+
+
+def test_article_cache_concurrent_reads(tmp_path):
+    """Test that the article LRU stays bounded and counts every lookup."""
+    article_dirs = {}
+    for i in range(12):
+        article_dir = tmp_path / f"article-{i}"
+        article_dir.mkdir()
+        metadata = {
+            "id": f"article-{i}",
+            "title": f"Article {i}",
+            "topic_id": "topic-1",
+            "created_at": "2024-01-01T12:00:00",
+            "updated_at": None,
+            "version": 1,
+        }
+        with open(article_dir / "metadata.yaml", "w") as f:
+            yaml.safe_dump(metadata, f)
+        (article_dir / "article.md").write_text(f"Content {i}", encoding="utf-8")
+        article_dirs[f"article-{i}"] = article_dir
+
+    def worker(index):
+        rng = random.Random(index)
+        for _ in range(ROUNDS):
+            article_id = rng.choice(list(article_dirs))
+            article = article_db.get_article(article_id)
+            assert article.id == article_id
+            assert article.content == f"Content {article_id.split('-')[1]}"
+
+    article_db.clear_article_cache()
+    stats_before = article_db.get_article_cache_stats()
+    with patch(
+        "src.api.db.article_db.find_entity_by_id",
+        side_effect=lambda article_id: (article_dirs[article_id], "article"),
+    ):
+        with patch("src.api.db.article_db.ARTICLE_CACHE_SIZE", 8):
+            _run_threads(worker)
+
+    stats = article_db.get_article_cache_stats()
+    lookups = stats["hits"] + stats["misses"]
+    assert lookups == stats_before["hits"] + stats_before["misses"] + THREADS * ROUNDS
+    assert stats["size"] <= 8
+    article_db.clear_article_cache()
+
+
+def test_topic_cache_concurrent_saves_and_reads(tmp_path):
+    """Test that topics saved while others are read and listed end up current."""
+    vault_path = tmp_path / "vault"
+    index_paths = (tmp_path / "vault_index.json", tmp_path / "vault_index.journal")
+    topic_ids = [f"topic-{index}" for index in range(THREADS)]
+    project_dir = vault_path / "project"
+    project_dir.mkdir(parents=True)
+    with open(project_dir / "metadata.yaml", "w") as f:
+        yaml.safe_dump(
+            {
+                "id": "project-1",
+                "title": "Project",
+                "description": "A project",
+                "topic_ids": topic_ids,
+                "created_at": "2024-01-01T12:00:00",
+                "updated_at": None,
+            },
+            f,
+        )
+
+    def topic(index, version):
+        return Topic(
+            id=topic_ids[index],
+            name=f"Topic {index}",
+            description=f"Version {version}",
+            feed_urls=[],
+            slug=f"topic-{index}",
+        )
+
+    def worker(index):
+        rng = random.Random(index)
+        for version in range(ROUNDS // 4):
+            topic_db.save_topic(topic(index, version))
+            other = topic_db.get_topic(rng.choice(topic_ids))
+            assert other.description.startswith("Version")
+            assert len(topic_db.list_topics()) <= THREADS
+            if version % 10 == 0:
+                topic_db.reload_topic(project_dir / f"topic-{index}")
+
+    common.invalidate_entity_cache()
+    with patch(
+        "src.api.db.common.get_hierarchical_path",
+        side_effect=lambda *parts: vault_path.joinpath(*parts),
+    ), patch(
+        "src.api.db.topic_db.get_hierarchical_path",
+        side_effect=lambda *parts: vault_path.joinpath(*parts),
+    ), patch(
+        "src.api.db.common.get_entity_index_paths", return_value=index_paths
+    ):
+        with patch("src.api.db.project_db._project_cache", {}), patch(
+            "src.api.db.project_db._topic_project_index", {}
+        ), patch("src.api.db.project_db._cache_initialized", True):
+            with patch("src.api.db.topic_db._topic_cache", {}), patch(
+                "src.api.db.topic_db._feed_log_state", {}
+            ), patch("src.api.db.topic_db._cache_initialized", True):
+                project_db.reload_project(project_dir)
+                # Topics are on disk but not cached, so first reads load them
+                for index in range(THREADS):
+                    topic_db.save_topic(topic(index, "initial"))
+                topic_db._topic_cache.clear()
+                _run_threads(worker)
+
+                last = f"Version {ROUNDS // 4 - 1}"
+                assert len(topic_db.list_topics()) == THREADS
+                for index, topic_id in enumerate(topic_ids):
+                    assert topic_db.get_topic(topic_id).description == last
+                    on_disk = topic_db.load_topic_dir(project_dir / f"topic-{index}")
+                    assert on_disk == topic_db.get_topic(topic_id)
+    common.invalidate_entity_cache()
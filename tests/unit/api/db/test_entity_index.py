@@ -0,0 +1,123 @@
+"""Unit tests for the persistent vault entity index."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.api.db import common, entity_index
+
+
+def _write_metadata(path: Path, entity_id: str) -> None:
+    """Create an entity directory with a minimal metadata.yaml."""
+    path.mkdir(parents=True, exist_ok=True)
+    with open(path / "metadata.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump({"id": entity_id}, f)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a small vault with a project, topic and article."""
+    vault_path = tmp_path / "vault"
+    _write_metadata(vault_path / "project-a", "project-1")
+    _write_metadata(vault_path / "project-a" / "topic-a", "topic-1")
+    _write_metadata(
+        vault_path / "project-a" / "topic-a" / "2024-01-01-120000", "article-1"
+    )
+    return vault_path
+
+
+@pytest.fixture
+def index_files(tmp_path):
+    """Return the index snapshot and journal paths."""
+    return tmp_path / "vault_index.json", tmp_path / "vault_index.journal"
+
+
+@pytest.fixture
+def entity_cache(vault, index_files):
+    """Point the common entity cache at the temporary vault."""
+    common.invalidate_entity_cache()
+    with patch("src.api.db.common.get_hierarchical_path", return_value=vault):
+        with patch(
+            "src.api.db.common.get_entity_index_paths", return_value=index_files
+        ):
+            yield
+    common.invalidate_entity_cache()
+
+
+def test_refresh_index_full_scan(vault):
+    """Test that an empty index parses every entity directory."""
+    dirs, parsed = entity_index.refresh_index(vault, {})
+
+    assert parsed == 3
+    assert dirs["project-a"][0] == "project-1"
+    assert dirs["project-a/topic-a"][0] == "topic-1"
+    assert dirs["project-a/topic-a/2024-01-01-120000"][0] == "article-1"
+
+
+def test_refresh_index_reuses_unchanged_dirs(vault):
+    """Test that unchanged directories are not parsed again."""
+    dirs, _ = entity_index.refresh_index(vault, {})
+    _write_metadata(vault / "project-a" / "topic-b", "topic-2")
+
+    refreshed, parsed = entity_index.refresh_index(vault, dirs)
+
+    # Only the changed project directory and the new topic are parsed
+    assert parsed == 2
+    assert refreshed["project-a/topic-b"][0] == "topic-2"
+    assert refreshed["project-a/topic-a/2024-01-01-120000"][0] == "article-1"
+
+
+def test_load_index_replays_journal(vault, index_files):
+    """Test that journal entries are applied on top of the snapshot."""
+    index_file, journal_file = index_files
+    dirs, _ = entity_index.refresh_index(vault, {})
+    entity_index.save_index(index_file, journal_file, dirs)
+
+    entity_index.append_journal(
+        journal_file, {"op": "add", "dir": "project-b", "id": "project-2"}
+    )
+    entity_index.append_journal(journal_file, {"op": "remove", "dir": "project-a"})
+
+    loaded = entity_index.load_index(index_file, journal_file)
+
+    assert loaded["project-b"] == ["project-2", None]
+    assert not any(key.startswith("project-a") for key in loaded)
+
+
+def test_load_index_corrupt_snapshot(index_files):
+    """Test that a corrupt snapshot falls back to an empty index."""
+    index_file, journal_file = index_files
+    index_file.write_text("{not json", encoding="utf-8")
+
+    assert entity_index.load_index(index_file, journal_file) == {}
+
+
+def test_entity_cache_uses_persisted_index(vault, index_files, entity_cache):
+    """Test that a restart reads the index instead of parsing the vault."""
+    assert common.find_entity_by_id("article-1")[1] == "article"
+    assert index_files[0].exists()
+
+    common.invalidate_entity_cache()
+    with patch(
+        "src.api.db.entity_index.read_entity_id",
+        side_effect=AssertionError("vault should not be parsed"),
+    ):
+        path, entity_type = common.find_entity_by_id("topic-1")
+
+    assert path == vault / "project-a" / "topic-a"
+    assert entity_type == "topic"
+
+
+def test_entity_cache_journals_changes(vault, index_files, entity_cache):
+    """Test that cache additions and removals are persisted incrementally."""
+    _write_metadata(vault / "project-b", "project-2")
+    common.add_to_entity_cache("project-2", vault / "project-b", "project")
+    common.remove_from_entity_cache("topic-1")
+
+    assert index_files[1].exists()
+    loaded = entity_index.load_index(*index_files)
+    assert loaded["project-b"][0] == "project-2"
+    assert "project-a/topic-a" not in loaded
+    assert "article-1" not in common._entity_id_cache
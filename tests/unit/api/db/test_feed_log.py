@@ -0,0 +1,52 @@
+"""Unit tests for the processed feed log."""
+
+from src.api.db import feed_log
+from src.api.models.feed_item import FeedItem
+
+
+def test_append_and_read_feed_log(tmp_path):
+    """Test that the last record of each feed item wins."""
+    item = FeedItem.create(url="https://example.com/a", content="a")
+    other = FeedItem.create(url="https://example.com/b", content="b")
+    feed_log.append_feed_log(
+        tmp_path, [feed_log.feed_item_record(item), feed_log.feed_item_record(other)]
+    )
+    item.is_relevant = True
+    feed_log.append_feed_log(tmp_path, [feed_log.feed_item_record(item)])
+
+    records, line_count = feed_log.read_feed_log(tmp_path)
+
+    assert line_count == 3
+    assert list(records) == [
+        feed_log.feed_item_key(item),
+        feed_log.feed_item_key(other),
+    ]
+    assert records[feed_log.feed_item_key(item)]["is_relevant"] is True
+    assert "needs_further_processing" not in records[feed_log.feed_item_key(item)]
+    assert FeedItem(**records[feed_log.feed_item_key(item)]) == item
+
+
+def test_read_feed_log_skips_incomplete_lines(tmp_path):
+    """Test that a line cut off by an interrupted write is ignored."""
+    item = FeedItem.create(url="https://example.com/a", content="a")
+    feed_log.append_feed_log(tmp_path, [feed_log.feed_item_record(item)])
+    with open(feed_log.get_feed_log_path(tmp_path), "a", encoding="utf-8") as f:
+        f.write('{"url": "https://exa')
+
+    records, line_count = feed_log.read_feed_log(tmp_path)
+
+    assert line_count == 1
+    assert list(records) == [feed_log.feed_item_key(item)]
+
+
+def test_write_feed_log_and_compaction_threshold(tmp_path):
+    """Test rewriting the log and the compaction rule."""
+    item = FeedItem.create(url="https://example.com/a", content="a")
+    feed_log.append_feed_log(tmp_path, [feed_log.feed_item_record(item)] * 3)
+
+    feed_log.write_feed_log(tmp_path, [feed_log.feed_item_record(item)])
+
+    assert feed_log.read_feed_log(tmp_path)[1] == 1
+    assert not feed_log.needs_compaction(10, 1)
+    assert not feed_log.needs_compaction(feed_log.COMPACT_MIN_LINES, 200)
+    assert feed_log.needs_compaction(feed_log.COMPACT_MIN_LINES, 100)
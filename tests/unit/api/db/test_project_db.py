@@ -12,6 +12,7 @@ from src.api.db.project_db import (
     create_project,
     get_project,
     get_project_by_slug,
+    get_project_for_topic,
     list_projects,
     mark_project_deleted,
     remove_topic_from_project,
@@ -173,6 +174,8 @@ def test_get_project_by_slug(
     assert result.title == mock_project.title
 
 
+@patch("src.api.db.project_db._project_cache", {})
+@patch("src.api.db.project_db._cache_initialized", False)
 @patch("src.api.db.project_db._get_project_directories")
 @patch("pathlib.Path.exists", return_value=True)
 @patch("builtins.open", new_callable=mock_open)
@@ -222,6 +225,59 @@ def test_list_projects(
     assert result[0].id == "project-1"
     assert result[1].id == "project-2"
 
+    # Subsequent calls are served from the cache without reading from disk
+    mock_get_dirs.reset_mock()
+    assert [project.id for project in list_projects()] == ["project-1", "project-2"]
+    mock_get_dirs.assert_not_called()
+
+
+@patch("src.api.db.project_db._cache_initialized", True)
+@patch("src.api.db.project_db.find_entity_by_id")
+def test_get_project_from_cache(mock_find, mock_project):
+    """Test that a cached project is returned without touching disk."""
+    with patch("src.api.db.project_db._project_cache", {mock_project.id: mock_project}):
+        with patch("builtins.open", side_effect=AssertionError("disk read")):
+            result = get_project(mock_project.id)
+
+    assert result is mock_project
+    mock_find.assert_not_called()
+
+
+@patch("src.api.db.project_db._cache_initialized", True)
+@patch("src.api.db.project_db.get_hierarchical_path")
+@patch("src.api.db.project_db.ensure_path_exists")
+@patch("builtins.open", new_callable=mock_open)
+@patch("src.api.db.project_db.add_to_entity_cache")
+def test_save_project_writes_through_cache(
+    mock_add_cache, mock_file, mock_ensure_path, mock_get_path, mock_project
+):
+    """Test that saving a project updates the in-memory cache."""
+    mock_get_path.return_value = Path("/mock/vault/test-project")
+    mock_project.slug = "test-project"
+
+    with patch("src.api.db.project_db._project_cache", {}) as mock_cache:
+        save_project(mock_project)
+        assert mock_cache[mock_project.id] is mock_project
+        assert list_projects() == [mock_project]
+
+
+@patch("src.api.db.project_db.find_entity_by_id")
+@patch("src.api.db.project_db.shutil.rmtree")
+@patch("src.api.db.project_db.remove_from_entity_cache")
+def test_mark_project_deleted_evicts_cache(
+    mock_remove, mock_rmtree, mock_find, mock_project
+):
+    """Test that deleting a project evicts it from the cache."""
+    project_path = MagicMock(spec=Path)
+    project_path.exists.return_value = True
+    mock_find.return_value = (project_path, "project")
+
+    with patch(
+        "src.api.db.project_db._project_cache", {mock_project.id: mock_project}
+    ) as mock_cache:
+        assert mark_project_deleted(mock_project.id) is True
+        assert mock_project.id not in mock_cache
+
 
 @patch("uuid.uuid4", return_value="test-uuid")
 @patch("src.api.db.project_db.save_project")
@@ -475,3 +531,39 @@ def test_remove_topic_from_project_not_found(mock_get_project):
     """Test removing a topic from a non-existent project."""
     result = remove_topic_from_project("non-existent-project", "topic-1")
     assert result is None
+
+
+@patch("src.api.db.project_db._cache_initialized", True)
+@patch("src.api.db.project_db.save_project")
+def test_topic_project_index_tracks_membership(mock_save, mock_project):
+    """Test that the topic to project index follows topic membership changes."""
+    with patch("src.api.db.project_db._project_cache", {mock_project.id: mock_project}):
+        with patch("src.api.db.project_db._topic_project_index", {}) as mock_index:
+            add_topic_to_project(mock_project.id, "topic-3")
+            assert mock_index["topic-3"] == mock_project.id
+            assert get_project_for_topic("topic-3") is mock_project
+
+            remove_topic_from_project(mock_project.id, "topic-3")
+            assert "topic-3" not in mock_index
+            assert get_project_for_topic("topic-3") is None
+
+
+@patch("src.api.db.project_db._cache_initialized", True)
+@patch("src.api.db.project_db.find_entity_by_id")
+@patch("src.api.db.project_db.shutil.rmtree")
+@patch("src.api.db.project_db.remove_from_entity_cache")
+def test_mark_project_deleted_clears_topic_index(
+    mock_remove, mock_rmtree, mock_find, mock_project
+):
+    """Test that deleting a project drops its topics from the reverse index."""
+    project_path = MagicMock(spec=Path)
+    project_path.exists.return_value = True
+    mock_find.return_value = (project_path, "project")
+
+    with patch("src.api.db.project_db._project_cache", {mock_project.id: mock_project}):
+        with patch(
+            "src.api.db.project_db._topic_project_index",
+            {"topic-1": mock_project.id, "topic-2": mock_project.id},
+        ) as mock_index:
+            assert mark_project_deleted(mock_project.id) is True
+            assert mock_index == {}
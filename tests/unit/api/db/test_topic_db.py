@@ -5,10 +5,13 @@ from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
+import yaml
 
+from src.api.db import feed_log
 from src.api.db.topic_db import (
     _ensure_cache,
     _load_all_topics_from_disk,
+    _topic_from_files,
     create_topic,
     get_topic,
     get_topic_location,
@@ -20,6 +23,7 @@ from src.api.db.topic_db import (
     save_topic,
     update_topic,
 )
+from src.api.models.feed_item import FeedItem
 from src.api.models.topic import Topic
 
 
@@ -189,14 +193,18 @@ def test_save_topic(mock_topic):
     mock_project.id = "test-project-id"
     mock_project.topic_ids = ["test-topic-123"]
 
-    with patch("src.api.db.project_db.list_projects", return_value=[mock_project]):
-        with patch("src.api.db.project_db.get_project", return_value=mock_project):
+    with patch(
+        "src.api.db.project_db.get_project_for_topic", return_value=mock_project
+    ):
+        with patch("src.api.db.project_db.list_projects") as mock_list_projects:
             with patch("src.api.db.topic_db.create_slug") as mock_create_slug:
                 with patch(
                     "src.api.db.topic_db.get_hierarchical_path"
                 ) as mock_get_path:
                     with patch("src.api.db.topic_db.ensure_path_exists"):
-                        with patch("builtins.open", mock_open()) as mock_file:
+                        with patch("builtins.open", mock_open()) as mock_file, patch(
+                            "os.replace"
+                        ) as mock_replace:
                             with patch("src.api.db.topic_db.add_to_entity_cache"):
                                 # Setup mocks
                                 mock_create_slug.side_effect = [
@@ -211,8 +219,14 @@ def test_save_topic(mock_topic):
 
                                 # Check result
                                 path_arg = mock_file.call_args[0][0]
-                                assert str(path_arg).endswith("metadata.yaml")
+                                assert str(path_arg).endswith("metadata.yaml.tmp")
                                 assert str(path_arg).startswith(str(mock_path))
+                                mock_replace.assert_called_once_with(
+                                    path_arg, mock_path / "metadata.yaml"
+                                )
+
+                                # No project enumeration is needed
+                                mock_list_projects.assert_not_called()
 
 
 def test_get_topic(mock_topic):
@@ -438,3 +452,74 @@ def test_load_feed_items():
     assert result[0].content_hash == "hash1"
     assert result[1].url == "http://example.com/item2"
     assert result[1].content_hash == "hash2"
+
+
+@pytest.fixture
+def topic_dir(tmp_path, mock_topic):
+    """Save topics to a temporary topic directory."""
+    mock_project = MagicMock(slug="project-slug")
+    with patch(
+        "src.api.db.project_db.get_project_for_topic", return_value=mock_project
+    ):
+        with patch("src.api.db.topic_db.get_hierarchical_path", return_value=tmp_path):
+            with patch("src.api.db.topic_db.add_to_entity_cache"):
+                with patch("src.api.db.topic_db._topic_cache", {}):
+                    with patch("src.api.db.topic_db._feed_log_state", {}):
+                        mock_topic.slug = "topic-slug"
+                        yield tmp_path
+
+
+def test_save_topic_appends_processed_feeds(mock_topic, topic_dir):
+    """Test that saving a topic only appends new and changed feed items."""
+    first = FeedItem.create(url="https://example.com/a", content="a")
+    mock_topic.processed_feeds.append(first)
+    save_topic(mock_topic)
+
+    second = FeedItem.create(url="https://example.com/b", content="b")
+    mock_topic.processed_feeds.append(second)
+    first.is_relevant = True
+    save_topic(mock_topic)
+    save_topic(mock_topic)
+
+    with open(topic_dir / "metadata.yaml", "r", encoding="utf-8") as f:
+        assert "processed_feeds" not in yaml.safe_load(f)
+    records, line_count = feed_log.read_feed_log(topic_dir)
+    assert line_count == 3
+    assert len(records) == 2
+
+    with patch("src.api.db.topic_db._feed_log_state", {}):
+        loaded = _topic_from_files(topic_dir, "topic-slug")
+    assert loaded.processed_feeds == [first, second]
+
+
+def test_save_topic_migrates_inline_processed_feeds(mock_topic, topic_dir):
+    """Test that feed items stored in metadata.yaml move to the feed log."""
+    item = FeedItem.create(url="https://example.com/a", content="a")
+    topic_data = mock_topic.model_dump(mode="json")
+    topic_data["processed_feeds"] = [item.model_dump(mode="json")]
+    with open(topic_dir / "metadata.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(topic_data, f)
+
+    topic = _topic_from_files(topic_dir, "topic-slug")
+    save_topic(topic)
+
+    with open(topic_dir / "metadata.yaml", "r", encoding="utf-8") as f:
+        assert "processed_feeds" not in yaml.safe_load(f)
+    records, _ = feed_log.read_feed_log(topic_dir)
+    assert list(records) == [(item.url, item.content_hash)]
+
+
+def test_save_topic_compacts_feed_log(mock_topic, topic_dir):
+    """Test that a log of mostly superseded records is rewritten."""
+    item = FeedItem.create(url="https://example.com/a", content="a")
+    mock_topic.processed_feeds.append(item)
+    with patch("src.api.db.feed_log.COMPACT_MIN_LINES", 4):
+        for i in range(4):
+            item.relevance_explanation = f"explanation {i}"
+            save_topic(mock_topic)
+
+    records, line_count = feed_log.read_feed_log(topic_dir)
+    assert line_count == 1
+    assert records[(item.url, item.content_hash)]["relevance_explanation"] == (
+        "explanation 3"
+    )
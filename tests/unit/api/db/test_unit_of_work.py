@@ -0,0 +1,114 @@
+"""Unit tests for the unit of work that coalesces saves."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.api.db import unit_of_work
+from src.api.db.article_db import get_article, save_article
+from src.api.db.topic_db import save_topic
+from src.api.models.article import Article
+from src.api.models.topic import Topic
+
+
+def test_saves_are_coalesced_until_session_ends():
+    """Test that each dirty entity is written once, articles first."""
+    writes = []
+    article = SimpleNamespace(id="article-1")
+    topic = SimpleNamespace(id="topic-1")
+
+    with unit_of_work.write_session():
+        assert unit_of_work.in_session()
+        for _ in range(3):
+            unit_of_work.defer_save("topic", topic, writes.append)
+        unit_of_work.defer_save("article", article, writes.append)
+        assert unit_of_work.get_pending("topic", "topic-1") is topic
+        assert writes == []
+
+    assert writes == [article, topic]
+    assert not unit_of_work.in_session()
+    assert not unit_of_work.defer_save("topic", topic, writes.append)
+
+
+def test_explicit_flush_and_nested_sessions():
+    """Test that flush writes immediately and nested sessions join the outer one."""
+    writes = []
+    topic = SimpleNamespace(id="topic-1")
+
+    with unit_of_work.write_session():
+        with unit_of_work.write_session():
+            unit_of_work.defer_save("topic", topic, writes.append)
+        assert writes == []
+
+        assert unit_of_work.flush() == 1
+        assert writes == [topic]
+        assert unit_of_work.get_pending("topic", "topic-1") is None
+
+    assert writes == [topic]
+
+
+def test_session_flushes_when_block_raises():
+    """Test that pending saves are written even if the session fails."""
+    writes = []
+    topic = SimpleNamespace(id="topic-1")
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work.write_session():
+            unit_of_work.defer_save("topic", topic, writes.append)
+            raise RuntimeError("graph failed")
+
+    assert writes == [topic]
+
+
+def test_aflush_writes_in_a_worker_thread():
+    """Test that coroutines flush their session without blocking the loop."""
+    threads = []
+    topic = SimpleNamespace(id="topic-1")
+
+    async def run():
+        with unit_of_work.write_session():
+            unit_of_work.defer_save(
+                "topic", topic, lambda _: threads.append(threading.current_thread())
+            )
+            assert await unit_of_work.aflush() == 1
+            assert unit_of_work.in_session()
+            assert not unit_of_work.has_pending("topic", "topic-1")
+
+    asyncio.run(run())
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_database_saves_are_deferred():
+    """Test that topic and article saves are deferred and readable in a session."""
+    topic = Topic(id="topic-1", name="Topic", description="A topic", feed_urls=[])
+    article = Article(
+        id="article-1",
+        title="Article",
+        topic_id="topic-1",
+        content="Content",
+        version=1,
+        created_at="2023-01-01T12:00:00",
+    )
+
+    with patch("src.api.db.topic_db._write_topic") as mock_write_topic:
+        with patch("src.api.db.article_db._write_article") as mock_write_article:
+            with patch("src.api.db.topic_db._topic_cache", {}) as mock_cache:
+                with unit_of_work.write_session():
+                    save_topic(topic)
+                    save_article(article)
+                    save_topic(topic)
+
+                    assert mock_cache["topic-1"] is topic
+                    pending = get_article("article-1")
+                    assert pending == article
+                    assert pending is not article
+                    mock_write_topic.assert_not_called()
+                    mock_write_article.assert_not_called()
+
+    mock_write_article.assert_called_once_with(article)
+    mock_write_topic.assert_called_once_with(topic)
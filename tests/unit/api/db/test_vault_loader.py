@@ -0,0 +1,109 @@
+"""Unit tests for the parallel vault warm-up."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.api.db import common, entity_index, project_db, topic_db
+from src.api.db.vault_loader import warm_up_vault
+
+
+def write_metadata(path, data):
+    """Write a metadata.yaml file, creating its directory."""
+    path.mkdir(parents=True)
+    with open(path / "metadata.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault with two projects, three topics and one article."""
+    vault_path = tmp_path / "vault"
+    for p in range(2):
+        write_metadata(
+            vault_path / f"project-{p}",
+            {
+                "id": f"project-{p}",
+                "title": f"Project {p}",
+                "description": "A project",
+                "topic_ids": [f"topic-{p}-{t}" for t in range(p + 1)],
+                "created_at": "2023-01-01T12:00:00",
+                "updated_at": None,
+            },
+        )
+        for t in range(p + 1):
+            write_metadata(
+                vault_path / f"project-{p}" / f"topic-{t}",
+                {
+                    "id": f"topic-{p}-{t}",
+                    "name": f"Topic {t}",
+                    "description": "A topic",
+                    "feed_urls": [],
+                },
+            )
+    write_metadata(
+        vault_path / "project-0" / "topic-0" / "2023-01-01T12-00-00",
+        {"id": "article-1"},
+    )
+
+    index_paths = (tmp_path / "vault_index.json", tmp_path / "vault_index.journal")
+    common.invalidate_entity_cache()
+    with patch("src.api.db.common.get_hierarchical_path", return_value=vault_path):
+        with patch(
+            "src.api.db.common.get_entity_index_paths", return_value=index_paths
+        ):
+            with patch("src.api.db.project_db._project_cache", {}), patch(
+                "src.api.db.project_db._topic_project_index", {}
+            ), patch("src.api.db.project_db._cache_initialized", False):
+                with patch("src.api.db.topic_db._topic_cache", {}), patch(
+                    "src.api.db.topic_db._cache_initialized", False
+                ):
+                    yield vault_path
+    common.invalidate_entity_cache()
+
+
+def test_warm_up_vault_fills_caches(vault):
+    """Test that one warm-up pass fills the entity, project and topic caches."""
+    stats = warm_up_vault(max_workers=4)
+
+    assert stats["projects"] == 2
+    assert stats["topics"] == 3
+    assert stats["entities"] == 6
+    # Project and topic metadata parsed for the index is not read again
+    assert stats["files"] == 6
+    assert stats["seconds"] >= 0
+
+    with patch("builtins.open", side_effect=AssertionError("disk read")):
+        assert len(project_db.list_projects()) == 2
+        assert len(topic_db.list_topics()) == 3
+        assert project_db.get_project_for_topic("topic-1-1").id == "project-1"
+        assert common.find_entity_by_id("article-1")[1] == "article"
+
+
+def test_warm_up_with_valid_index_reads_models_only(vault):
+    """Test that a warm start parses no index entries and each model once."""
+    warm_up_vault(max_workers=4)
+    common.invalidate_entity_cache()
+    project_db._project_cache.clear()
+    topic_db._topic_cache.clear()
+
+    with patch(
+        "src.api.db.entity_index.read_metadata",
+        side_effect=AssertionError("index entry parsed"),
+    ):
+        stats = warm_up_vault(max_workers=4)
+
+    assert stats["files"] == 2 + 3
+    assert stats["topics"] == 3
+
+
+def test_refresh_index_parallel_matches_serial(vault):
+    """Test that refreshing the index with a worker pool gives the same result."""
+    serial, serial_parsed = entity_index.refresh_index(vault, {})
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel, parallel_parsed = entity_index.refresh_index(vault, {}, executor)
+
+    assert parallel == serial
+    assert parallel_parsed == serial_parsed == 6
@@ -0,0 +1,140 @@
+"""Unit tests for the per-topic version manifest."""
+
+import json
+from datetime import datetime
+
+from src.api.db import version_manifest
+from src.api.models.article import Article
+from src.api.models.feed_item import FeedItem
+
+
+def make_article(article_id, version, previous_version=None, feed_url=None):
+    """Create an article version for testing."""
+    return Article(
+        id=article_id,
+        title="Test Article",
+        topic_id="topic-1",
+        content=f"Content {version}",
+        version=version,
+        created_at=datetime(2023, 1, 1, 12, 0, 0),
+        updated_at=datetime(2023, 1, version, 12, 0, 0),
+        previous_version=previous_version,
+        source_feed=FeedItem.create(url=feed_url, content="feed") if feed_url else None,
+    )
+
+
+def test_record_and_load_versions(tmp_path):
+    """Test that recorded versions are loaded in save order."""
+    v1 = make_article("v1", 1)
+    v2 = make_article("v2", 2, "v1", "https://example.com/item")
+    version_manifest.record_versions(tmp_path, [v1])
+    version_manifest.record_versions(tmp_path, [v2])
+
+    entries = version_manifest.load_manifest(tmp_path)
+
+    assert [entry["id"] for entry in entries] == ["v1", "v2"]
+    assert entries[1]["version"] == 2
+    assert entries[1]["previous_version"] == "v1"
+    assert entries[1]["source_feed_url"] == "https://example.com/item"
+    assert entries[1]["updated_at"] == "2023-01-02T12:00:00"
+
+
+def test_record_versions_skips_unchanged(tmp_path):
+    """Test that re-recording an unchanged version does not rewrite the file."""
+    v1 = make_article("v1", 1)
+    version_manifest.record_versions(tmp_path, [v1])
+    manifest_file = version_manifest.get_manifest_path(tmp_path)
+    mtime = manifest_file.stat().st_mtime_ns
+
+    v1.next_version = "v2"
+    version_manifest.record_versions(tmp_path, [v1])
+
+    assert manifest_file.stat().st_mtime_ns == mtime
+
+
+def test_load_manifest_missing(tmp_path):
+    """Test that a missing manifest loads as None."""
+    assert version_manifest.load_manifest(tmp_path) is None
+
+
+def test_record_versions_appends_one_line_per_save(tmp_path):
+    """Test that a save appends its entry instead of rewriting the manifest."""
+    version_manifest.record_versions(
+        tmp_path, [make_article("v1", 1), make_article("v2", 2, "v1")]
+    )
+    manifest_file = version_manifest.get_manifest_path(tmp_path)
+    before = manifest_file.read_text()
+
+    version_manifest.record_versions(tmp_path, [make_article("v3", 3, "v2")])
+
+    text = manifest_file.read_text()
+    assert text.startswith(before)
+    assert len(text.splitlines()) == 3
+
+
+def test_load_manifest_skips_incomplete_lines(tmp_path):
+    """Test that a line left by an interrupted write is ignored."""
+    version_manifest.record_versions(tmp_path, [make_article("v1", 1)])
+    with open(version_manifest.get_manifest_path(tmp_path), "a") as f:
+        f.write('{"id": "v2", "ver')
+
+    entries = version_manifest.load_manifest(tmp_path)
+
+    assert [entry["id"] for entry in entries] == ["v1"]
+
+
+def test_load_manifest_rereads_changed_file(tmp_path):
+    """Test that cached entries are dropped when the file changes on disk."""
+    version_manifest.record_versions(tmp_path, [make_article("v1", 1)])
+    version_manifest.load_manifest(tmp_path)
+
+    entry = version_manifest.manifest_entry(make_article("v2", 2, "v1"))
+    with open(version_manifest.get_manifest_path(tmp_path), "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+    entries = version_manifest.load_manifest(tmp_path)
+    assert [entry["id"] for entry in entries] == ["v1", "v2"]
+
+
+def test_manifest_compacts_superseded_records(tmp_path, monkeypatch):
+    """Test that the log is rewritten once it holds mostly superseded records."""
+    monkeypatch.setattr(version_manifest, "COMPACT_MIN_LINES", 4)
+    article = make_article("v1", 1)
+    for day in range(1, 5):
+        article.updated_at = datetime(2023, 1, day, 12, 0, 0)
+        version_manifest.record_versions(tmp_path, [article])
+
+    manifest_file = version_manifest.get_manifest_path(tmp_path)
+    assert len(manifest_file.read_text().splitlines()) == 1
+    entries = version_manifest.load_manifest(tmp_path)
+    assert entries[0]["updated_at"] == "2023-01-04T12:00:00"
+
+
+def test_get_version_chain_separates_chains(tmp_path):
+    """Test that only the chain containing the article is returned."""
+    articles = [
+        make_article("a1", 1),
+        make_article("b1", 1),
+        make_article("a2", 2, "a1"),
+        make_article("a3", 3, "a2"),
+    ]
+    version_manifest.record_versions(tmp_path, articles)
+    entries = version_manifest.load_manifest(tmp_path)
+
+    chain = version_manifest.get_version_chain(entries, "a2")
+
+    assert [entry["id"] for entry in chain] == ["a1", "a2", "a3"]
+    assert version_manifest.get_version_chain(entries, "b1")[0]["id"] == "b1"
+    assert version_manifest.get_version_chain(entries, "missing") is None
+
+
+def test_remove_version(tmp_path):
+    """Test that deleted articles are removed from the manifest."""
+    version_manifest.record_versions(
+        tmp_path, [make_article("v1", 1), make_article("v2", 2, "v1")]
+    )
+
+    version_manifest.remove_version(tmp_path, "v1")
+
+    entries = version_manifest.load_manifest(tmp_path)
+    assert [entry["id"] for entry in entries] == ["v2"]
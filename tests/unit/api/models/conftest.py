@@ -2,18 +2,10 @@
 Fixtures for unit tests.
 """
 
-import os
-import sys
 from datetime import datetime, timezone
-from pathlib import Path
 
 import pytest
 
-# Add the src directory to the Python path if not already there
-src_dir = Path(__file__).parents[3].parent / "src"
-if os.path.exists(src_dir) and str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-
 
 @pytest.fixture
 def sample_topic_data():
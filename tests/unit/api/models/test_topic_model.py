@@ -102,6 +102,31 @@ def test_representation_model():
     assert isinstance(representation.created_at, datetime)
 
 
+def test_binary_representation():
+    """Test that binary content is kept as bytes and base64 encoded in JSON."""
+    representation = Representation(
+        type="audio", content=b"\xff\xfb\x90", metadata={"binary": True}
+    )
+
+    assert representation.content == b"\xff\xfb\x90"
+    assert representation.is_binary
+    assert representation.get_bytes() == b"\xff\xfb\x90"
+    assert representation.get_size() == 3
+    assert representation.model_dump()["content"] == b"\xff\xfb\x90"
+    assert '"content":"//uQ"' in representation.model_dump_json()
+
+
+def test_legacy_hex_representation():
+    """Test that hex strings written by older versions are decoded."""
+    representation = Representation(
+        type="audio", content="fffb90", metadata={"binary": True}
+    )
+
+    assert representation.is_binary
+    assert representation.get_bytes() == b"\xff\xfb\x90"
+    assert representation.get_size() == 3
+
+
 def test_topic_from_fixture(sample_topic_data):
     """Test creating a Topic from fixture data."""
     topic = Topic(**sample_topic_data)
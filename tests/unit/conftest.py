@@ -0,0 +1,14 @@
+"""Configuration for unit tests.
+
+This ensures that the 'src' directory is in the Python path for tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Get the src directory (3 levels up from this file)
+src_dir = Path(__file__).parents[2] / "src"
+
+# Add src to the Python path
+if src_dir.exists() and str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
@@ -0,0 +1,87 @@
+"""Unit tests for the asyncio curation dispatcher."""
+
+import asyncio
+import time
+from concurrent.futures import wait
+from unittest.mock import patch
+
+import pytest
+
+from curator import async_dispatcher
+
+
+@pytest.fixture
+def dispatcher():
+    """Run the dispatcher with two concurrent items for the duration of a test."""
+    async_dispatcher.start_dispatcher(max_concurrency=2)
+    yield async_dispatcher
+    async_dispatcher.stop_dispatcher()
+
+
+def test_topics_run_concurrently_and_items_in_order(dispatcher):
+    """Test that topics share the concurrency limit and each keeps its order."""
+    running = {}
+    peaks = {"total": 0}
+    curated = {"topic-a": [], "topic-b": [], "topic-c": []}
+
+    async def curate(topic_id, content, feed_item):
+        running[topic_id] = running.get(topic_id, 0) + 1
+        peaks[topic_id] = max(peaks.get(topic_id, 0), running[topic_id])
+        peaks["total"] = max(peaks["total"], sum(running.values()))
+        await asyncio.sleep(0.01)
+        running[topic_id] -= 1
+        curated[topic_id].append(content)
+        return {"topic_id": topic_id}
+
+    with patch("curator.async_dispatcher.aprocess_feed_item", side_effect=curate):
+        futures = [
+            dispatcher.submit_feed_item(topic_id, str(index))
+            for index in range(4)
+            for topic_id in curated
+        ]
+        wait(futures)
+
+    assert all(future.result() for future in futures)
+    assert peaks.pop("total") == 2
+    assert set(peaks.values()) == {1}
+    assert curated == {topic_id: [str(i) for i in range(4)] for topic_id in curated}
+    assert dispatcher.get_dispatcher_stats() == {"running": 0, "active_topics": 0}
+
+
+def test_stop_drops_waiting_items(dispatcher):
+    """Test that stopping finishes running items and cancels waiting ones."""
+
+    async def curate(topic_id, content, feed_item):
+        await asyncio.sleep(0.05)
+        return {"topic_id": topic_id}
+
+    with patch("curator.async_dispatcher.aprocess_feed_item", side_effect=curate):
+        futures = [dispatcher.submit_feed_item("topic-a", str(i)) for i in range(3)]
+        while not dispatcher.get_dispatcher_stats()["running"]:
+            time.sleep(0.001)
+        dispatcher.stop_dispatcher()
+
+    assert futures[0].result() == {"topic_id": "topic-a"}
+    assert all(future.cancelled() for future in futures[1:])
+    with pytest.raises(RuntimeError):
+        dispatcher.submit_feed_item("topic-a")
+
+
+def test_stop_is_bounded_when_items_ignore_cancellation(dispatcher):
+    """Test that stopping returns even if an item never finishes."""
+
+    async def curate(topic_id, content, feed_item):
+        while True:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                pass
+
+    with patch("curator.async_dispatcher.aprocess_feed_item", side_effect=curate):
+        dispatcher.submit_feed_item("topic-a")
+        while not dispatcher.get_dispatcher_stats()["running"]:
+            time.sleep(0.001)
+        started = time.monotonic()
+        dispatcher.stop_dispatcher(timeout=0.1)
+
+    assert time.monotonic() - started < 1
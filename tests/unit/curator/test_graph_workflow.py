@@ -0,0 +1,91 @@
+"""Unit tests for the curator graph workflow."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.models.feed_item import FeedItem
+from api.models.topic import Topic
+from curator import graph_workflow
+
+
+@pytest.fixture
+def fresh_graph():
+    """Start and end each test without a compiled graph."""
+    graph_workflow._curator_graph = None
+    yield
+    graph_workflow._curator_graph = None
+
+
+def test_graph_is_compiled_once(fresh_graph):
+    """Test that processing several items reuses one compiled graph."""
+    graph = MagicMock()
+    graph.invoke.return_value = {"topic_id": "topic-a"}
+    with patch(
+        "curator.graph_workflow.create_curator_graph", return_value=graph
+    ) as create:
+        graph_workflow.process_feed_item("topic-a")
+        graph_workflow.process_feed_item("topic-a")
+
+    create.assert_called_once()
+    assert graph.invoke.call_count == 2
+
+
+def test_concurrent_first_use_compiles_once(fresh_graph):
+    """Test that threads racing to use the graph first share one compilation."""
+    barrier = threading.Barrier(8)
+    graphs = []
+
+    def use_graph():
+        barrier.wait()
+        graphs.append(graph_workflow.get_curator_graph())
+
+    with patch(
+        "curator.graph_workflow.create_curator_graph", side_effect=lambda: object()
+    ) as create:
+        threads = [threading.Thread(target=use_graph) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    create.assert_called_once()
+    assert all(graph is graphs[0] for graph in graphs)
+
+
+def test_async_run_awaits_async_steps(fresh_graph):
+    """Test that an async run takes the async twins of the LLM steps."""
+    topic = Topic(id="topic-a", name="Topic", description="Topic", feed_urls=[])
+    feed_item = FeedItem.create(url="https://example.com/item", content="")
+    awaited = []
+
+    def async_step(name, **updates):
+        async def step(state):
+            awaited.append(name)
+            await asyncio.sleep(0)
+            return {**state, **updates}
+
+        return step
+
+    async def relevant(state):
+        awaited.append("news_relevance")
+        state["feed_item"].is_relevant = True
+        return state
+
+    with patch.multiple(
+        "curator.graph_workflow",
+        process_input=lambda state: {"topic": topic, "existing_article": True},
+        anews_relevance=relevant,
+        aextract_substance=async_step("extract_substance"),
+        arefine_article=async_step("refine_article", refined_article=True),
+        news_relevance=MagicMock(side_effect=AssertionError("sync step")),
+    ):
+        result = asyncio.run(
+            graph_workflow.aprocess_feed_item("topic-a", "Text", feed_item)
+        )
+
+    assert awaited == ["news_relevance", "extract_substance", "refine_article"]
+    assert result["refined_article"] is True
+    assert not result.get("has_error")
@@ -0,0 +1,170 @@
+"""Unit tests for batched relevance filtering in the news relevance step."""
+
+import importlib
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+
+from api.models.feed_item import FeedItem
+from api.models.prompt import Prompt
+from api.models.topic import Topic
+from curator.graph_workflow import process_feed_item
+from curator.steps.news_relevance import RelevanceResponse
+
+# curator.steps re-exports the step's process function under the module name
+news_relevance = importlib.import_module("curator.steps.news_relevance")
+
+PROMPTS = {
+    "article-relevance-batch-filter": "{topic_title} {topic_description} "
+    "{article} {sources}",
+    "article-relevance-filter": "{topic_title} {topic_description} "
+    "{article} {new_context}",
+}
+
+
+def _verdicts(*relevant):
+    """Build a batch response with a verdict per source."""
+    return json.dumps(
+        {
+            "verdicts": [
+                {"index": index, "is_relevant": value, "explanation": f"source {index}"}
+                for index, value in enumerate(relevant, 1)
+            ]
+        }
+    )
+
+
+@pytest.fixture
+def batching():
+    """Batch up to ten items within a budget of 100 tokens per call."""
+    settings = {"batch_size": 10, "token_budget": 100}
+    llm = FakeListChatModel(responses=[], cache=False)
+    news_relevance.clear_relevance_batches()
+    with patch.multiple(
+        "curator.steps.news_relevance",
+        get_setting=lambda key, default=None: settings,
+        load_llm_settings=lambda: {"relevance_filter": {"max_tokens": 200}},
+        get_prompt=lambda prompt_id: Prompt(
+            id=prompt_id, name=prompt_id, template=PROMPTS[prompt_id]
+        ),
+        get_llm=lambda task: llm,
+        save_topic=lambda topic: None,
+    ):
+        with patch(
+            "curator.steps.news_relevance.determine_relevance_batch",
+            wraps=news_relevance.determine_relevance_batch,
+        ) as batch_calls:
+            yield SimpleNamespace(settings=settings, llm=llm, batch_calls=batch_calls)
+    news_relevance.clear_relevance_batches()
+
+
+def _queue(topic, count, content="Some news"):
+    """Register items for a topic as the pipeline would, returning their states."""
+    states = []
+    for index in range(count):
+        feed_item = FeedItem.create(url=f"https://example.com/{index}", content="")
+        news_relevance.add_pending_item(topic.id, feed_item, content)
+        states.append(
+            {
+                "topic": topic,
+                "existing_article": SimpleNamespace(content="Article"),
+                "feed_content": content,
+                "feed_item": feed_item,
+            }
+        )
+    return states
+
+
+def _topic():
+    """Create a topic without processed feeds."""
+    return Topic(id="topic-a", name="Topic", description="Topic", feed_urls=[])
+
+
+def test_pending_items_are_judged_in_one_call(batching):
+    """Test that one call judges a topic's pending items and its verdicts are kept."""
+    batching.llm.responses = [_verdicts(True, False, True)]
+    states = _queue(_topic(), 3)
+
+    with patch("curator.steps.news_relevance.determine_relevance") as single:
+        results = [news_relevance.process(state) for state in states]
+
+    batching.batch_calls.assert_called_once()
+    assert len(batching.batch_calls.call_args.args[2]) == 3
+    single.assert_not_called()
+    assert [state["feed_item"].is_relevant for state in states] == [True, False, True]
+    assert results[1]["error_message"] == "source 2"
+
+
+def test_failed_batch_falls_back_to_single_calls(batching):
+    """Test that items of a batch that cannot be parsed are judged one by one."""
+    batching.llm.responses = ["not a list of verdicts"]
+    states = _queue(_topic(), 2)
+
+    with patch(
+        "curator.steps.news_relevance.determine_relevance",
+        return_value=RelevanceResponse(is_relevant=True, explanation="single"),
+    ) as single:
+        results = [news_relevance.process(state) for state in states]
+
+    batching.batch_calls.assert_called_once()
+    assert single.call_count == 2
+    assert all(not result.get("has_error") for result in results)
+    assert all(state["feed_item"].is_relevant for state in states)
+
+
+def test_batches_respect_size_and_token_budget(batching):
+    """Test that a batch stops at the batch size or the token budget."""
+    states = _queue(_topic(), 5, content="x" * 120)
+
+    batching.settings.update(batch_size=2, token_budget=1000)
+    verdict, batch = news_relevance._claim_batch(states[0])
+    assert verdict is None
+    assert [item.url for item, _ in batch] == [
+        state["feed_item"].url for state in states[:2]
+    ]
+
+    # 30 tokens per item fit three items in a budget of 100
+    batching.settings.update(batch_size=10, token_budget=100)
+    verdict, batch = news_relevance._claim_batch(states[2])
+    assert [item.url for item, _ in batch] == [
+        state["feed_item"].url for state in states[2:5]
+    ]
+
+
+def test_failed_batch_items_do_not_open_new_batches(batching):
+    """Test that items of a failed batch are judged alone when they arrive."""
+    batching.settings.update(batch_size=2)
+    batching.llm.responses = ["not a list of verdicts"]
+    states = _queue(_topic(), 3)
+
+    with patch(
+        "curator.steps.news_relevance.determine_relevance",
+        return_value=RelevanceResponse(is_relevant=True, explanation="single"),
+    ) as single:
+        for state in states:
+            news_relevance.process(state)
+
+    batching.batch_calls.assert_called_once()
+    assert single.call_count == 3
+    assert news_relevance._single == set()
+
+
+def test_runs_that_skip_the_step_drop_their_batch_state(batching):
+    """Test that verdicts and pending items of runs ending early are pruned."""
+    batching.settings.update(batch_size=2)
+    batching.llm.responses = [_verdicts(True, True)]
+    states = _queue(_topic(), 3)
+    news_relevance.process(states[0])
+    assert news_relevance._verdicts and news_relevance._pending
+
+    # The graph routes both remaining items to the end before this step
+    graph = SimpleNamespace(invoke=lambda state: state)
+    with patch("curator.graph_workflow.get_curator_graph", return_value=graph):
+        for state in states[1:]:
+            process_feed_item("topic-a", "Some news", state["feed_item"])
+
+    assert news_relevance._verdicts == {}
+    assert news_relevance._pending == {}
@@ -0,0 +1,148 @@
+"""Unit tests for the staged topic update pipeline."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from api.models.feed_item import FeedItem
+from curator import topic_updater
+
+
+@pytest.fixture
+def pipeline():
+    """Run the pipeline with four curation workers for the duration of a test."""
+    with patch("curator.topic_updater.load_settings", return_value=(2, 4, 1, 8)):
+        yield topic_updater
+        topic_updater.stop_update_processor()
+
+
+def _feed_item(url, needs_further_processing=False):
+    """Create a feed item for a URL."""
+    return FeedItem.create(
+        url=url, content="", needs_further_processing=needs_further_processing
+    )
+
+
+def test_topics_are_curated_one_item_at_a_time_in_order(pipeline):
+    """Test that a topic's items are never curated concurrently and keep order."""
+    lock = threading.Lock()
+    running = {}
+    overlaps = []
+    curated = {"topic-a": [], "topic-b": []}
+
+    def curate(topic_id, content, feed_item):
+        with lock:
+            running[topic_id] = running.get(topic_id, 0) + 1
+            overlaps.append(running[topic_id])
+        time.sleep(0.01)
+        with lock:
+            running[topic_id] -= 1
+            curated[topic_id].append(content)
+        return {}
+
+    with patch("curator.topic_updater.process_feed_item", side_effect=curate):
+        pipeline.start_update_processor()
+        for index in range(6):
+            for topic_id in curated:
+                pipeline.add_feed_item_to_queue(
+                    topic_id, _feed_item(f"https://example.com/{index}"), str(index)
+                )
+        pipeline.curation_queue.join()
+
+    assert max(overlaps) == 1
+    assert curated == {topic_id: [str(i) for i in range(6)] for topic_id in curated}
+    assert pipeline.get_pipeline_stats()["active_topics"] == 0
+
+
+def test_items_are_routed_to_their_stage(pipeline):
+    """Test that URLs to resolve go to the fetch stage and content to curation."""
+    with patch("curator.topic_updater.process_feed_url") as process_feed_url:
+        with patch(
+            "curator.topic_updater.process_feed_item",
+            return_value={"refined_article": True},
+        ) as process_feed_item:
+            with patch("curator.topic_updater.get_topic", return_value=None):
+                pipeline.start_update_processor()
+                pipeline.add_feed_item_to_queue(
+                    "topic-a", _feed_item("https://example.com/feed", True), None
+                )
+                pipeline.add_feed_item_to_queue(
+                    "topic-a", _feed_item("https://example.com/page"), "Text"
+                )
+                pipeline.fetch_queue.join()
+                pipeline.curation_queue.join()
+                pipeline.publish_queue.join()
+
+    process_feed_url.assert_called_once_with("topic-a", "https://example.com/feed")
+    assert process_feed_item.call_args.args[:2] == ("topic-a", "Text")
+
+
+def test_async_mode_curates_through_the_dispatcher(pipeline):
+    """Test that async mode hands items to the dispatcher and publishes results."""
+    curated = []
+
+    async def curate(topic_id, content, feed_item):
+        curated.append((topic_id, content))
+        return {"refined_article": content == "1"}
+
+    with patch(
+        "curator.topic_updater.load_curation_settings", return_value=("async", 2)
+    ):
+        with patch("curator.async_dispatcher.aprocess_feed_item", side_effect=curate):
+            with patch("curator.topic_updater.queue_topic_publishing") as publish:
+                pipeline.start_update_processor()
+                for index in range(3):
+                    pipeline.add_feed_item_to_queue(
+                        "topic-a",
+                        _feed_item(f"https://example.com/{index}"),
+                        str(index),
+                    )
+                pipeline.curation_queue.join()
+
+    assert curated == [("topic-a", str(i)) for i in range(3)]
+    # The dispatcher's callback runs on the event loop and must not block
+    publish.assert_called_once_with("topic-a", block=False)
+
+
+def test_full_fetch_queue_resolves_urls_directly():
+    """Test that a fetch worker does not block on its own full queue."""
+    with patch.object(topic_updater.fetch_queue, "maxsize", 1):
+        topic_updater.fetch_queue.put(("topic-a", "https://example.com/queued"))
+        try:
+            with patch("curator.topic_updater.process_feed_url") as process_feed_url:
+                topic_updater.add_feed_item_to_queue(
+                    "topic-a", _feed_item("https://example.com/feed", True), None
+                )
+        finally:
+            topic_updater.fetch_queue.get_nowait()
+            topic_updater.fetch_queue.task_done()
+
+    process_feed_url.assert_called_once_with("topic-a", "https://example.com/feed")
+
+
+def test_full_publish_queue_does_not_block_callers():
+    """Test that a non-blocking publish request waits for room in a thread."""
+    with patch.object(topic_updater.publish_queue, "maxsize", 1):
+        topic_updater.publish_queue.put("topic-a")
+        try:
+            topic_updater.queue_topic_publishing("topic-b", block=False)
+            assert topic_updater.publish_queue.get_nowait() == "topic-a"
+            topic_updater.publish_queue.task_done()
+            assert topic_updater.publish_queue.get(timeout=5) == "topic-b"
+            topic_updater.publish_queue.task_done()
+        finally:
+            topic_updater._pending_publish.clear()
+
+
+def test_publishing_is_queued_once_per_topic():
+    """Test that a topic waiting to be published is not queued again."""
+    topic_updater.queue_topic_publishing("topic-a")
+    topic_updater.queue_topic_publishing("topic-a")
+    try:
+        assert topic_updater.publish_queue.qsize() == 1
+    finally:
+        topic_updater.publish_queue.get_nowait()
+        topic_updater.publish_queue.task_done()
+        topic_updater._pending_publish.clear()
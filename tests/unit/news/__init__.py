@@ -0,0 +1 @@
+"""News unit tests package."""
@@ -0,0 +1,77 @@
+"""Unit tests for converters and publishers following a binary representation."""
+
+import base64
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.models.article import Article
+from api.models.topic import Topic
+from news.converter.openai_tts import OpenAITTS
+from news.converter.podcast_episode_rss_converter import PodcastEpisodeRSSConverter
+from news.publishers.gitlab import GitLabPublisher
+
+MP3 = b"ID3\x04\x00\xff\xfbmp3 frames"
+
+
+@pytest.fixture
+def article():
+    """Create an article whose newest representation is a text summary."""
+    article = Article(
+        id="article-1",
+        title="Article",
+        topic_id="topic-1",
+        content="Full article content.",
+        version=1,
+        created_at=datetime(2024, 1, 1),
+    )
+    article.add_representation("summary", "Short summary.")
+    return article
+
+
+def _convert_to_speech(article):
+    """Run the OpenAI TTS converter with a stubbed audio backend."""
+    segment = MagicMock()
+    segment.__radd__.return_value = segment
+    segment.export.side_effect = lambda buffer, format: buffer.write(MP3)
+    with patch.object(OpenAITTS, "generate_audio", return_value=segment) as generate:
+        assert OpenAITTS.convert_representation("openai-tts", article)
+    return generate
+
+
+def test_tts_then_podcast_uses_text_representation(article, tmp_path):
+    """Test that a podcast episode describes the text, not the TTS audio bytes."""
+    generate = _convert_to_speech(article)
+    assert generate.call_args.args[0] == "Short summary."
+    assert article.representations[-1].content == MP3
+
+    rss_file = tmp_path / "podcast.xml"
+    rss_file.write_text("", encoding="utf-8")
+    topic = Topic(id="topic-1", name="Topic", description="Topic", feed_urls=[])
+    with patch("news.converter.podcast_episode_rss_converter.topic_db") as topic_db:
+        topic_db.get_topic.return_value = topic
+        assert PodcastEpisodeRSSConverter.convert_representation(
+            f"podcast-episode-rss/{rss_file},https://example.com/a.mp3", article
+        )
+
+    rss = article.representations[-1].content
+    assert "Short summary." in rss
+    assert "b'ID3" not in rss
+    assert f'length="{len(MP3)}"' in rss
+
+
+def test_gitlab_publishes_binary_representation_as_base64(article, monkeypatch):
+    """Test that binary content is base64 encoded in the commit request."""
+    monkeypatch.setenv("GITLAB_TOKEN", "token")
+    article.add_representation("openai-tts", MP3, {"format": "mp3", "binary": True})
+
+    with patch("news.publishers.gitlab.requests.post") as post:
+        post.return_value.status_code = 201
+        assert GitLabPublisher.publish_content(
+            "gitlab://gitlab.com/group/project/main/audio.mp3", article
+        )
+
+    action = post.call_args.kwargs["json"]["actions"][0]
+    assert action["encoding"] == "base64"
+    assert base64.b64decode(action["content"]) == MP3
@@ -0,0 +1,104 @@
+"""Unit tests for cache revalidation in feed connectors."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api.db import cache_manager
+from news.feeds.feed_connector import FeedConnector
+from news.feeds.web import fetch_webpage_conditional
+
+URL = "https://example.com/feed.xml"
+
+
+class StubConnector(FeedConnector):
+    """Connector answering from a list of canned responses."""
+
+    cache_expiration = 3600
+    responses = []
+    requests = []
+
+    @staticmethod
+    def can_handle(url):
+        """Handle every URL."""
+        return True
+
+    @classmethod
+    def fetch_content_conditional(cls, url, validators):
+        """Record the validators sent and return the next canned response."""
+        cls.requests.append(dict(validators))
+        response = cls.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """Point the cache at an empty temporary directory."""
+    StubConnector.requests = []
+    with patch("api.db.cache_manager.CACHE_PATH", return_value=tmp_path):
+        cache_manager.clear_cache()
+        yield tmp_path
+        cache_manager.clear_cache()
+
+
+def _expire(url):
+    """Mark a cached entry as expired a minute ago."""
+    cache_manager._cache_metadata[url]["expires_at"] -= 3600 + 60
+
+
+def test_not_modified_extends_cached_entry(cache_dir):
+    """Test that a 304 keeps the cached items and extends their expiry."""
+    items = [{"url": "https://example.com/1", "content": "one"}]
+    StubConnector.responses = [(items, {"etag": '"v1"'}), (None, {"etag": '"v1"'})]
+
+    assert StubConnector.refresh_content(URL) == items
+    _expire(URL)
+    assert cache_manager.get_from_cache(URL) is None
+
+    with patch("news.feeds.feed_connector.add_to_cache") as mock_add:
+        assert StubConnector.refresh_content(URL) == items
+        mock_add.assert_not_called()
+
+    assert StubConnector.requests == [{}, {"etag": '"v1"'}]
+    assert cache_manager.get_from_cache(URL)["items"] == items
+
+
+def test_failed_refresh_serves_stale_entry(cache_dir):
+    """Test that expired items are served while the source is unavailable."""
+    items = [{"url": "https://example.com/1", "content": "one"}]
+    StubConnector.responses = [(items, {}), ConnectionError("down"), ([], {})]
+
+    StubConnector.refresh_content(URL)
+    _expire(URL)
+
+    assert StubConnector.refresh_content(URL) == items
+    assert StubConnector.refresh_content(URL) == items
+    assert cache_manager.get_from_cache(URL) is None
+
+
+def test_fetch_webpage_sends_validators():
+    """Test that web pages are requested conditionally."""
+    not_modified = MagicMock(status_code=304)
+    with patch("news.feeds.web.requests.get", return_value=not_modified) as mock_get:
+        content, validators = fetch_webpage_conditional(
+            "https://example.com", {"etag": '"v1"', "last_modified": "yesterday"}
+        )
+
+    assert content is None
+    assert validators == {"etag": '"v1"', "last_modified": "yesterday"}
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "yesterday"
+
+    page = MagicMock(
+        status_code=200,
+        text="<html><title>Hi</title><body>Text</body></html>",
+        headers={"ETag": '"v2"'},
+    )
+    with patch("news.feeds.web.requests.get", return_value=page):
+        content, validators = fetch_webpage_conditional("https://example.com", {})
+
+    assert content["title"] == "Hi"
+    assert validators == {"etag": '"v2"'}
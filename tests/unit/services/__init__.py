@@ -0,0 +1 @@
+"""Services unit tests package."""
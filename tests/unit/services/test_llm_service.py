@@ -0,0 +1,129 @@
+"""Unit tests for the LLM client registry and provider rate limiter."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from services import llm_service
+
+SETTINGS = {
+    "llm": {
+        "article_generation": {
+            "provider": "openai",
+            "model_name": "gpt-4",
+            "max_tokens": 800,
+        },
+        "article_refinement": {
+            "provider": "openai",
+            "model_name": "gpt-4",
+            "max_tokens": 800,
+        },
+        "relevance_filter": {
+            "provider": "openai",
+            "model_name": "gpt-4o-mini",
+            "max_tokens": 200,
+        },
+        "summary": {"provider": "mistralai", "model_name": "mistral-small"},
+    },
+    "llm_rate_limits": {
+        "openai": {"requests_per_second": 2},
+        "mistralai": {"max_concurrency": 1},
+    },
+    "env_vars": {},
+}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Serve fixed settings and count the clients created."""
+    settings = dict(SETTINGS)
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    llm_service.clear_llm_clients()
+    with patch(
+        "services.llm_service.get_setting",
+        side_effect=lambda key, default=None: settings.get(key, default),
+    ):
+        with patch(
+            "services.llm_service.init_chat_model", side_effect=lambda **kw: kw
+        ) as init_chat_model:
+            yield settings, init_chat_model
+    llm_service.clear_llm_clients()
+
+
+def test_clients_are_shared_per_model(registry):
+    """Test that tasks using the same model share one client and limiter."""
+    _, init_chat_model = registry
+
+    generation = llm_service.get_llm("article_generation")
+    refinement = llm_service.get_llm("article_refinement")
+    relevance = llm_service.get_llm("relevance_filter")
+
+    assert generation is refinement
+    assert relevance is not generation
+    assert init_chat_model.call_count == 2
+    assert generation["rate_limiter"] is relevance["rate_limiter"]
+    assert generation["rate_limiter"] is llm_service.get_rate_limiter("openai")
+    assert generation["rate_limiter"].requests_per_second == 2
+
+
+def test_registry_rebuilds_when_llm_settings_change(registry):
+    """Test that clients are recreated only after relevant settings change."""
+    settings, init_chat_model = registry
+    first = llm_service.get_llm("article_generation")
+
+    settings["db_path"] = "/elsewhere"
+    assert llm_service.get_llm("article_generation") is first
+
+    settings["llm_rate_limits"] = {"openai": {"requests_per_second": 5}}
+    second = llm_service.get_llm("article_generation")
+    assert second is not first
+    assert second["rate_limiter"].requests_per_second == 5
+    assert init_chat_model.call_count == 2
+
+
+def test_rate_limiter_limits_requests():
+    """Test that the request bucket admits one request and refills over time."""
+    limiter = llm_service.ProviderRateLimiter(requests_per_second=1000)
+
+    assert limiter.acquire(blocking=False)
+    assert not limiter.acquire(blocking=False)
+    assert limiter.acquire()
+
+
+def test_rate_limiter_charges_tokens():
+    """Test that token usage beyond the budget holds back further requests."""
+    limiter = llm_service.ProviderRateLimiter(
+        requests_per_second=0, tokens_per_minute=600
+    )
+
+    assert limiter.acquire(blocking=False)
+    limiter.record_tokens(1200)
+    assert not limiter.acquire(blocking=False)
+
+    # 600 tokens per minute refill 10 tokens per second
+    with patch("services.llm_service.time.monotonic", return_value=10**9):
+        assert limiter.acquire(blocking=False)
+
+
+def test_provider_slots_limit_concurrent_requests(registry):
+    """Test that async requests to a provider never exceed its max_concurrency."""
+    in_flight = {"mistralai": 0, "openai": 0}
+    peaks = {"mistralai": 0, "openai": 0}
+
+    async def request(task, provider):
+        async with llm_service.provider_slot(task):
+            in_flight[provider] += 1
+            peaks[provider] = max(peaks[provider], in_flight[provider])
+            await asyncio.sleep(0.01)
+            in_flight[provider] -= 1
+
+    async def main():
+        await asyncio.gather(
+            *(request("summary", "mistralai") for _ in range(3)),
+            *(request("relevance_filter", "openai") for _ in range(3)),
+        )
+
+    asyncio.run(main())
+
+    assert peaks == {"mistralai": 1, "openai": 3}
@@ -0,0 +1,105 @@
+"""Unit tests for the memoized settings service."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from services import settings_service
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point the settings service at a temporary settings.yaml."""
+    path = tmp_path / "settings.yaml"
+    with open(path, "w") as f:
+        yaml.safe_dump({"db_path": "/first", "scheduler": {"enabled": True}}, f)
+
+    monkeypatch.setattr(settings_service, "SETTINGS_FILE", str(path))
+    settings_service.invalidate_settings()
+    yield path
+    settings_service.invalidate_settings()
+
+
+def test_load_settings_parses_once(settings_file):
+    """Test that unchanged settings are served without re-parsing."""
+    with patch(
+        "services.settings_service._read_settings_file",
+        wraps=settings_service._read_settings_file,
+    ) as mock_read:
+        assert settings_service.load_settings()["db_path"] == "/first"
+        assert settings_service.get_setting("db_path") == "/first"
+        assert settings_service.load_settings()["scheduler"] == {"enabled": True}
+
+        assert mock_read.call_count == 1
+
+
+def test_load_settings_reloads_on_mtime_change(settings_file):
+    """Test that external edits are picked up through the mtime check."""
+    assert settings_service.get_setting("db_path") == "/first"
+
+    with open(settings_file, "w") as f:
+        yaml.safe_dump({"db_path": "/second/path"}, f)
+    stat = os.stat(settings_file)
+    os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert settings_service.get_setting("db_path") == "/second/path"
+
+
+def test_load_settings_returns_copy(settings_file):
+    """Test that mutating the returned dict does not corrupt the cache."""
+    settings = settings_service.load_settings()
+    settings["db_path"] = "/mutated"
+
+    assert settings_service.get_setting("db_path") == "/first"
+
+
+def test_save_settings_notifies_subscribers(settings_file):
+    """Test that saving settings invalidates the cache and notifies subscribers."""
+    received = []
+    settings_service.load_settings()
+    settings_service.subscribe(received.append)
+    try:
+        settings = settings_service.load_settings()
+        settings["db_path"] = "/saved"
+        settings_service.save_settings(settings)
+    finally:
+        settings_service.unsubscribe(received.append)
+
+    assert settings_service.get_setting("db_path") == "/saved"
+    assert len(received) == 1
+    assert received[0]["db_path"] == "/saved"
+
+
+def test_failing_subscriber_is_logged(settings_file):
+    """Test that a failing subscriber is logged and does not stop the others."""
+    received = []
+
+    def failing(settings):
+        raise RuntimeError("boom")
+
+    settings_service.subscribe(failing)
+    settings_service.subscribe(received.append)
+    try:
+        with patch("utils.logging.error") as mock_error:
+            settings_service.save_settings({"db_path": "/saved"})
+    finally:
+        settings_service.unsubscribe(failing)
+        settings_service.unsubscribe(received.append)
+
+    assert len(received) == 1
+    mock_error.assert_called_once()
+    assert "boom" in mock_error.call_args.args[2]
+
+
+def test_missing_settings_file(tmp_path, monkeypatch):
+    """Test that a missing settings file yields empty settings."""
+    monkeypatch.setattr(
+        settings_service, "SETTINGS_FILE", str(tmp_path / "missing.yaml")
+    )
+    settings_service.invalidate_settings()
+
+    assert settings_service.load_settings() == {}
+    assert settings_service.get_setting("db_path", "default") == "default"
+    settings_service.invalidate_settings()
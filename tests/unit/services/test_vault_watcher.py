@@ -0,0 +1,161 @@
+"""Unit tests for the vault watcher."""
+
+import shutil
+import time
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from api.db import common, project_db, topic_db, unit_of_work
+from services import vault_watcher
+
+
+def write_metadata(path, data):
+    """Write a metadata.yaml file, creating its directory."""
+    path.mkdir(parents=True, exist_ok=True)
+    with open(path / "metadata.yaml", "w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f)
+
+
+def topic_data(name):
+    """Build the metadata of the test topic."""
+    return {
+        "id": "topic-1",
+        "name": name,
+        "description": "A topic",
+        "feed_urls": [],
+    }
+
+
+@pytest.fixture
+def vault(tmp_path):
+    """Create a vault with one project and one topic and load its caches."""
+    vault_path = tmp_path / "vault"
+    write_metadata(
+        vault_path / "project",
+        {
+            "id": "project-1",
+            "title": "Project",
+            "description": "A project",
+            "topic_ids": ["topic-1"],
+            "created_at": "2023-01-01T12:00:00",
+            "updated_at": None,
+        },
+    )
+    write_metadata(vault_path / "project" / "topic", topic_data("Original"))
+
+    index_paths = (tmp_path / "vault_index.json", tmp_path / "vault_index.journal")
+    common.invalidate_entity_cache()
+    with patch("api.db.common.get_hierarchical_path", return_value=vault_path):
+        with patch("api.db.common.get_entity_index_paths", return_value=index_paths):
+            with patch("api.db.project_db._project_cache", {}), patch(
+                "api.db.project_db._topic_project_index", {}
+            ), patch("api.db.project_db._cache_initialized", True):
+                with patch("api.db.topic_db._topic_cache", {}), patch(
+                    "api.db.topic_db._cache_initialized", True
+                ):
+                    common.initialize_entity_cache()
+                    project_db.reload_project(vault_path / "project")
+                    topic_db.reload_topic(vault_path / "project" / "topic")
+                    yield vault_path
+    common.invalidate_entity_cache()
+
+
+def wait_for(condition, timeout=5.0):
+    """Wait until a condition holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_apply_change_reloads_edited_topic(vault):
+    """Test that an edited topic is reloaded into the cache."""
+    topic_dir = vault / "project" / "topic"
+    write_metadata(topic_dir, topic_data("Edited"))
+
+    vault_watcher.apply_change(vault, topic_dir / "metadata.yaml")
+
+    assert topic_db.get_topic("topic-1").name == "Edited"
+    assert common.find_entity_by_id("topic-1") == (topic_dir, "topic")
+
+
+def test_apply_change_evicts_removed_entities(vault):
+    """Test that removing a project directory drops it and its topics."""
+    shutil.rmtree(vault / "project")
+
+    vault_watcher.apply_change(vault, vault / "project")
+
+    assert "project-1" not in project_db._project_cache
+    assert "topic-1" not in topic_db._topic_cache
+    assert project_db._topic_project_index == {}
+    assert common.get_entities_below(vault) == []
+
+
+@pytest.mark.parametrize("backend", ["inotify", "polling"])
+def test_watcher_picks_up_external_edits(vault, backend):
+    """Test that the running watcher applies external edits within seconds."""
+    if backend == "inotify" and vault_watcher._load_libc() is None:
+        pytest.skip("inotify is not available")
+
+    settings = {"enabled": True, "backend": backend, "poll_interval_seconds": 0.05}
+    with patch("services.vault_watcher.get_setting", return_value=settings):
+        assert vault_watcher.start_vault_watcher()
+    try:
+        # Give the watcher time to set up its watches or first snapshot
+        time.sleep(0.3)
+        write_metadata(vault / "project" / "topic", topic_data("External"))
+
+        assert wait_for(lambda: topic_db._topic_cache["topic-1"].name == "External")
+    finally:
+        vault_watcher.stop_vault_watcher()
+
+
+def test_watcher_ignores_own_saves(vault):
+    """Test that a save does not swap out a topic pending in a write session."""
+    settings = {"enabled": True, "backend": "polling", "poll_interval_seconds": 0.05}
+    with patch("services.vault_watcher.get_setting", return_value=settings):
+        assert vault_watcher.start_vault_watcher()
+    try:
+        time.sleep(0.3)
+        stats = vault_watcher.get_watcher_stats()
+        with patch(
+            "api.db.topic_db.get_hierarchical_path",
+            side_effect=lambda *parts: vault.joinpath(*parts),
+        ):
+            topic = topic_db.get_topic("topic-1")
+            topic_db.save_topic(topic.model_copy(update={"name": "Saved"}))
+            with unit_of_work.write_session():
+                pending = topic.model_copy(update={"name": "Pending"})
+                topic_db.save_topic(pending)
+                assert wait_for(
+                    lambda: vault_watcher.get_watcher_stats()["ignored"]
+                    > stats["ignored"]
+                )
+                assert topic_db.get_topic("topic-1") is pending
+    finally:
+        vault_watcher.stop_vault_watcher()
+
+    assert vault_watcher.get_watcher_stats()["changes"] == stats["changes"]
+
+
+def test_apply_change_keeps_topic_pending_in_session(vault):
+    """Test that a reload leaves a topic with an unwritten save alone."""
+    topic_dir = vault / "project" / "topic"
+    pending = topic_db.get_topic("topic-1").model_copy(update={"name": "Pending"})
+
+    with patch(
+        "api.db.topic_db.get_hierarchical_path",
+        side_effect=lambda *parts: vault.joinpath(*parts),
+    ):
+        with unit_of_work.write_session():
+            topic_db.save_topic(pending)
+            write_metadata(topic_dir, topic_data("External"))
+            vault_watcher.apply_change(vault, topic_dir / "metadata.yaml")
+            assert topic_db.get_topic("topic-1") is pending
+
+    assert not unit_of_work.has_pending("topic", "topic-1")
+    assert topic_db.load_topic_dir(topic_dir).name == "Pending"